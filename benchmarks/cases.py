@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from grpc import Channel
+from httpx import Client
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+
+# Идентификаторы в запросах бенчмарков: заглушки их не проверяют
+BENCHMARK_USER_ID = "7d9f1a3e-2c4b-4e8f-9a1d-3b5c7e9f1a2b"
+BENCHMARK_ACCOUNT_ID = "1c3e5a7b-9d2f-4b6a-8c1e-5f7a9b3d2c4e"
+BENCHMARK_CARD_ID = "9b7d5f3a-1e2c-4a6b-8d9f-2c4e6a8b1d3f"
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    Бенчмарк одного API клиента gateway: типизированный метод клиента вместе с валидацией ответа
+    и хуками метрик Locust — то, что выполняет виртуальный пользователь на каждый запрос.
+
+    :param name: Имя бенчмарка, например: "UsersGatewayHTTPClient.get_user".
+    :param build_client: Создаёт API клиент поверх httpx.Client и gRPC-канала бенчмарка.
+    :param request: Выполняет один запрос клиентом.
+    """
+    name: str
+    build_client: Callable[[Client, Channel], Any]
+    request: Callable[[Any], Any]
+
+
+BENCHMARK_CASES = (
+    BenchmarkCase(
+        name="UsersGatewayHTTPClient.get_user",
+        build_client=lambda http_client, channel: UsersGatewayHTTPClient(client=http_client),
+        request=lambda client: client.get_user(BENCHMARK_USER_ID)
+    ),
+    BenchmarkCase(
+        name="AccountsGatewayHTTPClient.get_accounts",
+        build_client=lambda http_client, channel: AccountsGatewayHTTPClient(client=http_client),
+        request=lambda client: client.get_accounts(BENCHMARK_USER_ID)
+    ),
+    BenchmarkCase(
+        name="CardsGatewayHTTPClient.issue_virtual_card",
+        build_client=lambda http_client, channel: CardsGatewayHTTPClient(client=http_client),
+        request=lambda client: client.issue_virtual_card(BENCHMARK_USER_ID, BENCHMARK_ACCOUNT_ID)
+    ),
+    BenchmarkCase(
+        name="DocumentsGatewayHTTPClient.get_tariff_document",
+        build_client=lambda http_client, channel: DocumentsGatewayHTTPClient(client=http_client),
+        request=lambda client: client.get_tariff_document(BENCHMARK_ACCOUNT_ID)
+    ),
+    BenchmarkCase(
+        name="OperationsGatewayHTTPClient.make_top_up_operation",
+        build_client=lambda http_client, channel: OperationsGatewayHTTPClient(client=http_client),
+        request=lambda client: client.make_top_up_operation(BENCHMARK_CARD_ID, BENCHMARK_ACCOUNT_ID)
+    ),
+    BenchmarkCase(
+        name="UsersGatewayGRPCClient.get_user",
+        build_client=lambda http_client, channel: UsersGatewayGRPCClient(channel=channel),
+        request=lambda client: client.get_user(BENCHMARK_USER_ID)
+    ),
+    BenchmarkCase(
+        name="AccountsGatewayGRPCClient.get_accounts",
+        build_client=lambda http_client, channel: AccountsGatewayGRPCClient(channel=channel),
+        request=lambda client: client.get_accounts(BENCHMARK_USER_ID)
+    ),
+    BenchmarkCase(
+        name="CardsGatewayGRPCClient.issue_virtual_card",
+        build_client=lambda http_client, channel: CardsGatewayGRPCClient(channel=channel),
+        request=lambda client: client.issue_virtual_card(BENCHMARK_USER_ID, BENCHMARK_ACCOUNT_ID)
+    ),
+    BenchmarkCase(
+        name="DocumentsGatewayGRPCClient.get_tariff_document",
+        build_client=lambda http_client, channel: DocumentsGatewayGRPCClient(channel=channel),
+        request=lambda client: client.get_tariff_document(BENCHMARK_ACCOUNT_ID)
+    ),
+    BenchmarkCase(
+        name="OperationsGatewayGRPCClient.make_top_up_operation",
+        build_client=lambda http_client, channel: OperationsGatewayGRPCClient(channel=channel),
+        request=lambda client: client.make_top_up_operation(BENCHMARK_CARD_ID, BENCHMARK_ACCOUNT_ID)
+    ),
+)
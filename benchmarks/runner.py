@@ -0,0 +1,281 @@
+import argparse
+import gc
+import json
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from locust import events
+from locust.env import Environment
+
+from benchmarks.cases import BENCHMARK_CASES, BenchmarkCase
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client, gateway_locust_grpc_channel_pool
+from clients.http.gateway.client import build_gateway_locust_http_client
+
+# Запросы на прогрев перед замерами: соединения, кэши схем pydantic, буфер метрик
+BENCHMARK_WARMUP = 200
+
+# Запросы в одном раунде замера CPU и количество раундов (в результат идёт медиана)
+BENCHMARK_REQUESTS = 2000
+BENCHMARK_ROUNDS = 5
+
+# Запросы в замере памяти: под tracemalloc каждый запрос в разы медленнее
+BENCHMARK_MEMORY_REQUESTS = 200
+
+# Допустимое ухудшение относительно базовой линии (доля), больше — регрессия
+BENCHMARK_TOLERANCE = 0.15
+
+# Базовая линия по умолчанию
+BENCHMARK_BASELINE = Path(__file__).parent / "baselines" / "clients.json"
+
+# Сколько секунд ждать запуска заглушек
+BENCHMARK_STUBS_TIMEOUT = 30
+
+
+def get_free_port() -> int:
+    """
+    Возвращает свободный локальный порт.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float) -> None:
+    """
+    Ждёт, пока на локальном порту начнут принимать соединения.
+
+    :raises TimeoutError: Если порт не открылся за `timeout` секунд.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+
+    raise TimeoutError(f"Port {port} is not listening after {timeout}s")
+
+
+def start_stubs(http_port: int, grpc_port: int) -> subprocess.Popen:
+    """
+    Запускает заглушки http-gateway и grpc-gateway без задержек и ошибок (см. mocks).
+
+    Заглушки работают в отдельном процессе: так их CPU и память не попадают в замеры клиентов.
+    """
+    process = subprocess.Popen([
+        sys.executable, "-m", "mocks",
+        "--host", "127.0.0.1",
+        "--http-port", str(http_port),
+        "--grpc-port", str(grpc_port),
+    ])
+    try:
+        wait_for_port(http_port, BENCHMARK_STUBS_TIMEOUT)
+        wait_for_port(grpc_port, BENCHMARK_STUBS_TIMEOUT)
+    except TimeoutError:
+        process.kill()
+        raise
+
+    return process
+
+
+def measure_cpu(request, requests: int, rounds: int) -> dict:
+    """
+    Замеряет процессорное время процесса на запрос (`time.process_time`: ожидание ответа не считается).
+
+    :param request: Функция, выполняющая один запрос.
+    :param requests: Запросов в раунде.
+    :param rounds: Количество раундов.
+    :return: Запросов на секунду CPU и CPU на запрос (мкс): медиана, минимум и максимум по раундам.
+    """
+    cpu_per_request = []
+    for _ in range(rounds):
+        started = time.process_time()
+        for _ in range(requests):
+            request()
+        cpu_per_request.append((time.process_time() - started) / requests)
+
+    median = statistics.median(cpu_per_request)
+    return {
+        "requests_per_cpu_second": 1 / median if median else 0.0,
+        "cpu_us_per_request": median * 1_000_000,
+        "cpu_us_per_request_min": min(cpu_per_request) * 1_000_000,
+        "cpu_us_per_request_max": max(cpu_per_request) * 1_000_000,
+    }
+
+
+def measure_memory(request, requests: int) -> dict:
+    """
+    Замеряет память запроса через tracemalloc.
+
+    :param request: Функция, выполняющая один запрос.
+    :param requests: Количество запросов.
+    :return: peak_bytes_per_request — медиана пика памяти, временно выделенной во время запроса
+             (редкие всплески вроде сброса буфера метрик на неё не влияют); retained_bytes_per_request — сколько
+             памяти на запрос осталось занятой после сборки мусора (рост — утечка или неограниченный кэш).
+    """
+    tracemalloc.start()
+    try:
+        request()
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        peaks = []
+        for _ in range(requests):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            request()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "peak_bytes_per_request": int(statistics.median(peaks)),
+        "retained_bytes_per_request": max(current - baseline, 0) / requests,
+    }
+
+
+def run_benchmark(case: BenchmarkCase, client, requests: int, rounds: int) -> dict:
+    """
+    Выполняет бенчмарк одного клиента: прогрев, замер CPU и замер памяти.
+    """
+    def request():
+        case.request(client)
+
+    for _ in range(BENCHMARK_WARMUP):
+        request()
+
+    return {
+        **measure_cpu(request, requests, rounds),
+        **measure_memory(request, BENCHMARK_MEMORY_REQUESTS),
+    }
+
+
+def run_benchmarks(cases: list[BenchmarkCase], requests: int, rounds: int) -> dict:
+    """
+    Запускает заглушки и выполняет бенчмарки клиентов.
+
+    Клиенты создаются так же, как в нагрузочных сценариях: httpx.Client с хуками Locust
+    и gRPC-канал с LocustInterceptor, метрики пишутся в статистику окружения Locust.
+
+    :return: Результаты с описанием машины (базовые линии разных машин сравнивать нельзя).
+    """
+    http_port, grpc_port = get_free_port(), get_free_port()
+    stubs = start_stubs(http_port, grpc_port)
+
+    environment = Environment(events=events)
+    http_client = build_gateway_locust_http_client(environment, base_url=f"http://127.0.0.1:{http_port}")
+    channel = build_gateway_locust_grpc_client(environment, target=f"127.0.0.1:{grpc_port}")
+
+    results = {}
+    try:
+        for case in cases:
+            results[case.name] = run_benchmark(case, case.build_client(http_client, channel), requests, rounds)
+            print(
+                f"{case.name}: {results[case.name]['requests_per_cpu_second']:.0f} req/CPU-s, "
+                f"{results[case.name]['peak_bytes_per_request']} B peak/req"
+            )
+    finally:
+        http_client.close()
+        gateway_locust_grpc_channel_pool.close()
+        stubs.kill()
+        stubs.wait()
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "requests": requests,
+        "rounds": rounds,
+        "benchmarks": results,
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Сравнивает результаты с базовой линией.
+
+    Регрессией считается рост CPU на запрос или пиковой памяти на запрос больше чем на `tolerance`.
+
+    :return: Описания регрессий (пустой список, если их нет).
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        expected = baseline["benchmarks"].get(name)
+        if expected is None:
+            continue
+
+        for metric in ("cpu_us_per_request", "peak_bytes_per_request"):
+            if expected[metric] and result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.1f} > baseline {expected[metric]:.1f} (+{tolerance:.0%})"
+                )
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Бенчмарки накладных расходов клиентов gateway против локальных заглушек:
+
+        python -m benchmarks.runner                      # сравнить с базовой линией
+        python -m benchmarks.runner --save               # записать новую базовую линию
+        python -m benchmarks.runner --filter GRPC --rounds 3
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки накладных расходов клиентов gateway")
+    parser.add_argument("--filter", type=str, default="", help="Только бенчмарки, в имени которых есть строка")
+    parser.add_argument("--requests", type=int, default=BENCHMARK_REQUESTS, help="Запросов в раунде замера CPU")
+    parser.add_argument("--rounds", type=int, default=BENCHMARK_ROUNDS, help="Раундов замера CPU")
+    parser.add_argument("--baseline", type=str, default=str(BENCHMARK_BASELINE), help="JSON базовой линии")
+    parser.add_argument("--save", action="store_true", help="Записать результаты как базовую линию")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="Допустимое ухудшение (доля)")
+    parser.add_argument("--output", type=str, default=None, help="Записать результаты в JSON-файл")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    if not args.save and not baseline_path.exists():
+        # Без базовой линии сравнивать не с чем: такой запуск не должен считаться успешным (например, в CI)
+        sys.exit(f"Baseline {baseline_path} not found, no comparison was made: record it with --save")
+
+    cases = [case for case in BENCHMARK_CASES if args.filter in case.name]
+    results = run_benchmarks(cases, requests=args.requests, rounds=args.rounds)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.save:
+        if baseline_path.exists():
+            # Сохраняем результаты бенчмарков, которые не запускались (например, из-за --filter)
+            baseline = json.loads(baseline_path.read_text())
+            results["benchmarks"] = {**baseline["benchmarks"], **results["benchmarks"]}
+
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline["machine"] != results["machine"]:
+        # CPU на запрос зависит от машины: сравнение с чужой базовой линией дало бы ложные регрессии
+        print(f"Baseline was recorded on another machine, skipping comparison: {baseline['machine']}")
+        return
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
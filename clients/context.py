@@ -0,0 +1,26 @@
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class ScenarioContext:
+    """
+    Базовый класс состояния (shared state) виртуального пользователя в нагрузочном сценарии.
+
+    Вместо того чтобы хранить в TaskSet целые ответы (pydantic-модели или protobuf-сообщения), сценарий объявляет
+    наследника с нужными полями — как правило, только идентификаторами:
+
+        @dataclass(slots=True)
+        class GetAccountsContext(ScenarioContext):
+            user_id: str = ""
+
+    Благодаря `__slots__` у экземпляров нет `__dict__`: хранятся только объявленные поля,
+    а присвоение необъявленного поля сразу падает с AttributeError.
+    """
+
+    def clear(self) -> None:
+        """
+        Сбрасывает все поля состояния к значениям по умолчанию.
+        """
+        default = type(self)()
+        for field in fields(self):
+            setattr(self, field.name, getattr(default, field.name))
@@ -0,0 +1,18 @@
+from grpc import aio
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на основе grpc.aio.
+
+    В отличие от GRPCClient, не требует gevent: все вызовы выполняются в event loop asyncio,
+    поэтому один процесс может держать очень большое число одновременных вызовов.
+    """
+    def __init__(self, channel: aio.Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал (grpc.aio.Channel).
+                        Создаётся внутри работающего event loop и переиспользуется.
+        """
+        self.channel = channel
@@ -0,0 +1,157 @@
+from typing import TYPE_CHECKING
+
+from grpc import aio
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (build_gateway_async_grpc_client,
+                                               build_gateway_locust_async_grpc_client)
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import (GetAccountsRequest,
+                                                                      GetAccountsResponse)
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (OpenCreditCardAccountRequest,
+                                                                                  OpenCreditCardAccountResponse)
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (OpenDebitCardAccountRequest,
+                                                                                 OpenDebitCardAccountResponse)
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (OpenSavingsAccountRequest,
+                                                                              OpenSavingsAccountResponse)
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (OpenDepositAccountRequest,
+                                                                              OpenDepositAccountResponse)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для работы со счетами.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        return await self.stub.GetAccounts(request)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя на открытие депозитного счета.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя на открытие дебевой карты и счёта.
+        :return: Ответ с информацией о карте и счёте.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(self,
+                                           request: OpenCreditCardAccountRequest
+                                           ) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя на открытие кредитной карты и счёта.
+        :return: Ответ с информацией о карте и счёте.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def open_saving_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос на открытие сберегательного счёта.
+        :return: Ответ с информацией о счёте.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        request = GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_saving_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_saving_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос на получение счетов
+        :return: Ответ от сервиса с данными счетов.
+        """
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+
+def build_accounts_gateway_async_grpc_client() -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+    Вызывается внутри работающего event loop.
+
+    :return: Инициализированный асинхронный клиент.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_accounts_gateway_locust_async_grpc_client(environment: "Environment") -> AsyncAccountsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncAccountsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_gateway_locust_async_grpc_client(environment))
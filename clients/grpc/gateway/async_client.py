@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING
+
+from grpc import aio
+
+from clients.grpc.interceptors.async_locust_interceptor import AsyncLocustInterceptor
+from clients.grpc.wire_size import AsyncWireSizeChannel
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, поэтому в рантайме его не импортируем
+    from locust.env import Environment
+
+# Адрес сервиса grpc-gateway (модуль не импортирует clients.grpc.gateway.client, чтобы не тянуть gevent)
+GATEWAY_GRPC_TARGET = "localhost:9003"
+
+
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Вызывается внутри работающего event loop. Один канал мультиплексирует все вызовы по HTTP/2,
+    поэтому его стоит создавать один раз и передавать во все асинхронные клиенты.
+
+    :return: Асинхронный gRPC-канал, настроенный на адрес localhost:9003.
+    """
+    return aio.insecure_channel(GATEWAY_GRPC_TARGET)
+
+
+def build_gateway_locust_async_grpc_client(environment: "Environment") -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала, адаптированного для Locust.
+    В канал встраивается интерцептор AsyncLocustInterceptor, который регистрирует вызовы
+    в метриках Locust так же, как синхронный LocustInterceptor (см. clients.metrics.report_request).
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Асинхронный gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
+    """
+    locust_interceptor = AsyncLocustInterceptor(environment=environment)
+
+    channel = aio.insecure_channel(GATEWAY_GRPC_TARGET, interceptors=[locust_interceptor])
+
+    # Каналом-обёрткой сохраняем размер ответов на проводе для метрик
+    return AsyncWireSizeChannel(channel, locust_interceptor.response_sizes)
@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING
+
+from grpc import aio
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (build_gateway_async_grpc_client,
+                                               build_gateway_locust_async_grpc_client)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (IssuePhysicalCardRequest,
+                                                                          IssuePhysicalCardResponse)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (IssueVirtualCardRequest,
+                                                                         IssueVirtualCardResponse)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с CardsGatewayService.
+    Предоставляет высокоуровневые методы для создания карт.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос на открытие новой виртуальной карты
+        :return: Ответ от сервиса с данными созданной виртуальной карты.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос на открытие новой физической карты.
+        :return: Ответ от сервиса с данными созданной физической карты.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Создание новой виртуальной карты для пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ с информацией о карте.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Создание новой физической карты для пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ с информацией о карте.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+    Вызывается внутри работающего event loop.
+
+    :return: Инициализированный асинхронный клиент.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_locust_async_grpc_client(environment: "Environment") -> AsyncCardsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncCardsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_locust_async_grpc_client(environment))
@@ -1,7 +1,25 @@
+from weakref import WeakKeyDictionary
+
 from grpc import Channel, insecure_channel, intercept_channel
+from locust import events
 from locust.env import Environment
 
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import ChannelOptions, GRPCChannelPool
+from clients.grpc.wire_size import WireSizeChannel
+
+# Адрес сервиса grpc-gateway
+GATEWAY_GRPC_TARGET = "localhost:9003"
+
+# Количество мультиплексируемых каналов к grpc-gateway на один воркер Locust по умолчанию
+# (в нагрузочных тестах задаётся опцией `--grpc-channel-pool-size`)
+GATEWAY_GRPC_CHANNEL_POOL_SIZE = 4
+
+# Пул каналов, общий для всех gRPC API клиентов в нагрузочных тестах
+gateway_locust_grpc_channel_pool = GRPCChannelPool(size=GATEWAY_GRPC_CHANNEL_POOL_SIZE)
+
+# Интерцепторы Locust, по одному на окружение и режим работы (блокирующий/неблокирующий)
+_locust_interceptors: WeakKeyDictionary[Environment, dict[bool, LocustInterceptor]] = WeakKeyDictionary()
 
 
 def build_gateway_grpc_client() -> Channel:
@@ -10,23 +28,66 @@ def build_gateway_grpc_client() -> Channel:
 
     :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
     """
-    return insecure_channel("localhost:9003")
+    return insecure_channel(GATEWAY_GRPC_TARGET)
 
 
-def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
+def build_gateway_locust_grpc_client(environment: Environment,
+                                     options: ChannelOptions = (),
+                                     non_blocking: bool = False,
+                                     target: str = GATEWAY_GRPC_TARGET) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Сам канал берётся из пула `gateway_locust_grpc_channel_pool`: вместо нового соединения на каждый
+    вызов билдера клиенты по кругу распределяются между несколькими общими каналами воркера.
+    Каналы пула закрываются по событию Locust `test_stop`.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param options: Опции gRPC-канала; каналы с разными опциями образуют разные группы пула.
+    :param non_blocking: Использовать неблокирующий режим интерцептора (метрики из done-callback),
+                         чтобы вызовы через `.future()` выполнялись параллельно.
+    :param target: Адрес grpc-gateway (например, заглушки в бенчмарках клиентов).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
-    # Создаём экземпляр интерцептора, передаём в него окружение Locust
-    locust_interceptor = LocustInterceptor(environment=environment)
+    # Один интерцептор на окружение Locust и режим; закрытие пула регистрируем при первом обращении
+    interceptors = _locust_interceptors.get(environment)
+    if interceptors is None:
+        interceptors = _locust_interceptors[environment] = {}
+        environment.events.test_stop.add_listener(lambda **kwargs: gateway_locust_grpc_channel_pool.close())
+
+    locust_interceptor = interceptors.get(non_blocking)
+    if locust_interceptor is None:
+        locust_interceptor = interceptors[non_blocking] = LocustInterceptor(environment, non_blocking=non_blocking)
+
+    # Берём очередной канал из пула
+    channel = gateway_locust_grpc_channel_pool.get_channel(target, options=options)
 
-    # Создаём обычный канал
-    channel = insecure_channel("localhost:9003")
+    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него,
+    # а поверх — каналом, запоминающим размер ответов на проводе для метрик
+    return WireSizeChannel(intercept_channel(channel, locust_interceptor), locust_interceptor.response_sizes)
 
-    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
+
+@events.init_command_line_parser.add_listener
+def add_grpc_channel_pool_arguments(parser) -> None:
+    """
+    Добавляет опцию размера пула gRPC-каналов в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--grpc-channel-pool-size",
+        type=int,
+        env_var="LOCUST_GRPC_CHANNEL_POOL_SIZE",
+        default=GATEWAY_GRPC_CHANNEL_POOL_SIZE,
+        help="Количество мультиплексируемых gRPC-каналов к grpc-gateway на один воркер"
+    )
+
+
+@events.init.add_listener
+def configure_grpc_channel_pool(environment: Environment, **kwargs) -> None:
+    """
+    Задаёт размер пула `gateway_locust_grpc_channel_pool` из опции `--grpc-channel-pool-size`
+    (каналы создаются при первом обращении к пулу, поэтому размер применяется ко всем каналам теста).
+    """
+    size = getattr(environment.parsed_options, "grpc_channel_pool_size", None) or GATEWAY_GRPC_CHANNEL_POOL_SIZE
+    gateway_locust_grpc_channel_pool.size = max(size, 1)
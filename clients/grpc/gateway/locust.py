@@ -1,3 +1,5 @@
+import random
+
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения gRPC API клиентов
@@ -12,16 +14,40 @@ from clients.grpc.gateway.operations.client import (
     build_operations_gateway_locust_grpc_client
 )
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.context import ScenarioContext
+from clients.metrics import start_user_metrics
+from tools.load_shapes import ArrivalRateTaskSetMixin
+from tools.saturation import saturation_monitor
+from tools.seeding import seed_user
+# Подключают гистограммы задержек и экспортёр Prometheus к метрикам запросов (см. tools.histograms, tools.prometheus)
+import tools.histograms  # noqa: F401
+import tools.prometheus  # noqa: F401
+# Подключает режим профилирования генератора `--sampling-profile` (см. tools.profiling)
+import tools.profiling  # noqa: F401
 
 
-class GatewayGRPCTaskSet(TaskSet):
+class GatewayGRPCTaskSet(ArrivalRateTaskSetMixin, TaskSet):
     """
     Базовый TaskSet для gRPC-сценариев, работающих с grpc-gateway.
 
     Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
     Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+
+    Клиенты не открывают собственных соединений: их каналы по кругу берутся из общего пула
+    `gateway_locust_grpc_channel_pool` (размер пула задаётся опцией `--grpc-channel-pool-size`).
+
+    Состояние сценария хранится в `self.context` — экземпляре `context_class` (см. ScenarioContext).
+    В открытой модели нагрузки слот расписания занимает итерация сценария (см. ArrivalRateTaskSetMixin).
     """
 
+    # Класс состояния сценария: сценарии объявляют наследника ScenarioContext только с нужными полями
+    context_class: type[ScenarioContext] = ScenarioContext
+    context: ScenarioContext
+
+    # Генератор выбора задач виртуального пользователя (см. tools.seeding.seed_user): при запуске с `--seed`
+    # последовательность задач и фейковых данных пользователя воспроизводится от запуска к запуску
+    task_random: random.Random
+
     # Аннотации полей с клиентами (появятся в self после on_start)
     users_gateway_client: UsersGatewayGRPCClient
     cards_gateway_client: CardsGatewayGRPCClient
@@ -33,21 +59,40 @@ class GatewayGRPCTaskSet(TaskSet):
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+        Также включается телеметрия загрузки самого генератора (см. tools.saturation).
         """
+        self.task_random = seed_user(self.user.environment)
+        start_user_metrics()
+        saturation_monitor.start(self.user.environment)
+        self.context = self.context_class()
+
         self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
         self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
 
+    def get_next_task(self):
+        if not self.tasks:
+            return super().get_next_task()
 
-class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
+        return self.task_random.choice(self.tasks)
+
+
+class GatewayGRPCSequentialTaskSet(ArrivalRateTaskSetMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для gRPC-сценариев, где важен порядок выполнения задач.
 
     Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
     Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
     """
+    context_class: type[ScenarioContext] = ScenarioContext
+    context: ScenarioContext
+
+    # Генератор выбора задач виртуального пользователя (см. tools.seeding.seed_user): при запуске с `--seed`
+    # последовательность задач и фейковых данных пользователя воспроизводится от запуска к запуску
+    task_random: random.Random
+
     users_gateway_client: UsersGatewayGRPCClient
     cards_gateway_client: CardsGatewayGRPCClient
     accounts_gateway_client: AccountsGatewayGRPCClient
@@ -58,6 +103,11 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
+        self.task_random = seed_user(self.user.environment)
+        start_user_metrics()
+        saturation_monitor.start(self.user.environment)
+        self.context = self.context_class()
+
         self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
         self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
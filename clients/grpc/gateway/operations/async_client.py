@@ -0,0 +1,252 @@
+from typing import TYPE_CHECKING
+
+from grpc import aio
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (build_gateway_async_grpc_client,
+                                               build_gateway_locust_async_grpc_client)
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import (GetOperationRequest,
+                                                                         GetOperationResponse)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import (GetOperationsRequest,
+                                                                          GetOperationsResponse)
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (GetOperationReceiptRequest,
+                                                                                 GetOperationReceiptResponse)
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (GetOperationsSummaryRequest,
+                                                                                  GetOperationsSummaryResponse)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (MakeFeeOperationRequest,
+                                                                              MakeFeeOperationResponse)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (MakeTopUpOperationRequest,
+                                                                                 MakeTopUpOperationResponse)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (MakeCashbackOperationRequest,
+                                                                                   MakeCashbackOperationResponse)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (MakeTransferOperationRequest,
+                                                                                   MakeTransferOperationResponse)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (MakePurchaseOperationRequest,
+                                                                                   MakePurchaseOperationResponse)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (MakeBillPaymentOperationRequest,
+                                                                                       MakeBillPaymentOperationResponse)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ с информацией об операции.
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными чека по операции.
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с операциями по счёту.
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param query: query запрос
+        :return: Ответ от сервиса с общими данными по операциям по счёту
+        """
+        return await self.stub.GetOperationsSummary(query)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: данные для создания операции комиссии
+        :returns: Ответ от сервиса с данными по операции коммиссии
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: данные для создания операции пополнения
+        :returns: Ответ от сервиса с данными по операции пополнения
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: данные для создания операции кэшбэка
+        :returns: Ответ от сервиса с данными по операции кэшбэка
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: данные для создания операции перевода
+        :returns: Ответ от сервиса с данными по операции перевода
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: данные для создания операции покупки
+        :returns: Ответ от сервиса с данными по операции покупки
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(self,
+                                              request: MakeBillPaymentOperationRequest
+                                              ) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: данные для создания операции оплаты по счёту
+        :returns: Ответ от сервиса с данными по операции оплаты по счёту
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self,
+                                                 request: MakeCashWithdrawalOperationRequest
+                                                 ) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: данные для создания операции снятия наличных денег
+        :returns: Ответ от сервиса с данными по операции снятия наличных денег
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        request = MakeFeeOperationRequest(card_id=card_id,
+                                          account_id=account_id,
+                                          status=fake.proto_enum(OperationStatus),
+                                          amount=fake.amount())
+        return await self.make_fee_operation_api(request=request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        request = MakeTopUpOperationRequest(card_id=card_id,
+                                            account_id=account_id,
+                                            status=fake.proto_enum(OperationStatus),
+                                            amount=fake.amount())
+        return await self.make_top_up_operation_api(request=request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        request = MakeCashbackOperationRequest(card_id=card_id,
+                                               account_id=account_id,
+                                               status=fake.proto_enum(OperationStatus),
+                                               amount=fake.amount())
+        return await self.make_cashback_operation_api(request=request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        request = MakeTransferOperationRequest(card_id=card_id,
+                                               account_id=account_id,
+                                               status=fake.proto_enum(OperationStatus),
+                                               amount=fake.amount())
+        return await self.make_transfer_operation_api(request=request)
+
+    async def make_purchase_operation(self,
+                                      card_id: str,
+                                      account_id: str,
+                                      category: str) -> MakePurchaseOperationResponse:
+        request = MakePurchaseOperationRequest(card_id=card_id,
+                                               account_id=account_id,
+                                               status=fake.proto_enum(OperationStatus),
+                                               amount=fake.amount(),
+                                               category=fake.category())
+        return await self.make_purchase_operation_api(request=request)
+
+    async def make_bill_payment_operation(self,
+                                          card_id: str,
+                                          account_id: str) -> MakeBillPaymentOperationResponse:
+        request = MakeBillPaymentOperationRequest(card_id=card_id,
+                                                  account_id=account_id,
+                                                  status=fake.proto_enum(OperationStatus),
+                                                  amount=fake.amount())
+        return await self.make_bill_payment_operation_api(request=request)
+
+    async def make_cash_withdrawal_operation(self,
+                                             card_id: str,
+                                             account_id: str) -> MakeCashWithdrawalOperationResponse:
+        request = MakeCashWithdrawalOperationRequest(card_id=card_id,
+                                                     account_id=account_id,
+                                                     status=fake.proto_enum(OperationStatus),
+                                                     amount=fake.amount())
+        return await self.make_cash_withdrawal_operation_api(request=request)
+
+
+def build_operations_gateway_async_grpc_client() -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+    Вызывается внутри работающего event loop.
+
+    :return: Инициализированный асинхронный клиент.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_operations_gateway_locust_async_grpc_client(environment: "Environment") -> AsyncOperationsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncOperationsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_locust_async_grpc_client(environment))
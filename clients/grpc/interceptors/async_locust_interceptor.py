@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError, UnaryUnaryClientInterceptor
+
+from clients.grpc.wire_size import ResponseSizes
+
+if TYPE_CHECKING:
+    # Импорт locust выполняет gevent monkey-patching, поэтому в рантайме его не импортируем
+    from locust.env import Environment
+
+
+class AsyncLocustInterceptor(UnaryUnaryClientInterceptor):
+    """
+    Асинхронный gRPC-интерцептор (grpc.aio) для сбора метрик Locust.
+
+    Аналог LocustInterceptor: измеряет время выполнения вызовов, размер ответа и регистрирует
+    успехи/ошибки через буфер `clients.metrics` (см. `report_request`) с теми же полями и статусом,
+    а также учитывает вызовы "в полёте" в телеметрии генератора (см. tools.saturation).
+    """
+
+    def __init__(self, environment: "Environment"):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+        self.response_sizes = ResponseSizes()
+
+    @staticmethod
+    def get_status_code(exception: BaseException | None) -> int:
+        """
+        Возвращает числовой код статуса gRPC вызова (0 — OK).
+
+        :param exception: Ошибка вызова, если она произошла.
+        """
+        if exception is None:
+            return StatusCode.OK.value[0]
+        if isinstance(exception, AioRpcError):
+            return exception.code().value[0]
+        if isinstance(exception, asyncio.CancelledError):
+            return StatusCode.CANCELLED.value[0]
+
+        return StatusCode.UNKNOWN.value[0]
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :param continuation: Корутина, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC call объект.
+        """
+        # Модули метрик импортируют locust, поэтому загружаются при первом вызове, когда окружение Locust уже есть
+        from clients.metrics import report_request
+        from tools.saturation import saturation_monitor
+
+        call = None
+        exception: BaseException | None = None
+        start_time = time.perf_counter()  # Засекаем время начала запроса
+        response_length = 0
+        saturation_monitor.request_started("gRPC")  # Запрос "в полёте" для телеметрии генератора
+
+        try:
+            call = await continuation(client_call_details, request)
+
+            # Дожидаемся ответа; event loop при этом свободен для других вызовов
+            response = await call
+
+            # Размер ответа на проводе, если канал его сохранил, иначе размер сообщения
+            response_length = self.response_sizes.pop(response)
+            if response_length is None:
+                response_length = response.ByteSize()
+        except AioRpcError as error:
+            # Ошибку RPC получит вызывающий код из call, здесь она нужна только для метрик
+            exception = error
+        except BaseException as error:
+            # Остальные ошибки (в том числе отмена задачи asyncio) тоже попадают в метрики и пробрасываются дальше
+            exception = error
+            raise
+        finally:
+            saturation_monitor.request_finished("gRPC")
+
+            method = client_call_details.method
+            if isinstance(method, bytes):
+                method = method.decode()
+
+            report_request(
+                self.environment,
+                request_type="gRPC",
+                name=method,
+                response_time=(time.perf_counter() - start_time) * 1000,
+                response_length=response_length,
+                exception=exception,
+                status=self.get_status_code(exception),
+                response=call,
+            )
+
+        return call
@@ -1,20 +1,100 @@
 import time
+from concurrent.futures import CancelledError
+from contextvars import copy_context
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import Future, RpcError, StatusCode, UnaryUnaryClientInterceptor
 from locust.env import Environment
 
+from clients.grpc.wire_size import ResponseSizes
+from clients.metrics import report_request
+from tools.saturation import saturation_monitor
+
 
 class LocustInterceptor(UnaryUnaryClientInterceptor):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Работает в одном из двух режимов:
+    - блокирующий (по умолчанию): интерцептор дожидается результата вызова и сразу отправляет метрики;
+    - неблокирующий (`non_blocking=True`): интерцептор вешает done-callback на future вызова
+      и отправляет метрики из него. Вызовы через `.future()` при этом не блокируются
+      и могут выполняться параллельно, а время ответа остаётся корректным.
+
+    В обоих режимах метрики пишутся через буфер `clients.metrics` (см. `report_request`).
+
+    Размер ответа берётся из `response_sizes` — размера ответа на проводе, который сохраняет
+    канал `WireSizeChannel`. Если канал не обёрнут, используется `ByteSize()`.
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: Environment, non_blocking: bool = False):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param non_blocking: Отправлять метрики из done-callback, не дожидаясь результата вызова.
         """
         self.environment = environment
+        self.non_blocking = non_blocking
+        self.response_sizes = ResponseSizes()
+
+    def get_response_length(self, response) -> int:
+        """
+        Определяет размер ответа в байтах.
+
+        :param response: Десериализованное сообщение ответа.
+        :return: Размер ответа на проводе, либо `ByteSize()`, если он неизвестен.
+        """
+        response_length = self.response_sizes.pop(response)
+        if response_length is None:
+            response_length = response.ByteSize()
+
+        return response_length
+
+    @staticmethod
+    def get_status_code(exception: RpcError | CancelledError | None) -> int:
+        """
+        Возвращает числовой код статуса gRPC вызова (0 — OK).
+
+        :param exception: Ошибка вызова, если она произошла.
+        """
+        if exception is None:
+            return StatusCode.OK.value[0]
+        if isinstance(exception, CancelledError):
+            return StatusCode.CANCELLED.value[0]
+
+        code = exception.code() if hasattr(exception, "code") else StatusCode.UNKNOWN
+        return code.value[0] if isinstance(code, StatusCode) else StatusCode.UNKNOWN.value[0]
+
+    def fire_request_event(
+            self,
+            method: str,
+            response,
+            exception: RpcError | CancelledError | None,
+            start_time: float
+    ) -> None:
+        """
+        Регистрирует вызов в системе метрик Locust.
+
+        :param method: Полное имя метода, например: "/users.UsersService/CreateUser".
+        :param response: gRPC response (future объект).
+        :param exception: Ошибка вызова, если она произошла.
+        :param start_time: Время начала вызова по `time.perf_counter()`.
+        """
+        response_length = 0
+        if exception is None:
+            response_length = self.get_response_length(response.result())
+
+        response_time = (time.perf_counter() - start_time) * 1000  # Время выполнения в миллисекундах
+
+        report_request(
+            self.environment,
+            request_type="gRPC",
+            name=method,
+            response_time=response_time,
+            response_length=response_length,
+            exception=exception,
+            status=self.get_status_code(exception),
+            response=response,
+        )
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,31 +105,63 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
+        start_time = time.perf_counter()  # Засекаем время начала запроса
+        saturation_monitor.request_started("gRPC")  # Запрос "в полёте" для телеметрии генератора
+
+        if self.non_blocking:
+            return self.intercept_unary_unary_non_blocking(continuation, client_call_details, request, start_time)
+
         response = None
         exception: RpcError | None = None
-        start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
 
         try:
-            # Выполняем gRPC вызов и получаем response future
+            # Выполняем gRPC вызов и дожидаемся результата
             response = continuation(client_call_details, request)
-
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
+            response.result()
         except RpcError as error:
             # В случае ошибки сохраняем исключение для метрик
             exception = error
+        finally:
+            # Любое другое исключение (в том числе GreenletExit при остановке теста) тоже завершает запрос
+            saturation_monitor.request_finished("gRPC")
 
-        # Регистрируем вызов в системе метрик Locust
-        self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
-            exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
-        )
+        self.fire_request_event(client_call_details.method, response, exception, start_time)
 
         # Возвращаем результат вызова (future-объект)
         return response
+
+    def intercept_unary_unary_non_blocking(self, continuation, client_call_details, request, start_time: float):
+        """
+        Неблокирующий вариант перехвата: метрики отправляются из done-callback future вызова.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :param start_time: Время начала вызова по `time.perf_counter()`.
+        :return: gRPC response (future объект), возможно ещё не завершённый.
+        """
+
+        # Done-callback выполняется вне гринлета пользователя: сэмпл пишется с его номером и опозданием итерации
+        context = copy_context()
+
+        def on_done(future: Future) -> None:
+            saturation_monitor.request_finished("gRPC")
+
+            # У отменённого вызова future.exception() выбрасывает CancelledError: регистрируем отмену как ошибку
+            if future.cancelled():
+                exception = CancelledError(f"{client_call_details.method} was cancelled")
+            else:
+                exception = future.exception()
+
+            context.run(self.fire_request_event, client_call_details.method, future, exception, start_time)
+
+        try:
+            response = continuation(client_call_details, request)
+        except BaseException:
+            # Вызов не начался, и done-callback не будет: запрос больше не "в полёте"
+            saturation_monitor.request_finished("gRPC")
+            raise
+
+        response.add_done_callback(on_done)
+
+        return response
@@ -0,0 +1,59 @@
+from itertools import count
+from typing import Sequence
+
+from grpc import Channel, insecure_channel
+
+# Тип набора опций gRPC-канала, например: (("grpc.keepalive_time_ms", 10000),)
+ChannelOptions = Sequence[tuple[str, int | str]]
+
+
+class GRPCChannelPool:
+    """
+    Пул мультиплексируемых gRPC-каналов, сгруппированных по адресу сервера и опциям канала.
+
+    Для каждой пары (target, options) пул держит небольшое фиксированное количество каналов
+    и выдаёт их по кругу (round-robin). HTTP/2 позволяет выполнять множество вызовов
+    параллельно по одному соединению, поэтому нескольких каналов на воркер достаточно
+    для тысяч виртуальных пользователей.
+    """
+
+    def __init__(self, size: int = 4):
+        """
+        :param size: Количество каналов на каждую пару (target, options).
+        """
+        self.size = size
+        self._channels: dict[tuple[str, tuple], list[Channel]] = {}
+        self._counters: dict[tuple[str, tuple], count] = {}
+
+    def get_channel(self, target: str, options: ChannelOptions = ()) -> Channel:
+        """
+        Возвращает очередной канал пула для указанного адреса и опций.
+
+        :param target: Адрес gRPC-сервера, например: "localhost:9003".
+        :param options: Опции создаваемых каналов.
+        :return: Один из каналов пула (по кругу).
+        """
+        key = (target, tuple(options))
+
+        channels = self._channels.get(key)
+        if channels is None:
+            # Каждый канал пула получает собственный пул подканалов, иначе gRPC
+            # объединит их в одно общее соединение с сервером
+            channel_options = [*options, ("grpc.use_local_subchannel_pool", 1)]
+            channels = self._channels[key] = [
+                insecure_channel(target, options=channel_options) for _ in range(self.size)
+            ]
+            self._counters[key] = count()
+
+        return channels[next(self._counters[key]) % len(channels)]
+
+    def close(self) -> None:
+        """
+        Закрывает все каналы пула.
+        """
+        for channels in self._channels.values():
+            for channel in channels:
+                channel.close()
+
+        self._channels.clear()
+        self._counters.clear()
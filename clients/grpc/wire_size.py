@@ -0,0 +1,156 @@
+from typing import Any, Callable
+
+from grpc import Channel, aio
+
+# Сколько размеров ответов хранится одновременно: размеры, которые интерцептор так и не забрал
+# (например, вызов завершился ошибкой после десериализации), вытесняются начиная с самых старых
+RESPONSE_SIZES_LIMIT = 10_000
+
+
+class ResponseSizes:
+    """
+    Хранилище размеров ответов gRPC "на проводе" (в байтах до десериализации).
+
+    Размер сохраняется по id десериализованного сообщения в момент десериализации и забирается
+    интерцептором по завершении вызова. Так размер ответа известен без повторной сериализации
+    сообщения через `ByteSize()`.
+
+    Сообщения protobuf не поддерживают ни хеширование, ни слабые ссылки, поэтому вместе с размером
+    хранится само сообщение: пока запись не забрана, его id не может достаться другому сообщению.
+    Незабранные записи не копятся бесконечно — см. RESPONSE_SIZES_LIMIT.
+    """
+
+    def __init__(self):
+        self._sizes: dict[int, tuple[Any, int]] = {}
+
+    def wrap(self, deserializer: Callable[[bytes], Any] | None) -> Callable[[bytes], Any] | None:
+        """
+        Оборачивает десериализатор ответа так, чтобы он запоминал размер исходных байт.
+
+        :param deserializer: Исходный десериализатор, например: GetUserResponse.FromString.
+        :return: Десериализатор, сохраняющий размер каждого ответа.
+        """
+        if deserializer is None:
+            return None
+
+        def inner(data: bytes) -> Any:
+            message = deserializer(data)
+            if len(self._sizes) >= RESPONSE_SIZES_LIMIT:
+                del self._sizes[next(iter(self._sizes))]
+
+            self._sizes[id(message)] = (message, len(data))
+            return message
+
+        return inner
+
+    def pop(self, message: Any) -> int | None:
+        """
+        Возвращает и удаляет размер ответа, если он был сохранён при десериализации.
+
+        :param message: Десериализованное сообщение ответа.
+        :return: Размер ответа в байтах или None, если размер неизвестен.
+        """
+        entry = self._sizes.pop(id(message), None)
+        return None if entry is None else entry[1]
+
+
+class WireSizeChannel(Channel):
+    """
+    Обёртка над gRPC-каналом, которая подменяет десериализаторы ответов unary-unary методов
+    на запоминающие размер ответа в `ResponseSizes`.
+
+    Все остальные вызовы прозрачно делегируются исходному каналу. Исходный канал обычно берётся
+    из общего пула (см. GRPCChannelPool), поэтому обёртка его не закрывает: временем жизни каналов
+    управляет пул.
+    """
+
+    def __init__(self, channel: Channel, response_sizes: ResponseSizes):
+        """
+        :param channel: Исходный gRPC-канал (обычно уже обёрнутый интерцептором).
+        :param response_sizes: Хранилище, в которое записываются размеры ответов.
+        """
+        self._channel = channel
+        self._response_sizes = response_sizes
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channel.unsubscribe(callback)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=self._response_sizes.wrap(response_deserializer),
+            **kwargs
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.unary_stream(method, request_serializer, response_deserializer, **kwargs)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.stream_unary(method, request_serializer, response_deserializer, **kwargs)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.stream_stream(method, request_serializer, response_deserializer, **kwargs)
+
+    def close(self):
+        # Канал общий для многих клиентов: его закрывает пул, а не отдельная обёртка
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncWireSizeChannel(aio.Channel):
+    """
+    Асинхронный (grpc.aio) аналог `WireSizeChannel`.
+    """
+
+    def __init__(self, channel: aio.Channel, response_sizes: ResponseSizes):
+        """
+        :param channel: Исходный асинхронный gRPC-канал.
+        :param response_sizes: Хранилище, в которое записываются размеры ответов.
+        """
+        self._channel = channel
+        self._response_sizes = response_sizes
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self, grace=None):
+        await self._channel.close(grace)
+
+    def get_state(self, try_to_connect=False):
+        return self._channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await self._channel.channel_ready()
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=self._response_sizes.wrap(response_deserializer),
+            **kwargs
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.unary_stream(method, request_serializer, response_deserializer, **kwargs)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.stream_unary(method, request_serializer, response_deserializer, **kwargs)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return self._channel.stream_stream(method, request_serializer, response_deserializer, **kwargs)
@@ -1,5 +1,8 @@
 from typing import Any, TypedDict
-from httpx import URL, Client, QueryParams, Response
+from httpx import URL, AsyncClient, Client, QueryParams, Response
+
+from clients.http.payload import JSON_CONTENT_HEADERS
+from clients.http.validation import Model, ValidationMode, validate_content
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -10,10 +13,22 @@ class HTTPClient:
     """Базовый HTTP API клиент, принимающий объект httpx.Client
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param validation_mode: глубина валидации ответов в типизированных методах (см. ValidationMode)
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, validation_mode: ValidationMode = ValidationMode.FULL):
         self._client = client
+        self.validation_mode = validation_mode
+
+    def validate_response(self, model: type[Model], response: Response) -> Model:
+        """
+        Превращает тело ответа в модель, валидируя байты `response.content` напрямую.
+
+        :param model: Класс pydantic-модели ответа.
+        :param response: Объект Response с данными ответа.
+        :return: Модель ответа с учётом `validation_mode` клиента.
+        """
+        return validate_content(model, response.content, self.validation_mode)
 
     def get(self,
             url: URL | str,
@@ -27,18 +42,86 @@ class HTTPClient:
         :param extensions: Дополнительные данные передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self._client.get(url=url, params=params)
+        return self._client.get(url=url, params=params, extensions=extensions)
 
     def post(self,
              url: URL | str,
              json: Any | None = None,
+             content: bytes | None = None,
              extensions: HTTPClientExtensions | None = None) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате json.
+        :param content: Готовое JSON-тело запроса в байтах (например, из PayloadTemplate).
+        :param extensions: Дополнительные данные передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        if content is not None:
+            return self._client.post(url=url, content=content, headers=JSON_CONTENT_HEADERS, extensions=extensions)
+
+        return self._client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient
+
+    Асинхронный аналог HTTPClient: один процесс с event loop может держать тысячи
+    одновременных запросов "в полёте", что удобно для длительных (soak) тестов.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param validation_mode: глубина валидации ответов в типизированных методах (см. ValidationMode)
+    """
+
+    def __init__(self, client: AsyncClient, validation_mode: ValidationMode = ValidationMode.FULL):
+        self._client = client
+        self.validation_mode = validation_mode
+
+    def validate_response(self, model: type[Model], response: Response) -> Model:
+        """
+        Превращает тело ответа в модель, валидируя байты `response.content` напрямую.
+
+        :param model: Класс pydantic-модели ответа.
+        :param response: Объект Response с данными ответа.
+        :return: Модель ответа с учётом `validation_mode` клиента.
+        """
+        return validate_content(model, response.content, self.validation_mode)
+
+    async def get(self,
+                  url: URL | str,
+                  params: QueryParams | None = None,
+                  extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self._client.get(url=url, params=params, extensions=extensions)
+
+    async def post(self,
+                   url: URL | str,
+                   json: Any | None = None,
+                   content: bytes | None = None,
+                   extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате json.
+        :param content: Готовое JSON-тело запроса в байтах (например, из PayloadTemplate).
         :param extensions: Дополнительные данные передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self._client.post(url=url, json=json)
+        if content is not None:
+            return await self._client.post(
+                url=url,
+                content=content,
+                headers=JSON_CONTENT_HEADERS,
+                extensions=extensions
+            )
+
+        return await self._client.post(url=url, json=json, extensions=extensions)
@@ -3,58 +3,152 @@ import time
 from httpx import Request, Response, HTTPStatusError, HTTPError
 from locust.env import Environment
 
+from clients.metrics import report_request
+from clients.http.event_hooks.stream import AsyncMeteredByteStream, MeteredByteStream
+from clients.http.event_hooks.trace import AsyncRequestTrace, RequestTrace
+from tools.saturation import saturation_monitor
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
+    Сохраняет монотонное время в наносекундах в `request.extensions["start_time"]`,
     чтобы потом использовать его для расчёта времени ответа.
+    Подключает `RequestTrace` в `request.extensions["trace"]` для разбивки времени ответа по фазам.
+    Учитывает запрос в телеметрии генератора как запрос "в полёте" (см. tools.saturation).
+    """
+    request.extensions.setdefault("trace", RequestTrace())
+    request.extensions["start_time"] = time.perf_counter_ns()
+    request.extensions["in_flight"] = saturation_monitor.track_request(request, "HTTP")
+
+
+async def locust_async_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант `locust_request_event_hook` для httpx.AsyncClient.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions.setdefault("trace", AsyncRequestTrace())
+    request.extensions["start_time"] = time.perf_counter_ns()
+    request.extensions["in_flight"] = saturation_monitor.track_request(request, "HTTP")
 
 
-def locust_response_event_hook(environment: Environment):
+def fire_locust_request_event(environment: Environment,
+                              response: Response,
+                              response_length: int,
+                              exception: HTTPError | None = None) -> None:
     """
-    Возвращает HTTPX event hook, вызываемый после получения ответа.
+    Регистрирует метрики HTTP-ответа в Locust (см. `clients.metrics.report_request`).
 
     Использует `request.extensions["start_time"]` для вычисления времени отклика.
     Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Разбивку времени по фазам из `request.extensions["trace"]` передаёт в Locust как context
+    (при пакетной записи — в колонки фаз буфера, см. MetricsBatch.phases),
+    а время ожидания соединения из пула — в телеметрию генератора.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response: Объект ответа, тело которого уже прочитано (или отброшено).
+    :param response_length: Размер тела ответа в байтах.
+    :param exception: Ошибка чтения тела ответа, если она произошла.
+    """
+    if exception is None:
+        try:
+            # Проверка на статус ошибки (например, 500, 404 и т.д.)
+            response.raise_for_status()
+        except HTTPStatusError as error:
+            exception = error
+
+    request = response.request
+
+    # Получаем route, если он был передан через extensions, иначе используем raw path
+    route = request.extensions.get("route", request.url.path)
+    # Время начала запроса (монотонные часы, нс), установленное в request event hook
+    start_time = request.extensions.get("start_time")
+    # Вычисляем длительность запроса в миллисекундах
+    response_time = 0 if start_time is None else (time.perf_counter_ns() - start_time) / 1_000_000
+    # Длительности фаз запроса (connect, tls, request_write, ttfb, body_read) в миллисекундах
+    trace = request.extensions.get("trace")
+    context = trace.get_phases() if isinstance(trace, RequestTrace) else {}
+
+    # Телеметрия генератора: запрос больше не "в полёте", сколько он ждал соединения из пула
+    in_flight = request.extensions.get("in_flight")
+    if in_flight is not None:
+        in_flight()
+    if start_time is not None and isinstance(trace, RequestTrace):
+        pool_wait = trace.get_pool_wait(start_time)
+        if pool_wait is not None:
+            saturation_monitor.record_pool_wait(pool_wait)
+
+    # Регистрируем запрос в метриках Locust (через буфер или событием request)
+    report_request(
+        environment,
+        request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+        name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+        response_time=response_time,  # Время выполнения запроса в мс
+        response_length=response_length,  # Размер тела ответа
+        exception=exception,  # Исключение, если оно произошло
+        status=response.status_code,  # HTTP-код ответа для сырых сэмплов
+        response=response,  # Объект ответа (опционально)
+        context=context,  # Разбивка времени ответа по фазам
+    )
+
+
+def get_content_length(response: Response) -> int | None:
+    """
+    Возвращает размер тела ответа из заголовка `Content-Length`, если он корректно задан.
+
+    :param response: Объект ответа.
+    :return: Размер тела ответа в байтах или None.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+
+    return None
+
+
+def locust_response_event_hook(environment: Environment, discard_body: bool = False):
+    """
+    Возвращает HTTPX event hook, вызываемый после получения заголовков ответа.
+
+    Хук не читает тело ответа сам: он оборачивает поток тела в `MeteredByteStream`, который считает байты
+    по мере чтения, и отправляет метрики в `environment.events.request`, когда тело прочитано до конца
+    (см. `fire_locust_request_event`). Поэтому время ответа включает чтение тела, а тело не буферизуется
+    лишний раз. Размер ответа берётся из `Content-Length`, а если заголовка нет — из подсчитанных байт.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param discard_body: Отбрасывать тело ответа без сохранения в памяти (для сценариев на чистую
+                         пропускную способность, где ответ не разбирается).
     :return: Функция-хук для HTTPX response event hook.
     """
 
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+        content_length = get_content_length(response)
 
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
+        def on_close(length: int, exception: HTTPError | None) -> None:
+            response_length = length if content_length is None else content_length
+            fire_locust_request_event(environment, response, response_length, exception)
+
+        response.stream = MeteredByteStream(response.stream, on_close, discard_body=discard_body)
+
+    return inner
+
+
+def locust_async_response_event_hook(environment: Environment, discard_body: bool = False):
+    """
+    Асинхронный вариант `locust_response_event_hook` для httpx.AsyncClient.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param discard_body: Отбрасывать тело ответа без сохранения в памяти.
+    :return: Асинхронная функция-хук для HTTPX response event hook.
+    """
+
+    async def inner(response: Response) -> None:
+        content_length = get_content_length(response)
+
+        def on_close(length: int, exception: HTTPError | None) -> None:
+            response_length = length if content_length is None else content_length
+            fire_locust_request_event(environment, response, response_length, exception)
 
-        request = response.request
-
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+        response.stream = AsyncMeteredByteStream(response.stream, on_close, discard_body=discard_body)
 
     return inner
@@ -0,0 +1,76 @@
+from typing import AsyncIterator, Callable, Iterator
+
+from httpx import AsyncByteStream, HTTPError, SyncByteStream
+
+# Функция, вызываемая при закрытии потока: (количество прочитанных байт, ошибка чтения или None)
+OnStreamClose = Callable[[int, HTTPError | None], None]
+
+
+class MeteredByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа httpx, которая считает прочитанные байты на лету.
+
+    Тело ответа не копируется и не читается повторно: байты лишь подсчитываются по мере того,
+    как httpx читает поток. При `discard_body=True` прочитанные чанки отбрасываются,
+    и тело ответа не накапливается в памяти (`response.content` будет пустым).
+
+    При закрытии потока (тело прочитано до конца или ответ закрыт) вызывается `on_close`.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: OnStreamClose, discard_body: bool = False):
+        """
+        :param stream: Исходный поток тела ответа.
+        :param on_close: Функция, вызываемая один раз при закрытии потока.
+        :param discard_body: Отбрасывать тело ответа, только подсчитывая его размер.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.discard_body = discard_body
+        self.length = 0
+        self.exception: HTTPError | None = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self.stream:
+                self.length += len(chunk)
+                if not self.discard_body:
+                    yield chunk
+        except HTTPError as error:
+            self.exception = error
+            raise
+
+    def close(self) -> None:
+        self.stream.close()
+        self.on_close(self.length, self.exception)
+
+
+class AsyncMeteredByteStream(AsyncByteStream):
+    """
+    Асинхронный вариант `MeteredByteStream` для httpx.AsyncClient.
+    """
+
+    def __init__(self, stream: AsyncByteStream, on_close: OnStreamClose, discard_body: bool = False):
+        """
+        :param stream: Исходный асинхронный поток тела ответа.
+        :param on_close: Функция, вызываемая один раз при закрытии потока.
+        :param discard_body: Отбрасывать тело ответа, только подсчитывая его размер.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.discard_body = discard_body
+        self.length = 0
+        self.exception: HTTPError | None = None
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.stream:
+                self.length += len(chunk)
+                if not self.discard_body:
+                    yield chunk
+        except HTTPError as error:
+            self.exception = error
+            raise
+
+    async def aclose(self) -> None:
+        await self.stream.aclose()
+        self.on_close(self.length, self.exception)
@@ -0,0 +1,75 @@
+import time
+from typing import Any
+
+# Фазы запроса: (имя фазы, событие начала, событие окончания).
+# Имена событий httpcore указаны без префикса протокола ("http11." / "http2." / "connection.")
+REQUEST_PHASES = (
+    ("connect", "connect_tcp.started", "connect_tcp.complete"),
+    ("tls", "start_tls.started", "start_tls.complete"),
+    ("request_write", "send_request_headers.started", "send_request_body.complete"),
+    ("ttfb", "send_request_body.complete", "receive_response_headers.complete"),
+    ("body_read", "receive_response_body.started", "receive_response_body.complete"),
+)
+
+
+# События, которыми транспорт начинает работу с соединением, выданным пулом
+POOL_WAIT_END_EVENTS = ("connect_tcp.started", "send_request_headers.started")
+
+
+class RequestTrace:
+    """
+    Callback для httpcore trace extension (`request.extensions["trace"]`).
+
+    Запоминает монотонное время (`time.perf_counter_ns()`) каждого события транспорта,
+    чтобы затем разложить время ответа по фазам: соединение, TLS, отправка запроса,
+    ожидание первого байта (TTFB) и чтение тела ответа.
+    """
+
+    __slots__ = ("marks",)
+
+    def __init__(self):
+        self.marks: dict[str, int] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        self.marks[event_name.split(".", 1)[1]] = time.perf_counter_ns()
+
+    def get_phases(self) -> dict[str, float]:
+        """
+        Возвращает длительность каждой фазы запроса в миллисекундах.
+
+        Фазы, которых не было (например, соединение взято из пула keep-alive и TCP/TLS не выполнялись),
+        в результат не попадают.
+
+        :return: Словарь вида {"connect": 0.41, "ttfb": 12.3, ...}.
+        """
+        phases: dict[str, float] = {}
+        for phase, started, completed in REQUEST_PHASES:
+            if started in self.marks and completed in self.marks:
+                phases[phase] = (self.marks[completed] - self.marks[started]) / 1_000_000
+
+        return phases
+
+    def get_pool_wait(self, start_time: int) -> float | None:
+        """
+        Возвращает время ожидания соединения из пула httpx в миллисекундах: от request event hook
+        до первого события транспорта (открытие нового соединения или отправка заголовков по keep-alive).
+
+        :param start_time: Время начала запроса по `time.perf_counter_ns()`.
+        :return: Время ожидания или None, если транспорт не успел начать запрос (например, ошибка до отправки).
+        """
+        marks = [self.marks[event] for event in POOL_WAIT_END_EVENTS if event in self.marks]
+        if not marks:
+            return None
+
+        return max(min(marks) - start_time, 0) / 1_000_000
+
+
+class AsyncRequestTrace(RequestTrace):
+    """
+    Асинхронный вариант `RequestTrace` для httpx.AsyncClient: httpcore требует корутину.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        self.marks[event_name.split(".", 1)[1]] = time.perf_counter_ns()
@@ -0,0 +1,129 @@
+from httpx import Response, QueryParams
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_async_http_client, build_gateway_locust_async_http_client
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OPEN_CREDIT_CARD_ACCOUNT_PAYLOAD,
+    OPEN_DEBIT_CARD_ACCOUNT_PAYLOAD,
+    OPEN_DEPOSIT_ACCOUNT_PAYLOAD,
+    OPEN_SAVINGS_ACCOUNT_PAYLOAD
+)
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get("/api/v1/accounts",
+                              params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route="/api/v1/accounts"))
+
+    async def open_deposit_account_api(self, json: OpenDepositAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post("/api/v1/accounts/open-deposit-account",
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/accounts/open-deposit-account"))
+
+    async def open_savings_account_api(self, json: OpenSavingsAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-savings-account",
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/accounts/open-savings-account"))
+
+    async def open_debit_card_account_api(self, json: OpenDebitCardAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-debit-card-account",
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/accounts/open-debit-card-account"))
+
+    async def open_credit_card_account_api(self, json: OpenCreditCardAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-credit-card-account",
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/accounts/open-credit-card-account"))
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.validate_response(GetAccountsResponseSchema, response)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OPEN_DEPOSIT_ACCOUNT_PAYLOAD.render(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.validate_response(OpenDepositAccountResponseSchema, response)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OPEN_SAVINGS_ACCOUNT_PAYLOAD.render(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.validate_response(OpenSavingsAccountResponseSchema, response)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OPEN_DEBIT_CARD_ACCOUNT_PAYLOAD.render(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.validate_response(OpenDebitCardAccountResponseSchema, response)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OPEN_CREDIT_CARD_ACCOUNT_PAYLOAD.render(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.validate_response(OpenCreditCardAccountResponseSchema, response)
+
+
+def build_accounts_gateway_async_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_locust_async_http_client(environment: Environment) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncAccountsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_locust_async_http_client(environment))
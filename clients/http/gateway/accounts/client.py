@@ -2,7 +2,8 @@ from httpx import Response, QueryParams
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_http_client, get_gateway_locust_http_client
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -13,7 +14,11 @@ from clients.http.gateway.accounts.schema import (
     OpenDepositAccountRequestSchema,
     OpenDepositAccountResponseSchema,
     OpenSavingsAccountRequestSchema,
-    OpenSavingsAccountResponseSchema
+    OpenSavingsAccountResponseSchema,
+    OPEN_CREDIT_CARD_ACCOUNT_PAYLOAD,
+    OPEN_DEBIT_CARD_ACCOUNT_PAYLOAD,
+    OPEN_DEPOSIT_ACCOUNT_PAYLOAD,
+    OPEN_SAVINGS_ACCOUNT_PAYLOAD
 )
 
 
@@ -33,66 +38,74 @@ class AccountsGatewayHTTPClient(HTTPClient):
                         params=QueryParams(**query.model_dump(by_alias=True)),
                         extensions=HTTPClientExtensions(route="/api/v1/accounts"))
 
-    def open_deposit_account_api(self, json: OpenDepositAccountRequestSchema) -> Response:
+    def open_deposit_account_api(self, json: OpenDepositAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия депозитного счёта.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response с результатом операции.
         """
-        return self.post("/api/v1/accounts/open-deposit-account", json=json.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-deposit-account",
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/accounts/open-deposit-account"))
 
-    def open_savings_account_api(self, json: OpenSavingsAccountRequestSchema) -> Response:
+    def open_savings_account_api(self, json: OpenSavingsAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия сберегательного счёта.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-savings-account", json=json.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-savings-account",
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/accounts/open-savings-account"))
 
-    def open_debit_card_account_api(self, json: OpenDebitCardAccountRequestSchema) -> Response:
+    def open_debit_card_account_api(self, json: OpenDebitCardAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия дебетовой карты.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-debit-card-account", json=json.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-debit-card-account",
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/accounts/open-debit-card-account"))
 
-    def open_credit_card_account_api(self, json: OpenCreditCardAccountRequestSchema) -> Response:
+    def open_credit_card_account_api(self, json: OpenCreditCardAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия кредитной карты.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-credit-card-account", json=json.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-credit-card-account",
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/accounts/open-credit-card-account"))
 
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetAccountsResponseSchema, response)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
-        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        request = OPEN_DEPOSIT_ACCOUNT_PAYLOAD.render(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenDepositAccountResponseSchema, response)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
-        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        request = OPEN_SAVINGS_ACCOUNT_PAYLOAD.render(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenSavingsAccountResponseSchema, response)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
-        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        request = OPEN_DEBIT_CARD_ACCOUNT_PAYLOAD.render(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenDebitCardAccountResponseSchema, response)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
-        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        request = OPEN_CREDIT_CARD_ACCOUNT_PAYLOAD.render(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenCreditCardAccountResponseSchema, response)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -112,8 +125,9 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Использует общий для воркера httpx.Client и его пул соединений (см. `get_gateway_locust_http_client`).
 
     :param environment: объект окружения Locust.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(client=get_gateway_locust_http_client(environment))
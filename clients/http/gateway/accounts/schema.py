@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from enum import StrEnum
 
 from clients.http.gateway.cards.schema import CardSchema
+from clients.http.payload import PayloadTemplate
 
 
 class AccountType(StrEnum):
@@ -108,3 +109,10 @@ class OpenCreditCardAccountResponseSchema(BaseModel):
     Структура данных ответа открытия счёта кредитной карты.
     """
     account: AccountSchema
+
+
+# Предкомпилированные шаблоны тел запросов для типизированных методов API клиентов (см. PayloadTemplate)
+OPEN_DEPOSIT_ACCOUNT_PAYLOAD = PayloadTemplate(OpenDepositAccountRequestSchema)
+OPEN_SAVINGS_ACCOUNT_PAYLOAD = PayloadTemplate(OpenSavingsAccountRequestSchema)
+OPEN_DEBIT_CARD_ACCOUNT_PAYLOAD = PayloadTemplate(OpenDebitCardAccountRequestSchema)
+OPEN_CREDIT_CARD_ACCOUNT_PAYLOAD = PayloadTemplate(OpenCreditCardAccountRequestSchema)
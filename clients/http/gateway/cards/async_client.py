@@ -0,0 +1,71 @@
+from httpx import Response
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
+from clients.http.gateway.cards.schema import (IssuePhysicalCardRequestSchema,
+                                               IssuePhysicalCardResponseSchema,
+                                               IssueVirtualCardRequestSchema,
+                                               IssueVirtualCardResponseSchema,
+                                               ISSUE_PHYSICAL_CARD_PAYLOAD,
+                                               ISSUE_VIRTUAL_CARD_PAYLOAD)
+from clients.http.gateway.client import build_gateway_async_http_client, build_gateway_locust_async_http_client
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, json: IssueVirtualCardRequestSchema | bytes) -> Response:
+        """
+        Создать виртуальную карту для пользователя по его userId и accountId.
+
+        :param json: json содержащий userId и accountId
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/cards/issue-virtual-card',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/cards/issue-virtual-card"))
+
+    async def issue_physical_card_api(self, json: IssuePhysicalCardRequestSchema | bytes) -> Response:
+        """
+        Создать физическую карту для пользователя по его userId и accountId.
+
+        :param json: json содержащий userId и accountId
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/cards/issue-physical-card',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/cards/issue-physical-card"))
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = ISSUE_VIRTUAL_CARD_PAYLOAD.render(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.validate_response(IssueVirtualCardResponseSchema, response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = ISSUE_PHYSICAL_CARD_PAYLOAD.render(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.validate_response(IssuePhysicalCardResponseSchema, response)
+
+
+def build_cards_gateway_async_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_locust_async_http_client(environment: Environment) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncCardsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_locust_async_http_client(environment))
@@ -1,11 +1,14 @@
 from clients.http.gateway.cards.schema import (IssuePhysicalCardRequestSchema,
                                                IssuePhysicalCardResponseSchema,
                                                IssueVirtualCardRequestSchema,
-                                               IssueVirtualCardResponseSchema)
+                                               IssueVirtualCardResponseSchema,
+                                               ISSUE_PHYSICAL_CARD_PAYLOAD,
+                                               ISSUE_VIRTUAL_CARD_PAYLOAD)
 from httpx import Response
 from locust.env import Environment
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_http_client, get_gateway_locust_http_client
 
 
 class CardsGatewayHTTPClient(HTTPClient):
@@ -13,33 +16,37 @@ class CardsGatewayHTTPClient(HTTPClient):
     Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
     """
 
-    def issue_virtual_card_api(self, json: IssueVirtualCardRequestSchema) -> Response:
+    def issue_virtual_card_api(self, json: IssueVirtualCardRequestSchema | bytes) -> Response:
         """
         Создать виртуальную карту для пользователя по его userId и accountId.
 
         :param json: json содержащий userId и accountId
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post(url='/api/v1/cards/issue-virtual-card', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/cards/issue-virtual-card',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/cards/issue-virtual-card"))
 
-    def issue_physical_card_api(self, json: IssuePhysicalCardRequestSchema) -> Response:
+    def issue_physical_card_api(self, json: IssuePhysicalCardRequestSchema | bytes) -> Response:
         """
         Создать физическую карту для пользователя по его userId и accountId.
 
         :param json: json содержащий userId и accountId
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post(url='/api/v1/cards/issue-physical-card', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/cards/issue-physical-card',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/cards/issue-physical-card"))
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
-        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        request = ISSUE_VIRTUAL_CARD_PAYLOAD.render(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(IssueVirtualCardResponseSchema, response)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
-        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        request = ISSUE_PHYSICAL_CARD_PAYLOAD.render(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(IssuePhysicalCardResponseSchema, response)
 
 
 def build_cards_http_gateway_client() -> CardsGatewayHTTPClient:
@@ -59,8 +66,9 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Использует общий для воркера httpx.Client и его пул соединений (см. `get_gateway_locust_http_client`).
 
     :param environment: объект окружения Locust.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(client=get_gateway_locust_http_client(environment))
@@ -1,6 +1,8 @@
 from enum import StrEnum
 from pydantic import BaseModel, ConfigDict, Field
 
+from clients.http.payload import PayloadTemplate
+
 
 class CardType(StrEnum):
     VIRTUAL = "VIRTUAL"
@@ -66,3 +68,8 @@ class IssuePhysicalCardRequestSchema(BaseModel):
 
     user_id: str = Field(serialization_alias="userId")
     account_id: str = Field(serialization_alias="accountId")
+
+
+# Предкомпилированные шаблоны тел запросов для типизированных методов API клиентов (см. PayloadTemplate)
+ISSUE_VIRTUAL_CARD_PAYLOAD = PayloadTemplate(IssueVirtualCardRequestSchema)
+ISSUE_PHYSICAL_CARD_PAYLOAD = PayloadTemplate(IssuePhysicalCardRequestSchema)
@@ -1,12 +1,35 @@
 import logging
+from typing import Hashable
+from weakref import WeakSet
 
-from httpx import Client
+from httpx import AsyncClient, Client, Limits
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
+    locust_async_request_event_hook,
+    locust_async_response_event_hook,
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.pool import HTTPClientPool
+
+# Адрес сервиса http-gateway
+GATEWAY_HTTP_URL = "http://localhost:8003"
+
+# Лимиты пула соединений по умолчанию для нагрузочных клиентов.
+# Один httpx.Client обслуживает всех пользователей воркера, поэтому пул должен вмещать
+# столько соединений, сколько запросов одновременно находится "в полёте".
+GATEWAY_HTTP_CLIENT_LIMITS = Limits(
+    max_connections=1000,
+    max_keepalive_connections=1000,
+    keepalive_expiry=60
+)
+
+# Реестр общих httpx.Client, используемых API клиентами в нагрузочных тестах
+gateway_locust_http_client_pool = HTTPClientPool()
+
+# Окружения Locust, для которых уже зарегистрировано закрытие клиентов по завершении теста
+_bound_environments: WeakSet[Environment] = WeakSet()
 
 
 def build_gateway_http_client() -> Client:
@@ -15,10 +38,13 @@ def build_gateway_http_client() -> Client:
 
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url=GATEWAY_HTTP_URL)
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_client(environment: Environment,
+                                     limits: Limits = GATEWAY_HTTP_CLIENT_LIMITS,
+                                     discard_body: bool = False,
+                                     base_url: str = GATEWAY_HTTP_URL) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -30,7 +56,14 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Функция всегда создаёт новый httpx.Client с собственным пулом соединений.
+    Для переиспользования одного клиента несколькими API клиентами используйте
+    `get_gateway_locust_http_client`.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param limits: Лимиты пула соединений и keep-alive.
+    :param discard_body: Отбрасывать тела ответов, только подсчитывая их размер (чистая пропускная способность).
+    :param base_url: Адрес http-gateway (например, заглушки в бенчмарках клиентов).
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
@@ -39,9 +72,94 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
 
     return Client(
         timeout=100,
-        base_url="http://localhost:8003",
+        limits=limits,
+        base_url=base_url,
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
+            # Собираем метрики и передаём их в Locust
+            "response": [locust_response_event_hook(environment, discard_body=discard_body)]
+        }
+    )
+
+
+def get_gateway_locust_http_client(environment: Environment,
+                                   key: Hashable | None = None,
+                                   limits: Limits = GATEWAY_HTTP_CLIENT_LIMITS,
+                                   discard_body: bool = False) -> Client:
+    """
+    Возвращает общий httpx.Client для нагрузочного тестирования из реестра `gateway_locust_http_client_pool`.
+
+    Без ключа клиент общий для всего воркера (одного окружения Locust): все API клиенты
+    всех виртуальных пользователей используют один пул соединений к http-gateway.
+    Передав ключ (например, id виртуального пользователя), можно получить отдельный клиент на пользователя.
+
+    Клиенты окружения закрываются по его событию Locust `test_stop`; клиенты других окружений
+    (например, бенчмарков, работающих в том же процессе) остаются открытыми.
+
+    :param environment: Объект окружения Locust.
+    :param key: Дополнительный ключ переиспользования клиента внутри окружения.
+    :param limits: Лимиты пула соединений и keep-alive для создаваемого клиента.
+    :param discard_body: Отбрасывать тела ответов; клиенты с разным значением хранятся в реестре раздельно.
+    :return: Общий httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    """
+    if environment not in _bound_environments:
+        _bound_environments.add(environment)
+        environment_id = id(environment)
+        environment.events.test_stop.add_listener(
+            lambda **kwargs: gateway_locust_http_client_pool.close(group=environment_id)
+        )
+
+    return gateway_locust_http_client_pool.get(
+        key=(id(environment), key, discard_body),
+        factory=lambda: build_gateway_locust_http_client(environment, limits=limits, discard_body=discard_body)
+    )
+
+
+def release_gateway_locust_http_client(environment: Environment,
+                                       key: Hashable | None = None,
+                                       discard_body: bool = False) -> None:
+    """
+    Закрывает общий httpx.Client, выданный функцией `get_gateway_locust_http_client` по указанному ключу.
+
+    :param environment: Объект окружения Locust.
+    :param key: Ключ переиспользования клиента внутри окружения.
+    :param discard_body: Режим отбрасывания тел ответов, с которым клиент был получен.
+    """
+    gateway_locust_http_client_pool.release((id(environment), key, discard_body))
+
+
+def build_gateway_async_http_client(limits: Limits = GATEWAY_HTTP_CLIENT_LIMITS) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :param limits: Лимиты пула соединений и keep-alive.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(timeout=100, limits=limits, base_url=GATEWAY_HTTP_URL)
+
+
+def build_gateway_locust_async_http_client(environment: Environment,
+                                           limits: Limits = GATEWAY_HTTP_CLIENT_LIMITS,
+                                           discard_body: bool = False) -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент для нагрузочного тестирования, аналог `build_gateway_locust_http_client`.
+
+    Подключает асинхронные хуки `locust_async_request_event_hook` и `locust_async_response_event_hook`,
+    которые отправляют метрики каждого запроса в `environment.events.request`.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param limits: Лимиты пула соединений и keep-alive.
+    :param discard_body: Отбрасывать тела ответов, только подсчитывая их размер.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return AsyncClient(
+        timeout=100,
+        limits=limits,
+        base_url=GATEWAY_HTTP_URL,
+        event_hooks={
+            "request": [locust_async_request_event_hook],
+            "response": [locust_async_response_event_hook(environment, discard_body=discard_body)]
         }
     )
@@ -0,0 +1,64 @@
+from httpx import Response
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import build_gateway_async_http_client, build_gateway_locust_async_http_client
+from clients.http.gateway.documents.schema import (GetContractDocumentResponseSchema,
+                                                   GetTariffDocumentResponseSchema)
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получение тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/tariff-document/{account_id}",
+                              extensions=HTTPClientExtensions(route="/api/v1/documents/tariff-document/{account_id}"))
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получение контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/contract-document/{account_id}",
+                              extensions=HTTPClientExtensions(
+                                  route="/api/v1/documents/contract-document/{account_id}"
+                              ))
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return self.validate_response(GetTariffDocumentResponseSchema, response)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return self.validate_response(GetContractDocumentResponseSchema, response)
+
+
+def build_documents_gateway_async_http_client() -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_documents_gateway_locust_async_http_client(environment: Environment) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncDocumentsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_locust_async_http_client(environment))
@@ -2,7 +2,7 @@ from httpx import Response
 from locust.env import Environment
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (build_gateway_http_client,
-                                         build_gateway_locust_http_client)
+                                         get_gateway_locust_http_client)
 from clients.http.gateway.documents.schema import (GetContractDocumentResponseSchema,
                                                    GetTariffDocumentResponseSchema)
 
@@ -34,11 +34,11 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetTariffDocumentResponseSchema, response)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetContractDocumentResponseSchema, response)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -56,8 +56,9 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Использует общий для воркера httpx.Client и его пул соединений (см. `get_gateway_locust_http_client`).
 
     :param environment: объект окружения Locust.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(client=get_gateway_locust_http_client(environment))
@@ -1,25 +1,63 @@
+import random
+
+from httpx import Limits
 from locust import TaskSet, SequentialTaskSet
 
-# Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
-from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
-from clients.http.gateway.documents.client import (DocumentsGatewayHTTPClient,
-                                                   build_documents_gateway_locust_http_client)
-from clients.http.gateway.operations.client import (
-    OperationsGatewayHTTPClient,
-    build_operations_gateway_locust_http_client
+# Импортируем типы API клиентов и общий пул httpx.Client для нагрузочных тестов
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import (
+    GATEWAY_HTTP_CLIENT_LIMITS,
+    get_gateway_locust_http_client,
+    release_gateway_locust_http_client
 )
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.context import ScenarioContext
+from clients.metrics import start_user_metrics
+from clients.http.pool import HTTPClientScope
+from clients.http.validation import ValidationMode
+from tools.load_shapes import ArrivalRateTaskSetMixin
+from tools.saturation import saturation_monitor
+from tools.seeding import seed_user
+# Подключают гистограммы задержек и экспортёр Prometheus к метрикам запросов (см. tools.histograms, tools.prometheus)
+import tools.histograms  # noqa: F401
+import tools.prometheus  # noqa: F401
+# Подключает режим профилирования генератора `--sampling-profile` (см. tools.profiling)
+import tools.profiling  # noqa: F401
 
 
-class GatewayHTTPTaskSet(TaskSet):
+class GatewayHTTPTaskSetMixin(ArrivalRateTaskSetMixin):
     """
-    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
+    Общая часть базовых TaskSet для HTTP-сценариев, работающих с http-gateway.
 
-    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
-    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    Все API клиенты создаются поверх одного httpx.Client из `get_gateway_locust_http_client`,
+    поэтому у них общий пул keep-alive соединений. По умолчанию клиент общий для всего воркера,
+    при `http_client_scope = HTTPClientScope.USER` — отдельный на каждого виртуального пользователя.
+
+    При `http_discard_body = True` тела ответов не сохраняются (учитывается только их размер) —
+    для сценариев на чистую пропускную способность, которые не разбирают ответы и вызывают `*_api` методы.
+    Глубина валидации ответов в типизированных методах задаётся через `http_validation_mode`.
+
+    Состояние сценария хранится в `self.context` — экземпляре `context_class` (см. ScenarioContext).
+    В открытой модели нагрузки слот расписания занимает итерация сценария (см. ArrivalRateTaskSetMixin).
     """
 
+    # Область переиспользования httpx.Client и лимиты его пула соединений
+    http_client_scope: HTTPClientScope = HTTPClientScope.WORKER
+    http_client_limits: Limits = GATEWAY_HTTP_CLIENT_LIMITS
+    http_discard_body: bool = False
+    http_validation_mode: ValidationMode = ValidationMode.FULL
+
+    # Класс состояния сценария: сценарии объявляют наследника ScenarioContext только с нужными полями
+    context_class: type[ScenarioContext] = ScenarioContext
+    context: ScenarioContext
+
+    # Генератор выбора задач виртуального пользователя (см. tools.seeding.seed_user): при запуске с `--seed`
+    # последовательность задач и фейковых данных пользователя воспроизводится от запуска к запуску
+    task_random: random.Random
+
     # Аннотации полей с клиентами (появятся в self после on_start)
     users_gateway_client: UsersGatewayHTTPClient
     cards_gateway_client: CardsGatewayHTTPClient
@@ -27,38 +65,70 @@ class GatewayHTTPTaskSet(TaskSet):
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
 
+    @property
+    def http_client_key(self) -> int | None:
+        """
+        Ключ httpx.Client в реестре: id виртуального пользователя или None для общего клиента воркера.
+        """
+        return id(self.user) if self.http_client_scope == HTTPClientScope.USER else None
+
     def on_start(self) -> None:
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+        Также включается телеметрия загрузки самого генератора (см. tools.saturation).
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        self.task_random = seed_user(self.user.environment)
+        start_user_metrics()
+        saturation_monitor.start(self.user.environment)
+        self.context = self.context_class()
+
+        client = get_gateway_locust_http_client(
+            self.user.environment,
+            key=self.http_client_key,
+            limits=self.http_client_limits,
+            discard_body=self.http_discard_body
+        )
+        validation_mode = self.http_validation_mode
 
+        self.users_gateway_client = UsersGatewayHTTPClient(client=client, validation_mode=validation_mode)
+        self.cards_gateway_client = CardsGatewayHTTPClient(client=client, validation_mode=validation_mode)
+        self.accounts_gateway_client = AccountsGatewayHTTPClient(client=client, validation_mode=validation_mode)
+        self.documents_gateway_client = DocumentsGatewayHTTPClient(client=client, validation_mode=validation_mode)
+        self.operations_gateway_client = OperationsGatewayHTTPClient(client=client, validation_mode=validation_mode)
 
-class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке виртуального пользователя.
+        Закрывает httpx.Client, если он был выделен персонально этому пользователю.
+        """
+        if self.http_client_scope == HTTPClientScope.USER:
+            release_gateway_locust_http_client(
+                self.user.environment,
+                key=self.http_client_key,
+                discard_body=self.http_discard_body
+            )
+
+
+class GatewayHTTPTaskSet(GatewayHTTPTaskSetMixin, TaskSet):
+    """
+    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
+
+    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
+    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    """
+
+    def get_next_task(self):
+        if not self.tasks:
+            return super().get_next_task()
+
+        return self.task_random.choice(self.tasks)
+
+
+class GatewayHTTPSequentialTaskSet(GatewayHTTPTaskSetMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
 
     Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
     Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
     """
-
-    users_gateway_client: UsersGatewayHTTPClient
-    cards_gateway_client: CardsGatewayHTTPClient
-    accounts_gateway_client: AccountsGatewayHTTPClient
-    documents_gateway_client: DocumentsGatewayHTTPClient
-    operations_gateway_client: OperationsGatewayHTTPClient
-
-    def on_start(self) -> None:
-        """
-        Создание API клиентов для последовательного сценария.
-        """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
@@ -0,0 +1,245 @@
+from httpx import QueryParams, Response
+from locust.env import Environment
+from pydantic import UUID4
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_async_http_client, build_gateway_locust_async_http_client
+from clients.http.gateway.operations.schema import (
+    GetOperationReceiptResponseSchema,
+    GetOperationResponseSchema,
+    GetOperationsQuerySchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationsSummaryResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeCashWithdrawalOperationResponseSchema,
+    MakeCashWithdrawalOpertionRequestSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MAKE_BILL_PAYMENT_OPERATION_PAYLOAD,
+    MAKE_CASHBACK_OPERATION_PAYLOAD,
+    MAKE_CASH_WITHDRAWAL_OPERATION_PAYLOAD,
+    MAKE_FEE_OPERATION_PAYLOAD,
+    MAKE_PURCHASE_OPERATION_PAYLOAD,
+    MAKE_TOP_UP_OPERATION_PAYLOAD,
+    MAKE_TRANSFER_OPERATION_PAYLOAD
+)
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия c /api/v1/operations сервиса http-gateway.
+    """
+
+    async def get_operation_api(self, operation_id: UUID4) -> Response:
+        """
+        Получение информации об операции по `operation_id`.
+
+        :param operation_id: id операции
+        :returns Response: объект httpx.Response
+        """
+        return await self.get(url=f'/api/v1/operations/{operation_id}',
+                              extensions=HTTPClientExtensions(route="/api/v1/operations/{operation_id}"))
+
+    async def get_operation_receipt_api(self, operation_id: UUID4) -> Response:
+        """
+        Получение чека по операции по `operation_id`.
+
+        :param operation_id: id операции
+        :returns Response: объект httpx.Response
+        """
+        return await self.get(url=f'/api/v1/operations/operation-receipt/{operation_id}',
+                              extensions=HTTPClientExtensions(
+                                  route="/api/v1/operations/operation-receipt/{operation_id}"
+                              ))
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Получение списка операций для определенного счета.
+
+        :param accountId: id аккаунта
+        :returns Response: объект httpx.Response
+        """
+        return await self.get(url='/api/v1/operations/',
+                              params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route="/api/v1/operations"))
+
+    async def get_opertions_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Получение статистики по операциям для определенного счета.
+
+        :param accountId: id аккаунта
+        :returns Response: объект httpx.Response
+        """
+        return await self.get(url='/api/v1/operations/operations-summary',
+                              params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary"))
+
+    async def make_fee_operation_api(self, json: MakeFeeOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции комиссии.
+
+        :param body: данные для создания операции комиссии
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-fee-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-fee-operation"))
+
+    async def make_top_up_operation_api(self, json: MakeTopUpOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции пополнения.
+        :param body: данные для создания операции пополнения
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-top-up-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-top-up-operation"))
+
+    async def make_cashback_operation_api(self, json: MakeCashbackOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции кэшбэка.
+
+        :param body: данные для создания операции кэшбэка
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-cashback-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-cashback-operation"))
+
+    async def make_transfer_operation_api(self, json: MakeTransferOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции перевода.
+
+        :param body: данные для создания операции перевода
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-transfer-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-transfer-operation"))
+
+    async def make_purchase_operation_api(self, json: MakePurchaseOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции покупки.
+
+        :param body: данные для создания операции покупки
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-purchase-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-purchase-operation"))
+
+    async def make_bill_payment_operation_api(self, json: MakeBillPaymentOperationRequestSchema | bytes) -> Response:
+        """
+        Создание операции оплаты по счету.
+
+        :param body: данные для создания операции оплаты по счёту
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-bill-payment-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/operations/make-bill-payment-operation"))
+
+    async def make_cash_withdrawal_operation_api(self,
+                                                 json: MakeCashWithdrawalOpertionRequestSchema | bytes) -> Response:
+        """
+        Создание операции снятия наличных денег.
+
+        :param body: данные для создания операции оплаты по счёту
+        :returns Request: объект httpx.Response
+        """
+        return await self.post(url='/api/v1/operations/make-cash-withdrawal-operation',
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(
+                                   route="/api/v1/operations/make-cash-withdrawal-operation"
+                               ))
+
+    async def get_operation(self, operation_id: UUID4) -> GetOperationResponseSchema:
+        response = await self.get_operation_api(operation_id)
+        return self.validate_response(GetOperationResponseSchema, response)
+
+    async def get_operation_receipt(self, operation_id: UUID4) -> GetOperationReceiptResponseSchema:
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.validate_response(GetOperationReceiptResponseSchema, response)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.validate_response(GetOperationsResponseSchema, response)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_opertions_summary_api(query)
+        return self.validate_response(GetOperationsSummaryResponseSchema, response)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        json = MAKE_FEE_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_fee_operation_api(json=json)
+        return self.validate_response(MakeFeeOperationResponseSchema, response)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        json = MAKE_TOP_UP_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_top_up_operation_api(json=json)
+        return self.validate_response(MakeTopUpOperationResponseSchema, response)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        json = MAKE_CASHBACK_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_cashback_operation_api(json=json)
+        return self.validate_response(MakeCashbackOperationResponseSchema, response)
+
+    async def make_transfer_operation(self,
+                                      card_id: str,
+                                      account_id: str) -> MakeTransferOperationResponseSchema:
+        json = MAKE_TRANSFER_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_transfer_operation_api(json=json)
+        return self.validate_response(MakeTransferOperationResponseSchema, response)
+
+    async def make_purchase_operation(self, card_id: str,
+                                      account_id: str, category: str) -> MakePurchaseOperationResponseSchema:
+        json = MAKE_PURCHASE_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id, category=category)
+        response = await self.make_purchase_operation_api(json=json)
+        return self.validate_response(MakePurchaseOperationResponseSchema, response)
+
+    async def make_bill_payment_operation(self,
+                                          card_id: str,
+                                          account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        json = MAKE_BILL_PAYMENT_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_bill_payment_operation_api(json=json)
+        return self.validate_response(MakeBillPaymentOperationResponseSchema, response)
+
+    async def make_cash_withdrawal_operation(self,
+                                             card_id: str,
+                                             account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+        json = MAKE_CASH_WITHDRAWAL_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
+        response = await self.make_cash_withdrawal_operation_api(json=json)
+        return self.validate_response(MakeCashWithdrawalOperationResponseSchema, response)
+
+
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_operations_gateway_locust_async_http_client(environment: Environment) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncOperationsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_locust_async_http_client(environment))
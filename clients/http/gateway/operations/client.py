@@ -2,8 +2,9 @@ from httpx import QueryParams, Response
 from locust.env import Environment
 from pydantic import UUID4
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
 from clients.http.gateway.client import (build_gateway_http_client,
-                                         build_gateway_locust_http_client)
+                                         get_gateway_locust_http_client)
 from clients.http.gateway.operations.schema import (
     GetOperationReceiptResponseSchema,
     GetOperationResponseSchema,
@@ -24,7 +25,14 @@ from clients.http.gateway.operations.schema import (
     MakeTopUpOperationRequestSchema,
     MakeTopUpOperationResponseSchema,
     MakeTransferOperationRequestSchema,
-    MakeTransferOperationResponseSchema
+    MakeTransferOperationResponseSchema,
+    MAKE_BILL_PAYMENT_OPERATION_PAYLOAD,
+    MAKE_CASHBACK_OPERATION_PAYLOAD,
+    MAKE_CASH_WITHDRAWAL_OPERATION_PAYLOAD,
+    MAKE_FEE_OPERATION_PAYLOAD,
+    MAKE_PURCHASE_OPERATION_PAYLOAD,
+    MAKE_TOP_UP_OPERATION_PAYLOAD,
+    MAKE_TRANSFER_OPERATION_PAYLOAD
 )
 
 
@@ -62,7 +70,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.get(url='/api/v1/operations/',
                         params=QueryParams(**query.model_dump(by_alias=True)),
-                        extensions=HTTPClientExtensions(route="/api/v1/operations/{operation_id}"))
+                        extensions=HTTPClientExtensions(route="/api/v1/operations"))
 
     def get_opertions_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
         """
@@ -73,127 +81,141 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.get(url='/api/v1/operations/operations-summary',
                         params=QueryParams(**query.model_dump(by_alias=True)),
-                        extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary/{operation_id}"))
+                        extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary"))
 
-    def make_fee_operation_api(self, json: MakeFeeOperationRequestSchema) -> Response:
+    def make_fee_operation_api(self, json: MakeFeeOperationRequestSchema | bytes) -> Response:
         """
         Создание операции комиссии.
 
         :param body: данные для создания операции комиссии
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-fee-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-fee-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-fee-operation"))
 
-    def make_top_up_operation_api(self, json: MakeTopUpOperationRequestSchema) -> Response:
+    def make_top_up_operation_api(self, json: MakeTopUpOperationRequestSchema | bytes) -> Response:
         """
         Создание операции пополнения.
         :param body: данные для создания операции пополнения
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-top-up-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-top-up-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-top-up-operation"))
 
-    def make_cashback_operation_api(self, json: MakeCashbackOperationRequestSchema) -> Response:
+    def make_cashback_operation_api(self, json: MakeCashbackOperationRequestSchema | bytes) -> Response:
         """
         Создание операции кэшбэка.
 
         :param body: данные для создания операции кэшбэка
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-cashback-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-cashback-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-cashback-operation"))
 
-    def make_transfer_operation_api(self, json: MakeTransferOperationRequestSchema) -> Response:
+    def make_transfer_operation_api(self, json: MakeTransferOperationRequestSchema | bytes) -> Response:
         """
         Создание операции перевода.
 
         :param body: данные для создания операции перевода
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-transfer-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-transfer-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-transfer-operation"))
 
-    def make_purchase_operation_api(self, json: MakePurchaseOperationRequestSchema) -> Response:
+    def make_purchase_operation_api(self, json: MakePurchaseOperationRequestSchema | bytes) -> Response:
         """
         Создание операции покупки.
 
         :param body: данные для создания операции покупки
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-purchase-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-purchase-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-purchase-operation"))
 
-    def make_bill_payment_operation_api(self, json: MakeBillPaymentOperationRequestSchema) -> Response:
+    def make_bill_payment_operation_api(self, json: MakeBillPaymentOperationRequestSchema | bytes) -> Response:
         """
         Создание операции оплаты по счету.
 
         :param body: данные для создания операции оплаты по счёту
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-bill-payment-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-bill-payment-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-bill-payment-operation"))
 
-    def make_cash_withdrawal_operation_api(self, json: MakeCashWithdrawalOpertionRequestSchema) -> Response:
+    def make_cash_withdrawal_operation_api(self, json: MakeCashWithdrawalOpertionRequestSchema | bytes) -> Response:
         """
         Создание операции снятия наличных денег.
 
         :param body: данные для создания операции оплаты по счёту
         :returns Request: объект httpx.Response
         """
-        return self.post(url='/api/v1/operations/make-cash-withdrawal-operation', json=json.model_dump(by_alias=True))
+        return self.post(url='/api/v1/operations/make-cash-withdrawal-operation',
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/operations/make-cash-withdrawal-operation"))
 
     def get_operation(self, operation_id: UUID4) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationResponseSchema, response)
 
     def get_operation_receipt(self, operation_id: UUID4) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationReceiptResponseSchema, response)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationsResponseSchema, response)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_opertions_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationsSummaryResponseSchema, response)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        json = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_FEE_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_fee_operation_api(json=json)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeFeeOperationResponseSchema, response)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        json = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_TOP_UP_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_top_up_operation_api(json=json)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeTopUpOperationResponseSchema, response)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
-        json = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_CASHBACK_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_cashback_operation_api(json=json)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeCashbackOperationResponseSchema, response)
 
     def make_transfer_operation(self,
                                 card_id: str,
                                 account_id: str) -> MakeTransferOperationResponseSchema:
-        json = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_TRANSFER_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_transfer_operation_api(json=json)
-        return response.json()
+        return self.validate_response(MakeTransferOperationResponseSchema, response)
 
     def make_purchase_operation(self, card_id: str,
                                 account_id: str, category: str) -> MakePurchaseOperationResponseSchema:
-        json = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_PURCHASE_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id, category=category)
         response = self.make_purchase_operation_api(json=json)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakePurchaseOperationResponseSchema, response)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        json = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_BILL_PAYMENT_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_bill_payment_operation_api(json=json)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeBillPaymentOperationResponseSchema, response)
 
     def make_cash_withdrawal_operation(self,
                                        card_id: str,
                                        account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
-        json = MakeCashWithdrawalOpertionRequestSchema(card_id=card_id, account_id=account_id)
+        json = MAKE_CASH_WITHDRAWAL_OPERATION_PAYLOAD.render(card_id=card_id, account_id=account_id)
         response = self.make_cash_withdrawal_operation_api(json=json)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeCashWithdrawalOperationResponseSchema, response)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -206,8 +228,9 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Использует общий для воркера httpx.Client и его пул соединений (см. `get_gateway_locust_http_client`).
 
     :param environment: объект окружения Locust.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(client=get_gateway_locust_http_client(environment))
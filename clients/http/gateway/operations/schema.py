@@ -1,6 +1,7 @@
 from datetime import datetime
 from enum import StrEnum
 from pydantic import BaseModel, Field, ConfigDict, UUID4, HttpUrl
+from clients.http.payload import PayloadTemplate
 from tools.fakers import fake
 
 
@@ -165,3 +166,13 @@ class MakeBillPaymentOperationRequestSchema(MakeOperationRequestSchema):
 class MakeCashWithdrawalOpertionRequestSchema(MakeOperationRequestSchema):
     """Структура данных для создания операции снятия наличных денег."""
     ...
+
+
+# Предкомпилированные шаблоны тел запросов для типизированных методов API клиентов (см. PayloadTemplate)
+MAKE_FEE_OPERATION_PAYLOAD = PayloadTemplate(MakeFeeOperationRequestSchema)
+MAKE_TOP_UP_OPERATION_PAYLOAD = PayloadTemplate(MakeTopUpOperationRequestSchema)
+MAKE_CASHBACK_OPERATION_PAYLOAD = PayloadTemplate(MakeCashbackOperationRequestSchema)
+MAKE_TRANSFER_OPERATION_PAYLOAD = PayloadTemplate(MakeTransferOperationRequestSchema)
+MAKE_PURCHASE_OPERATION_PAYLOAD = PayloadTemplate(MakePurchaseOperationRequestSchema)
+MAKE_BILL_PAYMENT_OPERATION_PAYLOAD = PayloadTemplate(MakeBillPaymentOperationRequestSchema)
+MAKE_CASH_WITHDRAWAL_OPERATION_PAYLOAD = PayloadTemplate(MakeCashWithdrawalOpertionRequestSchema)
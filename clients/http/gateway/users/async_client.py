@@ -0,0 +1,62 @@
+from httpx import Response
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_async_http_client, build_gateway_locust_async_http_client
+from clients.http.gateway.users.schema import (GetUserResponseSchema,
+                                               CreateUserRequestSchema,
+                                               CreateUserResponseSchema,
+                                               CREATE_USER_PAYLOAD)
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/users/{user_id}",
+                              extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}"))
+
+    async def create_user_api(self, json: CreateUserRequestSchema | bytes) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param json: Данные нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users",
+                               content=dump_payload(json),
+                               extensions=HTTPClientExtensions(route="/api/v1/users"))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return self.validate_response(GetUserResponseSchema, response)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        new_user = CREATE_USER_PAYLOAD.render()
+        response = await self.create_user_api(new_user)
+        return self.validate_response(CreateUserResponseSchema, response)
+
+
+def build_users_gateway_async_http_client() -> AsyncUsersGatewayHTTPClient:
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_locust_async_http_client(environment: Environment) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncUsersGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_locust_async_http_client(environment))
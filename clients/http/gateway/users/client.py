@@ -3,10 +3,12 @@ from locust.env import Environment
 from httpx import Response
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.payload import dump_payload
+from clients.http.gateway.client import build_gateway_http_client, get_gateway_locust_http_client
 from clients.http.gateway.users.schema import (GetUserResponseSchema,
                                                CreateUserRequestSchema,
-                                               CreateUserResponseSchema)
+                                               CreateUserResponseSchema,
+                                               CREATE_USER_PAYLOAD)
 
 
 class UsersGatewayHTTPClient(HTTPClient):
@@ -24,23 +26,25 @@ class UsersGatewayHTTPClient(HTTPClient):
         return self.get(f"/api/v1/users/{user_id}",
                         extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}"))
 
-    def create_user_api(self, json: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, json: CreateUserRequestSchema | bytes) -> Response:
         """
         Создание нового пользователя.
 
         :param body: Словарь с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/users", json=json.model_dump(by_alias=True))
+        return self.post("/api/v1/users",
+                         content=dump_payload(json),
+                         extensions=HTTPClientExtensions(route="/api/v1/users"))
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetUserResponseSchema, response)
 
     def create_user(self) -> CreateUserResponseSchema:
-        new_user = CreateUserRequestSchema()
+        new_user = CREATE_USER_PAYLOAD.render()
         response = self.create_user_api(new_user)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.validate_response(CreateUserResponseSchema, response)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -54,8 +58,9 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Использует общий для воркера httpx.Client и его пул соединений (см. `get_gateway_locust_http_client`).
 
     :param environment: объект окружения Locust.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(client=get_gateway_locust_http_client(environment))
@@ -1,6 +1,7 @@
 from xml.sax import default_parser_list
 from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from pytest import File
+from clients.http.payload import PayloadTemplate
 from tools.fakers import fake
 
 
@@ -41,3 +42,7 @@ class CreateUserResponseSchema(BaseModel):
     Описание структуры ответа `создания` пользователя.
     """
     user: UserSchema
+
+
+# Предкомпилированные шаблоны тел запросов для типизированных методов API клиентов (см. PayloadTemplate)
+CREATE_USER_PAYLOAD = PayloadTemplate(CreateUserRequestSchema)
@@ -0,0 +1,77 @@
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined, to_json
+
+# Заголовки запроса с заранее сериализованным JSON-телом
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+
+def dump_payload(payload: BaseModel | bytes) -> bytes:
+    """
+    Сериализует тело запроса в JSON-байты с учётом алиасов полей.
+
+    Уже готовые байты (например, из `PayloadTemplate.render`) возвращаются как есть.
+    Модель сериализуется за один проход в pydantic-core, без промежуточного dict и повторного `json.dumps` в httpx.
+
+    :param payload: Модель запроса или готовое JSON-тело.
+    :return: JSON-тело запроса в байтах.
+    """
+    if isinstance(payload, bytes):
+        return payload
+
+    return to_json(payload, by_alias=True)
+
+
+class PayloadTemplate:
+    """
+    Заранее скомпилированный шаблон JSON-тела запроса для pydantic-схемы.
+
+    Скелет JSON (ключи с алиасами, разделители, константные значения по умолчанию) рендерится один раз
+    при создании шаблона. На каждый запрос сериализуются только изменяемые значения: переданные в `render`
+    и значения из `default_factory` (например, данные faker). Модель запроса при этом не создаётся
+    и не валидируется — значения должны соответствовать схеме.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        """
+        :param schema: Схема запроса, например: MakeTopUpOperationRequestSchema.
+        """
+        self.schema = schema
+        # Для каждого поля: (префикс с ключом, имя поля, фабрика значения, заранее сериализованное значение)
+        self._fields: list[tuple[bytes, str, Callable[[], Any] | None, bytes | None]] = []
+
+        for index, (name, field) in enumerate(schema.model_fields.items()):
+            key = field.serialization_alias or field.alias or name
+            prefix = (b"{" if index == 0 else b",") + to_json(key) + b":"
+
+            default = None
+            if field.default is not PydanticUndefined and field.default_factory is None:
+                default = to_json(field.default)
+
+            self._fields.append((prefix, name, field.default_factory, default))
+
+        self._suffix = b"}" if self._fields else b"{}"
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Рендерит JSON-тело запроса.
+
+        :param values: Значения полей по их именам в схеме, например: card_id="...", account_id="...".
+        :return: JSON-тело запроса в байтах.
+        :raises TypeError: Если не передано обязательное поле без значения по умолчанию.
+        """
+        parts: list[bytes] = []
+        for prefix, name, default_factory, default in self._fields:
+            parts.append(prefix)
+            if name in values:
+                parts.append(to_json(values[name]))
+            elif default is not None:
+                parts.append(default)
+            elif default_factory is not None:
+                parts.append(to_json(default_factory()))
+            else:
+                raise TypeError(f"{self.schema.__name__}: missing required field '{name}'")
+
+        parts.append(self._suffix)
+        return b"".join(parts)
@@ -0,0 +1,64 @@
+from enum import StrEnum
+from typing import Callable, Hashable
+
+from httpx import Client
+
+
+class HTTPClientScope(StrEnum):
+    """
+    Область, в пределах которой переиспользуется один экземпляр httpx.Client.
+
+    USER — отдельный httpx.Client (и пул соединений) на каждого виртуального пользователя.
+    WORKER — один httpx.Client на весь процесс-воркер Locust, общий для всех пользователей.
+    """
+    USER = "USER"
+    WORKER = "WORKER"
+
+
+class HTTPClientPool:
+    """
+    Реестр общих экземпляров httpx.Client.
+
+    Вместо того чтобы каждый API клиент открывал собственный httpx.Client со своим пулом соединений,
+    реестр выдаёт один httpx.Client на ключ (например, на воркер или на виртуального пользователя).
+    Все API клиенты, полученные по одному ключу, используют общий пул keep-alive соединений.
+    """
+
+    def __init__(self):
+        self._clients: dict[Hashable, Client] = {}
+
+    def get(self, key: Hashable, factory: Callable[[], Client]) -> Client:
+        """
+        Возвращает httpx.Client для указанного ключа, создавая его при первом обращении.
+
+        :param key: Ключ, по которому клиент переиспользуется.
+        :param factory: Функция, создающая новый httpx.Client, если по ключу ещё ничего нет
+                        или ранее выданный клиент уже закрыт.
+        :return: Общий экземпляр httpx.Client.
+        """
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._clients[key] = factory()
+
+        return client
+
+    def release(self, key: Hashable) -> None:
+        """
+        Закрывает и удаляет из реестра клиент, выданный по указанному ключу.
+
+        :param key: Ключ клиента.
+        """
+        client = self._clients.pop(key, None)
+        if client is not None:
+            client.close()
+
+    def close(self, group: Hashable | None = None) -> None:
+        """
+        Закрывает клиенты реестра и освобождает их соединения.
+
+        :param group: Закрыть только клиенты, ключ которых — кортеж, начинающийся с `group`
+                      (например, с id окружения Locust); по умолчанию закрываются все клиенты.
+        """
+        for key in list(self._clients):
+            if group is None or (isinstance(key, tuple) and key[:1] == (group,)):
+                self.release(key)
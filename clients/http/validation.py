@@ -0,0 +1,135 @@
+import typing
+from enum import StrEnum
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+class ValidationMode(StrEnum):
+    """
+    Глубина валидации ответов в типизированных методах API клиентов.
+
+    FULL — полная валидация pydantic сразу после получения ответа.
+    LAZY — валидация откладывается до первого обращения к атрибуту модели; если ответ не используется,
+    он не валидируется вовсе.
+    NONE — модель собирается через `model_construct` без валидации и приведения типов
+    (значения остаются в JSON-типах: строки, числа, списки). Минимальная нагрузка на CPU генератора.
+    """
+    FULL = "FULL"
+    LAZY = "LAZY"
+    NONE = "NONE"
+
+
+class LazyModel:
+    """
+    Прокси модели ответа, который валидирует исходные байты при первом обращении к атрибуту.
+
+    После валидации все обращения делегируются настоящему экземпляру модели.
+    """
+
+    __slots__ = ("_model", "_content", "_instance")
+
+    def __init__(self, model: type[BaseModel], content: bytes):
+        """
+        :param model: Класс pydantic-модели ответа.
+        :param content: Тело ответа в байтах.
+        """
+        self._model = model
+        self._content = content
+        self._instance: BaseModel | None = None
+
+    def _validate(self) -> BaseModel:
+        if self._instance is None:
+            self._instance = self._model.model_validate_json(self._content)
+            self._content = b""
+
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._validate(), name)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._validate() == other
+
+    def __repr__(self) -> str:
+        return repr(self._validate())
+
+
+def get_model_class(annotation: Any) -> type[BaseModel] | None:
+    """
+    Возвращает класс pydantic-модели из аннотации поля (`Model`, `Model | None`, `list[Model]`).
+
+    :param annotation: Аннотация поля модели.
+    :return: Класс вложенной модели или None, если поле не является моделью.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for argument in typing.get_args(annotation):
+        model = get_model_class(argument)
+        if model is not None:
+            return model
+
+    return None
+
+
+@cache
+def get_construct_plan(model: type[BaseModel]) -> tuple[tuple[str, type[BaseModel] | None], ...]:
+    """
+    Возвращает для модели список пар (ключ в JSON, класс вложенной модели или None).
+
+    Результат кешируется, чтобы не разбирать аннотации полей на каждый ответ.
+
+    :param model: Класс pydantic-модели.
+    :return: План сборки модели без валидации.
+    """
+    return tuple(
+        (field.alias or name, get_model_class(field.annotation))
+        for name, field in model.model_fields.items()
+    )
+
+
+def construct_model(model: type[Model], data: dict[str, Any]) -> Model:
+    """
+    Рекурсивно собирает модель из разобранного JSON через `model_construct`, без валидации.
+
+    :param model: Класс pydantic-модели.
+    :param data: Словарь, полученный из JSON ответа.
+    :return: Экземпляр модели (вложенные модели и списки моделей тоже собираются).
+    """
+    values = dict(data)
+    for key, nested in get_construct_plan(model):
+        value = values.get(key)
+        if nested is None or value is None:
+            continue
+
+        if isinstance(value, list):
+            values[key] = [construct_model(nested, item) for item in value]
+        elif isinstance(value, dict):
+            values[key] = construct_model(nested, value)
+
+    return model.model_construct(**values)
+
+
+def validate_content(model: type[Model], content: bytes, mode: ValidationMode = ValidationMode.FULL) -> Model:
+    """
+    Превращает тело ответа в модель с заданной глубиной валидации.
+
+    Байты передаются в pydantic напрямую, без промежуточного декодирования в `str`.
+
+    :param model: Класс pydantic-модели ответа.
+    :param content: Тело ответа в байтах.
+    :param mode: Глубина валидации.
+    :return: Модель ответа (при LAZY — прокси `LazyModel` с тем же интерфейсом).
+    """
+    if mode == ValidationMode.LAZY:
+        return LazyModel(model, content)  # type: ignore[return-value]
+
+    if mode == ValidationMode.NONE:
+        return construct_model(model, from_json(content))
+
+    return model.model_validate_json(content)
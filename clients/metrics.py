@@ -0,0 +1,385 @@
+import math
+import time
+from array import array
+from contextvars import ContextVar
+from itertools import count
+from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import gevent
+from locust import events
+from locust.env import Environment
+from locust.event import EventHook
+from locust.runners import WorkerRunner
+from locust.stats import StatsEntry, bucket_response_time
+
+from clients.http.event_hooks.trace import REQUEST_PHASES
+from tools.load_shapes import iteration_lateness
+from tools.samples import SamplesWriter
+from tools.seeding import get_worker_index
+
+# Количество сэмплов в буфере: при заполнении буфер сбрасывается в статистику досрочно
+METRICS_BATCH_SIZE = 4096
+
+# Период сброса буфера в статистику Locust по умолчанию, в секундах (0 — событие на каждый запрос)
+METRICS_FLUSH_INTERVAL = 0.5
+
+# Событие сброса пачки сэмплов: слушатели получают `environment` и `batch` (MetricsBatch) и обрабатывают его сразу
+request_batch = EventHook()
+
+# Буферы метрик, по одному на окружение Locust
+_batches: WeakKeyDictionary[Environment, "MetricsBatch"] = WeakKeyDictionary()
+
+# Открытые файлы сырых сэмплов, по одному на окружение Locust
+_samples_writers: WeakKeyDictionary[Environment, SamplesWriter] = WeakKeyDictionary()
+
+# Номер виртуального пользователя, от имени которого выполняются запросы (у каждого пользователя-гринлета свой)
+current_user_id: ContextVar[int] = ContextVar("current_user_id", default=0)
+
+# Счётчик номеров виртуальных пользователей процесса
+_user_ids = count(1)
+
+
+class MetricsBatch:
+    """
+    Буфер сэмплов запросов в предвыделенных массивах `array`.
+
+    Вместо `environment.events.request.fire(...)` на каждый запрос event hook httpx и gRPC-интерцептор
+    дописывают сэмпл в буфер, а фоновый гринлет периодически сворачивает накопленные сэмплы в одну запись
+    статистики на каждое имя запроса и прибавляет её к статистике Locust (`StatsEntry.extend`).
+    Так из горячего пути уходят диспетчеризация события по всем слушателям и обновление статистики.
+
+    Буфер общий для всех пользователей процесса и работает без блокировок: запись сэмпла не переключает
+    гринлеты gevent, поэтому сэмплы не перемешиваются.
+    """
+
+    def __init__(self, environment: Environment, size: int = METRICS_BATCH_SIZE,
+                 interval: float = METRICS_FLUSH_INTERVAL):
+        """
+        :param environment: Объект окружения Locust, в статистику которого сбрасываются сэмплы.
+        :param size: Количество сэмплов в буфере.
+        :param interval: Период сброса буфера в секундах.
+        """
+        self.environment = environment
+        self.size = size
+        self.interval = interval
+        self.length = 0
+
+        # Имена запросов (request_type, name) хранятся один раз, в сэмплах — только их номера
+        self.keys: list[tuple[str, str]] = []
+        self.key_ids: dict[tuple[str, str], int] = {}
+
+        self.key_indexes = array("I", bytes(4 * size))
+        self.timestamps = array("d", bytes(8 * size))
+        self.response_times = array("d", bytes(8 * size))
+        self.response_lengths = array("q", bytes(8 * size))
+        self.latenesses = array("d", bytes(8 * size))
+        self.statuses = array("i", bytes(4 * size))
+        self.users = array("I", bytes(4 * size))
+        # Длительности фаз HTTP-запроса в миллисекундах (см. RequestTrace.get_phases); фаз, которых не было
+        # (соединение из пула keep-alive, gRPC-запросы), — NaN
+        self.phases = {phase: array("d", bytes(8 * size)) for phase, _, _ in REQUEST_PHASES}
+        # Ошибки редки, поэтому хранятся отдельно: (номер сэмпла, исключение)
+        self.errors: list[tuple[int, Exception]] = []
+
+        self._flusher: gevent.Greenlet | None = None
+
+    def record(self,
+               request_type: str,
+               name: str,
+               response_time: float,
+               response_length: int,
+               exception: Exception | None = None,
+               status: int = 0,
+               phases: dict[str, float] | None = None) -> None:
+        """
+        Дописывает сэмпл запроса в буфер.
+
+        :param request_type: Тип запроса, например: "HTTP", "gRPC".
+        :param name: Имя запроса (маршрут или метод).
+        :param response_time: Время ответа в миллисекундах.
+        :param response_length: Размер ответа в байтах.
+        :param exception: Ошибка запроса, если она произошла.
+        :param status: Статус ответа: HTTP-код или код gRPC.
+        :param phases: Длительности фаз HTTP-запроса в миллисекундах, например: {"connect": 0.41, "ttfb": 12.3}.
+        """
+        if self.length == self.size:
+            self.flush()
+
+        if self._flusher is None:
+            self._flusher = gevent.spawn(self.run)
+
+        key = (request_type, name)
+        key_index = self.key_ids.get(key)
+        if key_index is None:
+            key_index = self.key_ids[key] = len(self.keys)
+            self.keys.append(key)
+
+        index = self.length
+        self.key_indexes[index] = key_index
+        self.timestamps[index] = time.time()
+        self.response_times[index] = response_time
+        self.response_lengths[index] = response_length
+        self.latenesses[index] = iteration_lateness.get()
+        self.statuses[index] = status
+        self.users[index] = current_user_id.get()
+        for phase, values in self.phases.items():
+            values[index] = phases.get(phase, math.nan) if phases else math.nan
+        if exception is not None:
+            self.errors.append((index, exception))
+
+        self.length = index + 1
+
+    def run(self) -> None:
+        """
+        Периодически сбрасывает буфер (тело фонового гринлета).
+        """
+        while True:
+            gevent.sleep(self.interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Сворачивает накопленные сэмплы в статистику Locust, передаёт их слушателям `request_batch`
+        и очищает буфер.
+        """
+        if not self.length:
+            return
+
+        stats = self.environment.stats
+        entries: dict[int, StatsEntry] = {}
+
+        for index in range(self.length):
+            key_index = self.key_indexes[index]
+            entry = entries.get(key_index)
+            if entry is None:
+                request_type, name = self.keys[key_index]
+                entry = entries[key_index] = StatsEntry(stats, name, request_type)
+
+            response_time = self.response_times[index]
+            timestamp = self.timestamps[index]
+
+            entry.num_requests += 1
+            entry.total_response_time += response_time
+            entry.total_content_length += self.response_lengths[index]
+            entry.response_times[bucket_response_time(response_time)] += 1
+            entry.num_reqs_per_sec[int(timestamp)] += 1
+            entry.max_response_time = max(entry.max_response_time, response_time)
+            if entry.min_response_time is None or response_time < entry.min_response_time:
+                entry.min_response_time = response_time
+            if entry.last_request_timestamp is None or timestamp > entry.last_request_timestamp:
+                entry.last_request_timestamp = timestamp
+
+        for entry in entries.values():
+            stats.get(entry.name, entry.method).extend(entry)
+            stats.total.extend(entry)
+
+        for index, exception in self.errors:
+            request_type, name = self.keys[self.key_indexes[index]]
+            stats.log_error(request_type, name, exception)
+
+        request_batch.fire(environment=self.environment, batch=self)
+
+        self.length = 0
+        self.errors = []
+
+    def stop(self) -> None:
+        """
+        Сбрасывает остаток буфера и останавливает фоновый гринлет.
+        """
+        self.flush()
+        if self._flusher is not None:
+            self._flusher.kill(block=False)
+            self._flusher = None
+
+
+def get_metrics_batch(environment: Environment) -> MetricsBatch | None:
+    """
+    Возвращает буфер метрик окружения, создавая его при первом обращении.
+
+    :param environment: Объект окружения Locust.
+    :return: Буфер или None, если пакетная запись выключена (`--metrics-flush-interval 0`).
+    """
+    batch = _batches.get(environment)
+    if batch is None:
+        interval = getattr(environment.parsed_options, "metrics_flush_interval", METRICS_FLUSH_INTERVAL)
+        if not interval:
+            return None
+
+        batch = _batches[environment] = MetricsBatch(environment, interval=interval)
+
+    return batch
+
+
+def report_request(environment: Environment,
+                   request_type: str,
+                   name: str,
+                   response_time: float,
+                   response_length: int,
+                   exception: Exception | None = None,
+                   status: int = 0,
+                   response: Any = None,
+                   context: dict | None = None) -> None:
+    """
+    Регистрирует запрос в метриках Locust: пишет сэмпл в буфер или, если пакетная запись выключена,
+    сразу отправляет событие `environment.events.request` (и дописывает сэмпл в файл сырых сэмплов, если он задан).
+
+    При пакетной записи `response` не сохраняется, а из `context` в буфер попадают длительности фаз
+    HTTP-запроса (см. MetricsBatch.phases).
+
+    :param environment: Объект окружения Locust.
+    :param request_type: Тип запроса, например: "HTTP", "gRPC".
+    :param name: Имя запроса (маршрут или метод).
+    :param response_time: Время ответа в миллисекундах.
+    :param response_length: Размер ответа в байтах.
+    :param exception: Ошибка запроса, если она произошла.
+    :param status: Статус ответа (HTTP-код или код gRPC) для сырых сэмплов.
+    :param response: Объект ответа.
+    :param context: Дополнительные данные запроса для слушателей события.
+    """
+    batch = get_metrics_batch(environment)
+    if batch is not None:
+        batch.record(request_type, name, response_time, response_length, exception, status, context)
+        return
+
+    samples_writer = get_samples_writer(environment)
+    if samples_writer is not None:
+        samples_writer.append(
+            request_type,
+            name,
+            timestamp=time.time(),
+            response_time=response_time,
+            response_length=response_length,
+            status=status,
+            lateness=iteration_lateness.get(),
+            user=current_user_id.get(),
+            error="" if exception is None else repr(exception)
+        )
+
+    environment.events.request.fire(
+        name=name,
+        context=context or {},
+        response=response,
+        exception=exception,
+        request_type=request_type,
+        response_time=response_time,
+        response_length=response_length,
+    )
+
+
+@events.init_command_line_parser.add_listener
+def add_metrics_arguments(parser) -> None:
+    """
+    Добавляет опцию пакетной записи метрик в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--metrics-flush-interval",
+        type=float,
+        env_var="LOCUST_METRICS_FLUSH_INTERVAL",
+        default=METRICS_FLUSH_INTERVAL,
+        help="Период сброса буфера метрик в статистику Locust в секундах (0 — событие request на каждый запрос)"
+    )
+    parser.add_argument(
+        "--metrics-samples-file",
+        type=str,
+        env_var="LOCUST_METRICS_SAMPLES_FILE",
+        default="",
+        help="Колоночный файл сырых сэмплов запросов (по умолчанию не пишется; воркеры пишут каждый в свой файл)"
+    )
+
+
+@events.report_to_master.add_listener
+def flush_metrics_before_report(client_id: str, data: dict) -> None:
+    """
+    Сбрасывает буферы перед отчётом воркера мастеру, чтобы в отчёт попали все завершённые запросы.
+    """
+    for batch in list(_batches.values()):
+        batch.flush()
+
+
+def start_user_metrics() -> int:
+    """
+    Выдаёт номер текущему виртуальному пользователю; номер попадает в сырые сэмплы его запросов.
+
+    Вызывается из `on_start` пользователя, то есть в его гринлете.
+
+    :return: Номер пользователя в процессе.
+    """
+    user_id = next(_user_ids)
+    current_user_id.set(user_id)
+    return user_id
+
+
+@events.test_stop.add_listener
+def stop_metrics_batch(environment: Environment, **kwargs) -> None:
+    batch = _batches.get(environment)
+    if batch is not None:
+        batch.stop()
+
+    samples_writer = _samples_writers.pop(environment, None)
+    if samples_writer is not None:
+        samples_writer.close()
+
+
+def get_samples_file_path(environment: Environment) -> Path | None:
+    """
+    Возвращает путь к файлу сырых сэмплов процесса: воркер дописывает к имени свой номер (samples.3.bin).
+
+    :param environment: Объект окружения Locust.
+    :return: Путь к файлу или None, если запись сырых сэмплов не включена.
+    """
+    samples_file = getattr(environment.parsed_options, "metrics_samples_file", None)
+    if not samples_file:
+        return None
+
+    path = Path(samples_file)
+    if isinstance(environment.runner, WorkerRunner):
+        path = path.with_suffix(f".{get_worker_index(environment)}{path.suffix}")
+
+    return path
+
+
+def get_samples_writer(environment: Environment) -> SamplesWriter | None:
+    """
+    Возвращает файл сырых сэмплов процесса, открывая его при первом обращении.
+
+    :param environment: Объект окружения Locust.
+    :return: Открытый файл или None, если запись сырых сэмплов не включена.
+    """
+    samples_writer = _samples_writers.get(environment)
+    if samples_writer is None:
+        path = get_samples_file_path(environment)
+        if path is None:
+            return None
+
+        samples_writer = _samples_writers[environment] = SamplesWriter(path, worker_index=get_worker_index(environment))
+
+    return samples_writer
+
+
+@request_batch.add_listener
+def write_raw_samples(environment: Environment, batch: MetricsBatch) -> None:
+    """
+    Дописывает сэмплы пачки в колоночный файл `--metrics-samples-file`, если он задан (см. tools.samples).
+
+    При `--metrics-flush-interval 0` буфера нет, и сэмплы пишутся по одному из `report_request`.
+    """
+    samples_writer = get_samples_writer(environment)
+    if samples_writer is None:
+        return
+
+    length = batch.length
+    samples_writer.write(
+        keys=batch.keys,
+        columns={
+            "timestamp": batch.timestamps[:length],
+            "key": batch.key_indexes[:length],
+            "response_time": batch.response_times[:length],
+            "response_length": batch.response_lengths[:length],
+            "status": batch.statuses[:length],
+            "lateness": batch.latenesses[:length],
+            "user": batch.users[:length],
+        },
+        errors={index: repr(exception) for index, exception in batch.errors}
+    )
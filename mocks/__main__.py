@@ -0,0 +1,83 @@
+import argparse
+import multiprocessing
+from dataclasses import replace
+
+import grpc
+
+from mocks.profiles import MockConfig, MockProfile, parse_latency
+from mocks.server import MOCK_GRPC_PORT, MOCK_HTTP_PORT, run
+
+
+def main() -> None:
+    """
+    Заглушки http-gateway, grpc-gateway и внутренних gRPC-сервисов, построенные по proto-контрактам:
+
+        python -m mocks
+        python -m mocks --latency lognormal:20,0.5 --error-rate 0.01 --repeated-count 20 --processes 4
+        python -m mocks --config ./mocks.json
+
+    gRPC-сервер отдаёт все сервисы из contracts/services (gateway и внутренние), HTTP-сервер — маршруты
+    http-gateway с теми же данными. Формат файла настроек и профилей методов — см. MockConfig.load.
+    """
+    parser = argparse.ArgumentParser(description="Заглушки gateway и внутренних сервисов по proto-контрактам")
+    parser.add_argument("--host", type=str, default="localhost", help="Адрес, на котором слушают заглушки")
+    parser.add_argument("--http-port", type=int, default=MOCK_HTTP_PORT, help="Порт заглушки http-gateway")
+    parser.add_argument("--grpc-port", type=int, default=MOCK_GRPC_PORT, help="Порт gRPC-заглушек")
+    parser.add_argument("--config", type=str, default=None, help="JSON-файл с профилями сервисов и методов")
+    parser.add_argument(
+        "--latency",
+        type=parse_latency,
+        default=None,
+        help="Задержка ответа в мс: 5, uniform:1,10, normal:10,2, lognormal:10,0.5, exponential:10"
+    )
+    parser.add_argument("--error-rate", type=float, default=None, help="Доля ответов с ошибкой (0.0 — 1.0)")
+    parser.add_argument(
+        "--error-code",
+        type=lambda value: grpc.StatusCode[value],
+        default=None,
+        help="Код ошибки gRPC, например: UNAVAILABLE (HTTP-заглушка отвечает соответствующим статусом)"
+    )
+    parser.add_argument("--repeated-count", type=int, default=None, help="Элементов в повторяющихся полях ответа")
+    parser.add_argument("--string-size", type=int, default=None, help="Минимальная длина строковых полей ответа")
+    parser.add_argument("--seed", type=int, default=None, help="Seed задержек и ошибок (по умолчанию случайный)")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Количество процессов заглушки на общих портах (один процесс упирается в одно ядро)"
+    )
+    args = parser.parse_args()
+
+    # Опции командной строки важнее файла настроек
+    overrides = {
+        name: value
+        for name, value in (
+            ("latency", args.latency),
+            ("error_rate", args.error_rate),
+            ("error_code", args.error_code),
+            ("repeated_count", args.repeated_count),
+            ("string_size", args.string_size),
+        )
+        if value is not None
+    }
+    if args.config:
+        config = MockConfig.load(args.config, **overrides)
+    else:
+        config = MockConfig(default=replace(MockProfile(), **overrides))
+
+    # spawn, а не fork: gRPC не поддерживает fork после инициализации
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=run, args=(args, config, index)) for index in range(1, args.processes)]
+    for process in processes:
+        process.start()
+
+    try:
+        run(args, config, 0)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import random
+
+import grpc
+from google.protobuf.descriptor import MethodDescriptor, ServiceDescriptor
+from google.protobuf.message_factory import GetMessageClass
+
+from mocks.payloads import build_mock_message
+from mocks.profiles import MockConfig, MockProfile
+
+
+def build_mock_method_handler(method: MethodDescriptor, profile: MockProfile, rng: random.Random):
+    """
+    Создаёт обработчик unary-unary метода заглушки.
+
+    Ответ сериализуется один раз при создании обработчика и отдаётся как готовые байты, поэтому CPU
+    заглушки на запрос почти не зависит от размера ответа. Запрос разбирается классом из контракта:
+    некорректный запрос клиента завершается ошибкой, как на настоящем сервисе.
+
+    :param method: Дескриптор метода.
+    :param profile: Профиль метода: задержка, ошибки и размер ответа.
+    :param rng: Генератор случайных чисел заглушки.
+    """
+    response = build_mock_message(method.output_type, profile).SerializeToString()
+
+    async def handle(request, context: grpc.aio.ServicerContext) -> bytes:
+        if await profile.simulate(rng):
+            await context.abort(profile.error_code, f"Mock error in {method.name}")
+
+        return response
+
+    return grpc.unary_unary_rpc_method_handler(
+        handle,
+        request_deserializer=GetMessageClass(method.input_type).FromString,
+        response_serializer=None
+    )
+
+
+def build_mock_servicer(
+        service: ServiceDescriptor,
+        config: MockConfig,
+        rng: random.Random
+) -> grpc.GenericRpcHandler:
+    """
+    Создаёт servicer заглушки для всех методов сервиса.
+
+    :param service: Дескриптор сервиса, например: UsersGatewayService из users_gateway_service_pb2.
+    :param config: Настройки заглушек.
+    :param rng: Генератор случайных чисел заглушки.
+    """
+    return grpc.method_handlers_generic_handler(
+        service.full_name,
+        {
+            method.name: build_mock_method_handler(method, config.get_profile(service.full_name, method.name), rng)
+            for method in service.methods
+        }
+    )
+
+
+def build_mock_grpc_server(
+        address: str,
+        services: list[ServiceDescriptor],
+        config: MockConfig,
+        rng: random.Random
+) -> grpc.aio.Server:
+    """
+    Создаёт асинхронный gRPC-сервер с заглушками сервисов.
+
+    Задержки выдерживаются через asyncio.sleep, а не в пуле потоков: медленные ответы не ограничивают
+    количество одновременных запросов.
+
+    :param address: Адрес сервера, например: "localhost:9003".
+    :param services: Дескрипторы сервисов (см. mocks.payloads.get_service_descriptors).
+    :param config: Настройки заглушек.
+    :param rng: Генератор случайных чисел заглушки.
+    """
+    # SO_REUSEPORT: несколько процессов заглушки делят один порт (см. опцию --processes)
+    server = grpc.aio.server(options=[("grpc.so_reuseport", 1)])
+    server.add_generic_rpc_handlers([build_mock_servicer(service, config, rng) for service in services])
+    server.add_insecure_port(address)
+    return server
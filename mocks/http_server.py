@@ -0,0 +1,173 @@
+import asyncio
+import json
+import random
+import re
+import socket
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from google.protobuf.descriptor import ServiceDescriptor
+
+from mocks.payloads import build_mock_message, message_to_gateway_dict
+from mocks.profiles import MockConfig, MockProfile
+
+# Маршруты http-gateway: (HTTP-метод, шаблон пути, gRPC-сервис, метод) — ответ маршрута строится
+# из ответа соответствующего метода grpc-gateway, поэтому HTTP- и gRPC-заглушки отдают одни и те же данные
+MOCK_HTTP_ROUTES = (
+    ("GET", "/api/v1/users/{user_id}", "UsersGatewayService", "GetUser"),
+    ("POST", "/api/v1/users", "UsersGatewayService", "CreateUser"),
+    ("GET", "/api/v1/accounts", "AccountsGatewayService", "GetAccounts"),
+    ("POST", "/api/v1/accounts/open-deposit-account", "AccountsGatewayService", "OpenDepositAccount"),
+    ("POST", "/api/v1/accounts/open-savings-account", "AccountsGatewayService", "OpenSavingsAccount"),
+    ("POST", "/api/v1/accounts/open-debit-card-account", "AccountsGatewayService", "OpenDebitCardAccount"),
+    ("POST", "/api/v1/accounts/open-credit-card-account", "AccountsGatewayService", "OpenCreditCardAccount"),
+    ("POST", "/api/v1/cards/issue-virtual-card", "CardsGatewayService", "IssueVirtualCard"),
+    ("POST", "/api/v1/cards/issue-physical-card", "CardsGatewayService", "IssuePhysicalCard"),
+    ("GET", "/api/v1/documents/tariff-document/{account_id}", "DocumentsGatewayService", "GetTariffDocument"),
+    ("GET", "/api/v1/documents/contract-document/{account_id}", "DocumentsGatewayService", "GetContractDocument"),
+    ("GET", "/api/v1/operations", "OperationsGatewayService", "GetOperations"),
+    ("GET", "/api/v1/operations/operations-summary", "OperationsGatewayService", "GetOperationsSummary"),
+    ("GET", "/api/v1/operations/operation-receipt/{operation_id}", "OperationsGatewayService", "GetOperationReceipt"),
+    ("GET", "/api/v1/operations/{operation_id}", "OperationsGatewayService", "GetOperation"),
+    ("POST", "/api/v1/operations/make-fee-operation", "OperationsGatewayService", "MakeFeeOperation"),
+    ("POST", "/api/v1/operations/make-top-up-operation", "OperationsGatewayService", "MakeTopUpOperation"),
+    ("POST", "/api/v1/operations/make-cashback-operation", "OperationsGatewayService", "MakeCashbackOperation"),
+    ("POST", "/api/v1/operations/make-transfer-operation", "OperationsGatewayService", "MakeTransferOperation"),
+    ("POST", "/api/v1/operations/make-purchase-operation", "OperationsGatewayService", "MakePurchaseOperation"),
+    ("POST", "/api/v1/operations/make-bill-payment-operation", "OperationsGatewayService", "MakeBillPaymentOperation"),
+    (
+        "POST",
+        "/api/v1/operations/make-cash-withdrawal-operation",
+        "OperationsGatewayService",
+        "MakeCashWithdrawalOperation"
+    ),
+)
+
+
+def build_http_response(status: int, body: dict) -> bytes:
+    """
+    Возвращает HTTP/1.1-ответ с JSON-телом целиком (статус, заголовки и тело).
+    """
+    content = json.dumps(body).encode()
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(content)}\r\n\r\n"
+    )
+    return head.encode() + content
+
+
+@dataclass(slots=True, frozen=True)
+class MockHTTPRoute:
+    """
+    Маршрут заглушки http-gateway с заранее собранными ответами.
+    """
+    method: str
+    pattern: re.Pattern
+    profile: MockProfile
+    response: bytes
+    error_response: bytes
+
+
+# Ответ на запрос к неизвестному маршруту
+MOCK_HTTP_NOT_FOUND = build_http_response(404, {"code": 5, "message": "Not Found", "details": []})
+
+
+def build_mock_http_routes(services: list[ServiceDescriptor], config: MockConfig) -> list[MockHTTPRoute]:
+    """
+    Строит маршруты заглушки http-gateway.
+
+    :param services: Дескрипторы сервисов, среди которых есть сервисы grpc-gateway.
+    :param config: Настройки заглушек (профиль маршрута — профиль соответствующего gRPC-метода).
+    """
+    services_by_name = {service.name: service for service in services}
+
+    routes = []
+    for http_method, template, service_name, method_name in MOCK_HTTP_ROUTES:
+        service = services_by_name[service_name]
+        profile = config.get_profile(service.full_name, method_name)
+        message = build_mock_message(service.methods_by_name[method_name].output_type, profile)
+        routes.append(
+            MockHTTPRoute(
+                method=http_method,
+                pattern=re.compile(re.sub(r"\{\w+}", "[^/]+", template) + "/?$"),
+                profile=profile,
+                response=build_http_response(200, message_to_gateway_dict(message)),
+                # Тело ошибки в формате grpc-gateway
+                error_response=build_http_response(
+                    profile.http_status,
+                    {"code": profile.error_code.value[0], "message": f"Mock error in {method_name}", "details": []}
+                )
+            )
+        )
+
+    return routes
+
+
+class MockHTTPServer:
+    """
+    Заглушка http-gateway на asyncio: HTTP/1.1 с keep-alive, один цикл событий на процесс.
+
+    Разбирается только то, что нужно для ответа: строка запроса, Content-Length и Connection,
+    тело запроса вычитывается и отбрасывается.
+    """
+
+    def __init__(self, routes: list[MockHTTPRoute], rng: random.Random):
+        """
+        :param routes: Маршруты (см. build_mock_http_routes).
+        :param rng: Генератор случайных чисел заглушки.
+        """
+        self.routes = routes
+        self.rng = rng
+
+    def get_route(self, method: str, path: str) -> MockHTTPRoute | None:
+        for route in self.routes:
+            if route.method == method and route.pattern.match(path):
+                return route
+
+        return None
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обслуживает запросы одного соединения, пока клиент его не закроет.
+        """
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+
+                length, keep_alive = 0, True
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    name = name.lower()
+                    if name == "content-length":
+                        length = int(value)
+                    elif name == "connection":
+                        keep_alive = value.strip().lower() != "close"
+
+                if length:
+                    await reader.readexactly(length)
+
+                route = self.get_route(method, target.split("?", 1)[0])
+                if route is None:
+                    writer.write(MOCK_HTTP_NOT_FOUND)
+                elif await route.profile.simulate(self.rng):
+                    writer.write(route.error_response)
+                else:
+                    writer.write(route.response)
+
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """
+        Запускает сервер (несколько процессов заглушки делят порт через SO_REUSEPORT).
+        """
+        return await asyncio.start_server(self.handle_connection, host, port, reuse_port=True)
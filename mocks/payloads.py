@@ -0,0 +1,120 @@
+import importlib
+import pkgutil
+import re
+import uuid
+from base64 import b64encode
+
+from google.protobuf.descriptor import Descriptor, FieldDescriptor, ServiceDescriptor
+from google.protobuf.message import Message
+from google.protobuf.message_factory import GetMessageClass
+
+import contracts.services
+from mocks.profiles import MockProfile
+
+# Суффикс сгенерированных модулей с описанием сервиса: users_service_pb2, users_gateway_service_pb2
+SERVICE_MODULE_SUFFIX = "_service_pb2"
+
+
+def get_service_descriptors(package=contracts.services) -> list[ServiceDescriptor]:
+    """
+    Находит все gRPC-сервисы в сгенерированных контрактах: grpc-gateway (contracts/services/gateway/*)
+    и внутренние сервисы (contracts/services/users, contracts/services/documents/tariffs и т. д.).
+
+    :param package: Пакет, в котором искать модули *_service_pb2.
+    :return: Дескрипторы сервисов.
+    """
+    services = []
+    for module in pkgutil.walk_packages(package.__path__, prefix=f"{package.__name__}."):
+        if module.ispkg or not module.name.endswith(SERVICE_MODULE_SUFFIX):
+            continue
+
+        services.extend(importlib.import_module(module.name).DESCRIPTOR.services_by_name.values())
+
+    return services
+
+
+def build_mock_value(field: FieldDescriptor, profile: MockProfile):
+    """
+    Возвращает правдоподобное значение поля по его типу и имени: идентификаторы — UUID, url — ссылка,
+    *_at — дата и время в ISO 8601 (ответы http-gateway валидируются pydantic-схемами клиентов).
+    """
+    if field.message_type is not None:
+        return build_mock_message(field.message_type, profile)
+    if field.enum_type is not None:
+        # Первое значение после *_UNSPECIFIED
+        return field.enum_type.values[min(1, len(field.enum_type.values) - 1)].number
+    if field.type == FieldDescriptor.TYPE_STRING:
+        if field.name == "id" or field.name.endswith("_id"):
+            return str(uuid.uuid4())
+        if field.name == "email":
+            return "user@example.com"
+        if field.name == "url":
+            return "https://example.com/document.pdf"
+        if field.name.endswith("_at"):
+            return "2025-01-01T12:00:00"
+        return field.name.ljust(profile.string_size, "x")
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return b"mock".ljust(profile.string_size, b"x")
+    if field.type == FieldDescriptor.TYPE_BOOL:
+        return True
+    if field.cpp_type in (FieldDescriptor.CPPTYPE_DOUBLE, FieldDescriptor.CPPTYPE_FLOAT):
+        return 100.0
+
+    return 1
+
+
+def build_mock_message(descriptor: Descriptor, profile: MockProfile) -> Message:
+    """
+    Строит сообщение со всеми заполненными полями.
+
+    :param descriptor: Дескриптор сообщения, например: GetAccountsResponse.DESCRIPTOR.
+    :param profile: Профиль метода: количество элементов повторяющихся полей и длина строк.
+    """
+    message = GetMessageClass(descriptor)()
+    for field in descriptor.fields:
+        if field.is_repeated:
+            container = getattr(message, field.name)
+            for _ in range(profile.repeated_count):
+                value = build_mock_value(field, profile)
+                if field.message_type is not None:
+                    container.add().CopyFrom(value)
+                else:
+                    container.append(value)
+        elif field.message_type is not None:
+            getattr(message, field.name).CopyFrom(build_mock_value(field, profile))
+        else:
+            setattr(message, field.name, build_mock_value(field, profile))
+
+    return message
+
+
+def get_enum_prefix(name: str) -> str:
+    """
+    Возвращает префикс значений enum в proto-контрактах: CardPaymentSystem -> CARD_PAYMENT_SYSTEM_.
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).upper() + "_"
+
+
+def message_to_gateway_dict(message: Message) -> dict:
+    """
+    Преобразует сообщение в JSON-ответ http-gateway: имена полей в camelCase, значения enum без префикса
+    типа (CARD_TYPE_VIRTUAL -> VIRTUAL), bytes — в base64.
+    """
+    def convert(field: FieldDescriptor, value):
+        if field.message_type is not None:
+            return message_to_gateway_dict(value)
+        if field.enum_type is not None:
+            return field.enum_type.values_by_number[value].name.removeprefix(get_enum_prefix(field.enum_type.name))
+        if field.type == FieldDescriptor.TYPE_BYTES:
+            return b64encode(value).decode()
+        return value
+
+    result = {}
+    for field in message.DESCRIPTOR.fields:
+        value = getattr(message, field.name)
+        if field.is_repeated:
+            result[field.json_name] = [convert(field, item) for item in value]
+        else:
+            result[field.json_name] = convert(field, value)
+
+    return result
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field, fields, replace
+from enum import StrEnum
+from pathlib import Path
+
+import grpc
+
+# HTTP-статусы ошибок заглушки http-gateway по кодам gRPC (как их переводит grpc-gateway)
+MOCK_HTTP_STATUSES = {
+    grpc.StatusCode.INVALID_ARGUMENT: 400,
+    grpc.StatusCode.UNAUTHENTICATED: 401,
+    grpc.StatusCode.PERMISSION_DENIED: 403,
+    grpc.StatusCode.NOT_FOUND: 404,
+    grpc.StatusCode.ALREADY_EXISTS: 409,
+    grpc.StatusCode.RESOURCE_EXHAUSTED: 429,
+    grpc.StatusCode.UNAVAILABLE: 503,
+    grpc.StatusCode.DEADLINE_EXCEEDED: 504,
+}
+
+
+class LatencyDistribution(StrEnum):
+    """
+    Распределение задержки ответа заглушки (параметры — в миллисекундах).
+    """
+    FIXED = "fixed"  # Постоянная задержка: fixed:<мс>
+    UNIFORM = "uniform"  # Равномерная: uniform:<от мс>,<до мс>
+    NORMAL = "normal"  # Нормальная, отрицательные значения обрезаются до 0: normal:<среднее мс>,<ст. отклонение мс>
+    LOGNORMAL = "lognormal"  # Логнормальная, с длинным хвостом: lognormal:<медиана мс>,<sigma>
+    EXPONENTIAL = "exponential"  # Экспоненциальная: exponential:<среднее мс>
+
+
+@dataclass(slots=True, frozen=True)
+class Latency:
+    """
+    Задержка ответа: распределение и его параметры в миллисекундах.
+    """
+    distribution: LatencyDistribution = LatencyDistribution.FIXED
+    params: tuple[float, ...] = (0.0,)
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Возвращает случайную задержку в секундах.
+
+        :param rng: Генератор случайных чисел заглушки.
+        """
+        match self.distribution:
+            case LatencyDistribution.FIXED:
+                delay = self.params[0]
+            case LatencyDistribution.UNIFORM:
+                delay = rng.uniform(*self.params)
+            case LatencyDistribution.NORMAL:
+                delay = rng.normalvariate(*self.params)
+            case LatencyDistribution.LOGNORMAL:
+                median, sigma = self.params
+                delay = median * rng.lognormvariate(0.0, sigma) if median else 0.0
+            case LatencyDistribution.EXPONENTIAL:
+                delay = rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+
+        return max(delay, 0.0) / 1000
+
+
+# Количество параметров каждого распределения
+LATENCY_PARAMS = {
+    LatencyDistribution.FIXED: 1,
+    LatencyDistribution.UNIFORM: 2,
+    LatencyDistribution.NORMAL: 2,
+    LatencyDistribution.LOGNORMAL: 2,
+    LatencyDistribution.EXPONENTIAL: 1,
+}
+
+
+def parse_latency(value: str) -> Latency:
+    """
+    Разбирает задержку из строки вида "lognormal:20,0.5" (число без распределения — постоянная задержка).
+
+    :param value: Задержка в формате `<распределение>:<параметры через запятую>`.
+    :return: Задержка.
+    :raises ValueError: Если распределение неизвестно или у него другое количество параметров.
+    """
+    distribution, _, params = value.strip().rpartition(":")
+    latency = Latency(
+        distribution=LatencyDistribution(distribution or LatencyDistribution.FIXED),
+        params=tuple(float(param) for param in params.split(","))
+    )
+    if len(latency.params) != LATENCY_PARAMS[latency.distribution]:
+        raise ValueError(f"Latency {latency.distribution} expects {LATENCY_PARAMS[latency.distribution]} params")
+
+    return latency
+
+
+@dataclass(slots=True, frozen=True)
+class MockProfile:
+    """
+    Поведение метода заглушки.
+
+    :param latency: Задержка ответа.
+    :param error_rate: Доля ответов с ошибкой (0.0 — 1.0).
+    :param error_code: Код ошибки gRPC (HTTP-заглушка отвечает соответствующим статусом, см. MOCK_HTTP_STATUSES).
+    :param repeated_count: Количество элементов в повторяющихся полях ответа (списки операций и т. п.).
+    :param string_size: Минимальная длина строковых полей ответа без формата (имена, номера, описания);
+                        идентификаторы, email, ссылки и даты не меняются — их проверяют схемы клиентов.
+    """
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0
+    error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE
+    repeated_count: int = 1
+    string_size: int = 0
+
+    @property
+    def http_status(self) -> int:
+        return MOCK_HTTP_STATUSES.get(self.error_code, 500)
+
+    async def simulate(self, rng: random.Random) -> bool:
+        """
+        Выдерживает задержку ответа и разыгрывает ошибку.
+
+        :param rng: Генератор случайных чисел заглушки.
+        :return: True, если метод должен ответить ошибкой.
+        """
+        delay = self.latency.sample(rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        return bool(self.error_rate) and rng.random() < self.error_rate
+
+
+def parse_profile_options(options: dict) -> dict:
+    """
+    Приводит опции профиля из JSON к типам MockProfile: "latency" — строка parse_latency,
+    "error_code" — имя кода gRPC ("UNAVAILABLE").
+
+    :raises ValueError: Если опция неизвестна.
+    """
+    known = {item.name for item in fields(MockProfile)}
+    unknown = set(options) - known
+    if unknown:
+        raise ValueError(f"Unknown mock profile options: {', '.join(sorted(unknown))}")
+
+    parsed = dict(options)
+    if "latency" in parsed:
+        parsed["latency"] = parse_latency(str(parsed["latency"]))
+    if "error_code" in parsed:
+        parsed["error_code"] = grpc.StatusCode[parsed["error_code"]]
+
+    return parsed
+
+
+@dataclass(slots=True, frozen=True)
+class MockConfig:
+    """
+    Настройки заглушек: профиль по умолчанию и профили отдельных сервисов и методов.
+
+    Ключ профиля — "Service/Method", "Service" или полное имя "package.Service/Method",
+    например: "OperationsGatewayService/GetOperations".
+    """
+    default: MockProfile = field(default_factory=MockProfile)
+    methods: dict[str, MockProfile] = field(default_factory=dict)
+
+    def get_profile(self, service: str, method: str) -> MockProfile:
+        """
+        Возвращает профиль метода: самый точный из заданных ключей или профиль по умолчанию.
+
+        :param service: Полное имя сервиса, например: "contracts.services.gateway.users.UsersGatewayService".
+        :param method: Имя метода, например: "GetUser".
+        """
+        name = service.rsplit(".", 1)[-1]
+        for key in (f"{service}/{method}", f"{name}/{method}", service, name):
+            if key in self.methods:
+                return self.methods[key]
+
+        return self.default
+
+    @classmethod
+    def load(cls, path: str | Path, **overrides) -> "MockConfig":
+        """
+        Загружает настройки из JSON-файла вида:
+
+            {
+                "default": {"latency": "lognormal:5,0.5", "error_rate": 0.001},
+                "methods": {"OperationsGatewayService/GetOperations": {"repeated_count": 50}}
+            }
+
+        Профили методов дополняют профиль по умолчанию, а не заменяют его целиком.
+
+        :param path: Путь к файлу.
+        :param overrides: Опции, которые важнее файла (заданные в командной строке).
+        """
+        data = json.loads(Path(path).read_text())
+        profile = replace(MockProfile(), **{**parse_profile_options(data.get("default", {})), **overrides})
+        return cls(
+            default=profile,
+            methods={
+                key: replace(profile, **{**parse_profile_options(options), **overrides})
+                for key, options in data.get("methods", {}).items()
+            }
+        )
@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import logging
+import random
+
+from mocks.grpc_server import build_mock_grpc_server
+from mocks.http_server import MockHTTPServer, build_mock_http_routes
+from mocks.payloads import get_service_descriptors
+from mocks.profiles import MockConfig
+
+# Порты по умолчанию — как у http-gateway и grpc-gateway в клиентах (GATEWAY_HTTP_URL, GATEWAY_GRPC_TARGET)
+MOCK_HTTP_PORT = 8003
+MOCK_GRPC_PORT = 9003
+
+
+async def serve(args: argparse.Namespace, config: MockConfig, index: int) -> None:
+    """
+    Запускает gRPC- и HTTP-заглушки в одном цикле событий и работает до остановки процесса.
+
+    :param index: Номер процесса заглушки (входит в seed генератора случайных чисел).
+    """
+    rng = random.Random(None if args.seed is None else f"{args.seed}:{index}")
+    services = get_service_descriptors()
+
+    grpc_server = build_mock_grpc_server(f"{args.host}:{args.grpc_port}", services, config, rng)
+    await grpc_server.start()
+
+    http_server = await MockHTTPServer(build_mock_http_routes(services, config), rng).start(args.host, args.http_port)
+    logging.info(
+        "Mock gateway #%d: http://%s:%d, grpc %s:%d (%d gRPC services)",
+        index, args.host, args.http_port, args.host, args.grpc_port, len(services)
+    )
+
+    try:
+        await http_server.serve_forever()
+    finally:
+        await grpc_server.stop(grace=None)
+
+
+def run(args: argparse.Namespace, config: MockConfig, index: int) -> None:
+    """
+    Точка входа процесса заглушки (в том числе дочерних процессов --processes).
+    """
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(args, config, index))
+    except KeyboardInterrupt:
+        pass
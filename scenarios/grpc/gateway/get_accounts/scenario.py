@@ -1,56 +1,57 @@
+from dataclasses import dataclass
+
 from locust import User, between, task
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
-from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
-from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from clients.context import ScenarioContext
+from seeds.locust import get_seeds_id_store
+from tools.load_shapes import ArrivalRateShape, arrival_rate
+
+
+@dataclass(slots=True)
+class GetAccountsContext(ScenarioContext):
+    """
+    Состояние сценария получения счетов: только идентификатор пользователя.
+    """
+    user_id: str = ""
 
 
 class GetAccountsTaskSet(GatewayGRPCTaskSet):
     """
-    Нагрузочный сценарий, который последовательно:
-    1. Создаёт нового пользователя.
-    2. Открывает депозитный счёт.
-    3. Получает счета пользователя.
+    Нагрузочный сценарий получения счетов пользователя.
+
+    Пользователь со счётом создаётся заранее на этапе подготовки данных (см. seeds),
+    поэтому в измеряемую нагрузку попадает только чтение счетов.
 
     Использует базовый GatewayGRPCTaskSet и уже созданных в нём API клиентов.
     """
-    create_user_response: CreateUserResponse | None = None
-    open_deposit_account_response: OpenDepositAccountResponse | None = None
-    user_id: str | None = None
+    context_class = GetAccountsContext
+    context: GetAccountsContext
 
-    @task(2)
-    def create_user(self):
+    def on_start(self) -> None:
         """
-        Создаём нового пользователя и сохраняем результат для последующих шагов.
+        Берём для виртуального пользователя заранее созданного пользователя из хранилища идентификаторов.
         """
-        self.create_user_response = self.users_gateway_client.create_user()
-        self.user_id = self.create_user_response.user.id
+        super().on_start()
+        self.context.user_id = get_seeds_id_store(self.user.environment).next_user().user_id
 
-    @task(2)
-    def open_deposit_account(self):
-        """
-        Открываем депозитный счёт для созданного пользователя.
-        Проверяем, что пользователь был успешно создан.
-        """
-        if not self.user_id:
-            return
-
-        self.open_deposit_account_response = self.accounts_gateway_client.open_deposit_account(self.user_id)
-
-    @task(6)
+    @task
     def get_accounts(self):
         """
-        Получаем счета, если пользователь был успешно создан.
+        Получаем счета пользователя.
         """
-        if not self.user_id:
-            return
-
-        self.accounts_gateway_client.get_accounts(self.user_id)
+        self.accounts_gateway_client.get_accounts(self.context.user_id)
 
 
 class GetAccountsScenarioUser(User):
     """
-    Пользователь Locust, исполняющий последовательный сценарий получения счетов.
+    Пользователь Locust, исполняющий сценарий получения счетов.
     """
     host = "localhost"
     tasks = [GetAccountsTaskSet]
-    wait_time = between(1, 3)
+    wait_time = arrival_rate(between(1, 3))
+
+
+class GetAccountsLoadShape(ArrivalRateShape):
+    """
+    Форма нагрузки сценария получения счетов: модель нагрузки и интенсивность задаются в conf-файле.
+    """
@@ -1,59 +1,53 @@
+from dataclasses import dataclass
+
 from locust import User, between, task
 
-# Импортируем схемы ответов, чтобы типизировать shared state
-from clients.http.gateway.accounts.schema import OpenSavingsAccountResponseSchema
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
-from clients.http.gateway.users.schema import CreateUserResponseSchema
+from clients.context import ScenarioContext
+from seeds.locust import get_seeds_id_store
+from tools.load_shapes import ArrivalRateShape, arrival_rate
+
+
+@dataclass(slots=True)
+class GetDocumentsContext(ScenarioContext):
+    """
+    Состояние сценария получения документов: только идентификатор счёта.
+    """
+    account_id: str = ""
 
 
 class GetDocumentsSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     """
-    Нагрузочный сценарий, который последовательно:
-    1. Создаёт нового пользователя.
-    2. Открывает сберегательный счёт.
-    3. Получает документы по счёту (тариф и контракт).
+    Нагрузочный сценарий, который последовательно получает документы по счёту (тариф и контракт).
+
+    Пользователь и счёт создаются заранее на этапе подготовки данных (см. seeds),
+    поэтому в измеряемую нагрузку попадает только чтение документов.
 
     Использует базовый GatewayHTTPSequentialTaskSet и уже созданных в нём API клиентов.
     """
+    context_class = GetDocumentsContext
+    context: GetDocumentsContext
 
-    # Shared state — сохраняем результаты запросов для дальнейшего использования
-    create_user_response: CreateUserResponseSchema | None = None
-    open_savings_account_response: OpenSavingsAccountResponseSchema | None = None
-
-    @task
-    def create_user(self):
+    def on_start(self) -> None:
         """
-        Создаём нового пользователя и сохраняем результат для последующих шагов.
+        Берём для виртуального пользователя заранее созданный счёт из хранилища идентификаторов.
         """
-        self.create_user_response = self.users_gateway_client.create_user()
+        super().on_start()
+        self.context.account_id = get_seeds_id_store(self.user.environment).next_user().account_id
 
     @task
-    def open_savings_account(self):
+    def get_tariff_document(self):
         """
-        Открываем сберегательный счёт для созданного пользователя.
-        Проверяем, что предыдущий шаг был успешным.
+        Получаем документ тарифа по счёту.
         """
-        if not self.create_user_response:
-            return  # Если пользователь не был создан, нет смысла продолжать
-
-        self.open_savings_account_response = self.accounts_gateway_client.open_savings_account(
-            user_id=self.create_user_response.user.id
-        )
+        self.documents_gateway_client.get_tariff_document(account_id=self.context.account_id)
 
     @task
-    def get_documents(self):
+    def get_contract_document(self):
         """
-        Получаем документы, если счёт был успешно открыт.
+        Получаем документ контракта по счёту.
         """
-        if not self.open_savings_account_response:
-            return  # Если счёт не открыт, запрос документов невозможен
-
-        self.documents_gateway_client.get_tariff_document(
-            account_id=self.open_savings_account_response.account.id
-        )
-        self.documents_gateway_client.get_contract_document(
-            account_id=self.open_savings_account_response.account.id
-        )
+        self.documents_gateway_client.get_contract_document(account_id=self.context.account_id)
 
 
 class GetDocumentsScenarioUser(User):
@@ -62,4 +56,10 @@ class GetDocumentsScenarioUser(User):
     """
     host = "localhost"
     tasks = [GetDocumentsSequentialTaskSet]
-    wait_time = between(1, 3)  # Имитируем паузы между выполнением сценариев
+    wait_time = arrival_rate(between(1, 3))  # Паузы закрытой модели или расписание открытой (load-shape в conf)
+
+
+class GetDocumentsLoadShape(ArrivalRateShape):
+    """
+    Форма нагрузки сценария получения документов: модель нагрузки и интенсивность задаются в conf-файле.
+    """
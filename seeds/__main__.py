@@ -0,0 +1,35 @@
+import argparse
+import logging
+
+from seeds.builder import SEEDS_BUILDER_WORKERS, build_seeds_builder
+from seeds.dataset import SEEDS_DATASET_FILE, SeedsDataset
+from seeds.id_store import SEEDS_ID_STORE_FILE
+
+
+def main() -> None:
+    """
+    Создаёт датасет сущностей для нагрузочных сценариев:
+
+        python -m seeds --users 1000 --workers 32 --file ./dataset/seeds.db --ids-file ./dataset/seeds.ids
+
+    Кроме SQLite-датасета выгружает идентификаторы в memory-mapped хранилище, из которого читают сценарии.
+    """
+    parser = argparse.ArgumentParser(description="Подготовка пользователей, счетов и карт для нагрузочных тестов")
+    parser.add_argument("--users", type=int, required=True, help="Количество создаваемых пользователей")
+    parser.add_argument("--workers", type=int, default=SEEDS_BUILDER_WORKERS, help="Количество параллельных потоков")
+    parser.add_argument("--file", type=str, default=str(SEEDS_DATASET_FILE), help="Файл датасета")
+    parser.add_argument("--ids-file", type=str, default=str(SEEDS_ID_STORE_FILE), help="Файл хранилища идентификаторов")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    dataset = SeedsDataset(args.file)
+    dataset.save(build_seeds_builder().build(args.users, workers=args.workers))
+    logging.info("Seeds dataset saved to %s (%d users)", dataset.path, dataset.count())
+
+    exported = dataset.export_id_store(args.ids_file)
+    logging.info("Seeds ID store saved to %s (%d records)", args.ids_file, exported)
+
+
+if __name__ == "__main__":
+    main()
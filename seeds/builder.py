@@ -0,0 +1,85 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from seeds.schema import SeedUserSchema
+
+logger = logging.getLogger(__name__)
+
+# Количество параллельных потоков создания сущностей по умолчанию
+SEEDS_BUILDER_WORKERS = 32
+
+
+class SeedsBuilder:
+    """
+    Создаёт сущности для нагрузочных сценариев через существующие API клиенты http-gateway.
+
+    Для каждой записи создаётся пользователь, открывается дебетовый счёт и берётся карта счёта
+    (если карта не выпущена автоматически — выпускается виртуальная). Сущности создаются параллельно
+    в пуле потоков, запросы не попадают в метрики Locust.
+    """
+
+    def __init__(self,
+                 users_client: UsersGatewayHTTPClient,
+                 accounts_client: AccountsGatewayHTTPClient,
+                 cards_client: CardsGatewayHTTPClient):
+        self.users_client = users_client
+        self.accounts_client = accounts_client
+        self.cards_client = cards_client
+
+    def build_user(self) -> SeedUserSchema:
+        """
+        Создаёт одного пользователя со счётом и картой.
+
+        :return: Идентификаторы созданных сущностей.
+        """
+        user = self.users_client.create_user().user
+        account = self.accounts_client.open_debit_card_account(user.id).account
+
+        if account.cards:
+            card_id = account.cards[0].id
+        else:
+            card_id = self.cards_client.issue_virtual_card(user_id=user.id, account_id=account.id).card.id
+
+        return SeedUserSchema.model_construct(user_id=user.id, account_id=account.id, card_id=card_id)
+
+    def build(self, count: int, workers: int = SEEDS_BUILDER_WORKERS) -> list[SeedUserSchema]:
+        """
+        Параллельно создаёт `count` пользователей со счетами и картами.
+
+        :param count: Количество создаваемых пользователей.
+        :param workers: Количество параллельных потоков.
+        :return: Созданные сущности.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.build_user) for _ in range(count)]
+
+        users: list[SeedUserSchema] = []
+        for future in futures:
+            try:
+                users.append(future.result())
+            except Exception as error:
+                logger.warning("Failed to seed user: %s", error)
+
+        logger.info("Seeded %d of %d users", len(users), count)
+        return users
+
+
+def build_seeds_builder() -> SeedsBuilder:
+    """
+    Создаёт SeedsBuilder поверх обычных (без метрик Locust) HTTP клиентов http-gateway.
+
+    Все три API клиента используют один httpx.Client и общий пул соединений.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    client = build_gateway_http_client()
+
+    return SeedsBuilder(
+        users_client=UsersGatewayHTTPClient(client=client),
+        accounts_client=AccountsGatewayHTTPClient(client=client),
+        cards_client=CardsGatewayHTTPClient(client=client)
+    )
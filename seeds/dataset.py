@@ -0,0 +1,104 @@
+import os
+import sqlite3
+from pathlib import Path
+
+from seeds.id_store import write_id_store
+from seeds.schema import SeedUserSchema
+
+# Файл датасета по умолчанию
+SEEDS_DATASET_FILE = Path("./dataset/seeds.db")
+
+
+class SeedsDataset:
+    """
+    Компактное хранилище идентификаторов заранее созданных сущностей на диске (SQLite).
+
+    Идентификаторы хранятся в одной таблице в порядке создания. Нагрузочные сценарии читают не сам датасет,
+    а выгруженное из него memory-mapped хранилище идентификаторов (см. `export_id_store` и IDStore).
+    """
+
+    def __init__(self, path: Path | str = SEEDS_DATASET_FILE):
+        """
+        :param path: Путь к файлу SQLite.
+        """
+        self.path = Path(path)
+        self._users: list[SeedUserSchema] | None = None
+
+    def connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "id INTEGER PRIMARY KEY, user_id TEXT NOT NULL, account_id TEXT NOT NULL, card_id TEXT NOT NULL)"
+        )
+        return connection
+
+    def exists(self) -> bool:
+        """
+        Проверяет, что файл датасета существует и в нём есть записи.
+        """
+        return self.path.exists() and self.count() > 0
+
+    def count(self) -> int:
+        """
+        Возвращает количество записей в датасете.
+        """
+        with self.connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def save(self, users: list[SeedUserSchema]) -> None:
+        """
+        Перезаписывает датасет новыми записями.
+
+        :param users: Созданные сущности.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as connection:
+            connection.execute("DELETE FROM users")
+            connection.executemany(
+                "INSERT INTO users (user_id, account_id, card_id) VALUES (?, ?, ?)",
+                [(user.user_id, user.account_id, user.card_id) for user in users]
+            )
+        self._users = None
+
+    def load(self) -> list[SeedUserSchema]:
+        """
+        Загружает все записи датасета в память.
+
+        :return: Список сущностей в порядке создания.
+        """
+        if self._users is None:
+            with self.connect() as connection:
+                rows = connection.execute("SELECT user_id, account_id, card_id FROM users ORDER BY id").fetchall()
+
+            self._users = [
+                SeedUserSchema.model_construct(user_id=user_id, account_id=account_id, card_id=card_id)
+                for user_id, account_id, card_id in rows
+            ]
+
+        return self._users
+
+    def export_id_store(self, path: Path | str) -> int:
+        """
+        Выгружает идентификаторы датасета в memory-mapped хранилище (см. IDStore).
+
+        Время изменения хранилища выставляется равным времени изменения датасета: по их несовпадению
+        `is_id_store_stale` узнаёт, что датасет пересоздан или хранилище выгружено из другого датасета.
+
+        :param path: Путь к файлу хранилища.
+        :return: Количество выгруженных записей.
+        """
+        exported = write_id_store(path, self.load())
+
+        modified = self.path.stat().st_mtime_ns
+        os.utime(path, ns=(modified, modified))
+        return exported
+
+    def is_id_store_stale(self, path: Path | str) -> bool:
+        """
+        Проверяет, что хранилище идентификаторов нужно выгрузить заново: его нет или оно выгружено
+        не из текущей версии этого датасета.
+
+        :param path: Путь к файлу хранилища.
+        """
+        path = Path(path)
+        return not path.exists() or path.stat().st_mtime_ns != self.path.stat().st_mtime_ns
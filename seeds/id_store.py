@@ -0,0 +1,135 @@
+import mmap
+import random
+import struct
+import uuid
+from itertools import count
+from pathlib import Path
+from typing import Iterable
+
+from seeds.schema import SeedUserSchema
+
+# Файл хранилища идентификаторов по умолчанию
+SEEDS_ID_STORE_FILE = Path("./dataset/seeds.ids")
+
+# Заголовок файла: сигнатура формата и количество записей
+ID_STORE_MAGIC = b"SEEDIDS1"
+ID_STORE_HEADER = struct.Struct("<8sQ")
+
+# Запись: user_id, account_id и card_id — по 16 байт (бинарное представление UUID)
+ID_STORE_RECORD_SIZE = 16 * 3
+
+# Доля золотого сечения: смещения воркеров по кругу равномерно распределяются при любом их количестве
+GOLDEN_RATIO_FRACTION = 0.6180339887498949
+
+
+def write_id_store(path: Path | str, users: Iterable[SeedUserSchema]) -> int:
+    """
+    Записывает идентификаторы сущностей в компактный бинарный файл хранилища.
+
+    :param path: Путь к файлу хранилища.
+    :param users: Сущности (идентификаторы должны быть UUID).
+    :return: Количество записанных записей.
+    """
+    records = bytearray()
+    for user in users:
+        records += uuid.UUID(user.user_id).bytes
+        records += uuid.UUID(user.account_id).bytes
+        records += uuid.UUID(user.card_id).bytes
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Пишем во временный файл и атомарно подменяем, чтобы читающие процессы не увидели файл наполовину
+    temporary_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(ID_STORE_HEADER.pack(ID_STORE_MAGIC, len(records) // ID_STORE_RECORD_SIZE))
+        file.write(records)
+    temporary_path.replace(path)
+
+    return len(records) // ID_STORE_RECORD_SIZE
+
+
+class IDStore:
+    """
+    Хранилище идентификаторов заранее созданных сущностей в memory-mapped файле.
+
+    Каждая запись — три UUID (user_id, account_id, card_id) по 16 байт, доступ к записи по индексу — O(1).
+    Файл отображается в память только для чтения, поэтому несколько процессов-воркеров Locust на одной машине
+    делят одни и те же страницы памяти, а не держат каждый свою копию датасета.
+    """
+
+    def __init__(self, path: Path | str = SEEDS_ID_STORE_FILE, offset: int = 0):
+        """
+        :param path: Путь к файлу хранилища.
+        :param offset: Начальная позиция выборки по кругу (например, своя для каждого воркера).
+        :raises ValueError: Если файл не является хранилищем идентификаторов.
+        """
+        self.path = Path(path)
+
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count = ID_STORE_HEADER.unpack_from(self._mmap, 0)
+        if magic != ID_STORE_MAGIC:
+            raise ValueError(f"{self.path} is not a seeds ID store")
+
+        self._cursor = count(offset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_user(self, index: int) -> SeedUserSchema:
+        """
+        Возвращает сущность по индексу (по кругу, если индекс больше размера хранилища).
+
+        :param index: Индекс записи.
+        :return: Идентификаторы сущности.
+        :raises LookupError: Если хранилище пусто.
+        """
+        if not self._count:
+            raise LookupError(f"Seeds ID store {self.path} is empty, run `python -m seeds` first")
+
+        start = ID_STORE_HEADER.size + (index % self._count) * ID_STORE_RECORD_SIZE
+        record = self._mmap[start:start + ID_STORE_RECORD_SIZE]
+
+        return SeedUserSchema.model_construct(
+            user_id=str(uuid.UUID(bytes=record[:16])),
+            account_id=str(uuid.UUID(bytes=record[16:32])),
+            card_id=str(uuid.UUID(bytes=record[32:]))
+        )
+
+    def seek(self, offset: int) -> None:
+        """
+        Переставляет позицию выборки по кругу.
+
+        :param offset: Индекс записи, с которой продолжится `next_user`.
+        """
+        self._cursor = count(offset)
+
+    def next_user(self) -> SeedUserSchema:
+        """
+        Возвращает очередную сущность по кругу, начиная со смещения хранилища.
+        """
+        return self.get_user(next(self._cursor))
+
+    def random_user(self, rng: random.Random | None = None) -> SeedUserSchema:
+        """
+        Возвращает случайную сущность.
+
+        :param rng: Генератор случайных чисел (например, сидированный генератор виртуального пользователя).
+        """
+        return self.get_user((rng or random).randrange(max(self._count, 1)))
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def get_worker_offset(worker_index: int, size: int) -> int:
+    """
+    Возвращает начальную позицию выборки по кругу для воркера: воркеры начинают с разных,
+    равномерно разнесённых по хранилищу записей и не выдают одни и те же сущности одновременно.
+
+    :param worker_index: Номер воркера.
+    :param size: Количество записей в хранилище.
+    """
+    return int(worker_index * GOLDEN_RATIO_FRACTION * size) % max(size, 1)
@@ -0,0 +1,100 @@
+import logging
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from seeds.builder import SEEDS_BUILDER_WORKERS, build_seeds_builder
+from seeds.dataset import SEEDS_DATASET_FILE, SeedsDataset
+from seeds.id_store import SEEDS_ID_STORE_FILE, IDStore, get_worker_offset
+from tools.seeding import get_worker_index
+
+# Хранилища идентификаторов, открытые в процессе воркера (по пути к файлу)
+_id_stores: dict[str, IDStore] = {}
+
+logger = logging.getLogger(__name__)
+
+
+def get_seeds_dataset(environment: Environment) -> SeedsDataset:
+    """
+    Возвращает SQLite-датасет заранее созданных сущностей, указанный опцией `--seeds-file`.
+
+    :param environment: Объект окружения Locust.
+    :return: Датасет сущностей.
+    """
+    return SeedsDataset(getattr(environment.parsed_options, "seeds_file", None) or SEEDS_DATASET_FILE)
+
+
+def get_seeds_id_store(environment: Environment) -> IDStore:
+    """
+    Возвращает memory-mapped хранилище идентификаторов, указанное опцией `--seeds-ids-file`.
+
+    Хранилище открывается один раз на процесс и переиспользуется всеми виртуальными пользователями
+    как HTTP, так и gRPC сценариев. Выборка по кругу на каждом воркере начинается со своего смещения.
+
+    :param environment: Объект окружения Locust.
+    :return: Хранилище идентификаторов.
+    """
+    path = str(getattr(environment.parsed_options, "seeds_ids_file", None) or SEEDS_ID_STORE_FILE)
+
+    id_store = _id_stores.get(path)
+    if id_store is None:
+        id_store = _id_stores[path] = IDStore(path)
+        id_store.seek(get_worker_offset(get_worker_index(environment), len(id_store)))
+
+    return id_store
+
+
+@events.init_command_line_parser.add_listener
+def add_seeds_arguments(parser) -> None:
+    """
+    Добавляет опции этапа подготовки данных в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--seeds-file",
+        type=str,
+        env_var="LOCUST_SEEDS_FILE",
+        default=str(SEEDS_DATASET_FILE),
+        help="Файл датасета заранее созданных пользователей, счетов и карт"
+    )
+    parser.add_argument(
+        "--seeds-ids-file",
+        type=str,
+        env_var="LOCUST_SEEDS_IDS_FILE",
+        default=str(SEEDS_ID_STORE_FILE),
+        help="Файл memory-mapped хранилища идентификаторов, из которого читают сценарии"
+    )
+    parser.add_argument(
+        "--seeds-users",
+        type=int,
+        env_var="LOCUST_SEEDS_USERS",
+        default=0,
+        help="Сколько пользователей нужно сценарию: датасет создаётся заново, если в нём их меньше (0 — не создавать)"
+    )
+
+
+@events.init.add_listener
+def build_seeds(environment: Environment, **kwargs) -> None:
+    """
+    Готовит данные до старта нагрузки (на мастере или в локальном запуске, воркеры только читают файлы):
+    создаёт датасет заново, если задана опция `--seeds-users`, а пользователей в датасете меньше
+    (датасет ещё не создан или создан сценарием с меньшим `seeds-users`: иначе хранилище выдавало бы
+    одних и тех же пользователей по кругу нескольким виртуальным пользователям),
+    и выгружает его в хранилище идентификаторов, если хранилища нет или оно выгружено не из этого датасета
+    (датасет пересоздан или `--seeds-file` указывает на другой датасет).
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    dataset = get_seeds_dataset(environment)
+    users_count = getattr(environment.parsed_options, "seeds_users", 0)
+    saved_count = dataset.count() if dataset.path.exists() else 0
+    if users_count and saved_count < users_count:
+        if saved_count:
+            logger.info("Seeds dataset %s has %s of %s users, rebuilding it", dataset.path, saved_count, users_count)
+
+        dataset.save(build_seeds_builder().build(users_count, workers=SEEDS_BUILDER_WORKERS))
+
+    ids_file = getattr(environment.parsed_options, "seeds_ids_file", None) or SEEDS_ID_STORE_FILE
+    if dataset.path.exists() and dataset.is_id_store_stale(ids_file):
+        dataset.export_id_store(ids_file)
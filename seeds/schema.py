@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class SeedUserSchema(BaseModel):
+    """
+    Заранее созданная сущность для нагрузочных сценариев: пользователь, его счёт и карта.
+    """
+    user_id: str = Field(alias="userId")
+    account_id: str = Field(alias="accountId")
+    card_id: str = Field(alias="cardId")
@@ -0,0 +1,60 @@
+import time
+from argparse import Namespace
+from collections import Counter
+
+import gevent
+import pytest
+from locust import SequentialTaskSet, TaskSet, User, constant, events, task
+from locust.env import Environment
+
+from tools.load_shapes import ArrivalRateTaskSetMixin, arrival_rate
+
+# Интенсивность и длительность проверочного профиля constant
+ARRIVAL_RATE = 20
+RUN_TIME = 3
+
+# Моменты начала итераций (первой задачи итерации) по `time.perf_counter()`
+iteration_starts: list[float] = []
+
+
+class SequentialIterationTaskSet(ArrivalRateTaskSetMixin, SequentialTaskSet):
+    @task
+    def first_step(self):
+        iteration_starts.append(time.perf_counter())
+
+    @task
+    def second_step(self):
+        gevent.sleep(0.01)
+
+
+class RandomIterationTaskSet(ArrivalRateTaskSetMixin, TaskSet):
+    @task
+    def single_step(self):
+        iteration_starts.append(time.perf_counter())
+
+
+@pytest.mark.parametrize("task_set", [SequentialIterationTaskSet, RandomIterationTaskSet])
+def test_constant_arrival_rate_starts_iterations_per_second(task_set):
+    """
+    Итераций в секунду запускается ровно `arrival-rate`: без всплеска при старте пользователей
+    и независимо от количества задач в итерации.
+    """
+    class ArrivalRateUser(User):
+        tasks = [task_set]
+        wait_time = arrival_rate(constant(0))
+
+    iteration_starts.clear()
+    environment = Environment(
+        user_classes=[ArrivalRateUser],
+        events=events,
+        parsed_options=Namespace(load_shape="constant", arrival_rate=ARRIVAL_RATE, arrival_stages="", run_time=RUN_TIME)
+    )
+    runner = environment.create_local_runner()
+    start_time = time.perf_counter()
+    runner.start(user_count=10, spawn_rate=100)
+    gevent.sleep(RUN_TIME + 0.5)
+    runner.quit()
+
+    per_second = Counter(int(started - start_time) for started in iteration_starts)
+    assert [per_second[second] for second in range(RUN_TIME)] == pytest.approx([ARRIVAL_RATE] * RUN_TIME, abs=1)
+    assert sum(per_second.values()) == pytest.approx(ARRIVAL_RATE * RUN_TIME, abs=1)
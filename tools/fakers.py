@@ -1,15 +1,254 @@
 from faker import Faker
+import random
 import time
+from contextvars import ContextVar
+from functools import partial
+from itertools import count
+from typing import Any, Callable
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+# Размер буферов пула фейковых данных по умолчанию (значений в каждой колонке)
+FAKE_POOL_SIZE = 10_000
+
+# Сколько значений генерировать за один шаг фонового заполнения, прежде чем отдать управление другим гринлетам
+FAKE_POOL_FILL_CHUNK = 100
+
+# Категории покупок, из которых выбирается случайная категория
+PURCHASE_CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
+
+# Суммы в копейках (от 1.00 до 100.00): пакет сумм выбирается из них одним вызовом random.choices
+AMOUNT_CENTS = range(100, 10_001)
+
+# Генератор случайных чисел фейковых данных текущего виртуального пользователя (у каждого пользователя-гринлета
+# свой, см. Fake.bind_user_random); вне виртуального пользователя значения выбираются генератором воркера
+_user_random: ContextVar[random.Random | None] = ContextVar("user_random", default=None)
+
+# Функция пакетной генерации: принимает количество значений и возвращает список сгенерированных значений
+BatchGenerator = Callable[[int], list[Any]]
+
+
+class FakePool:
+    """
+    Пул заранее сгенерированных фейковых данных.
+
+    Для каждого вида данных (колонки: фамилии, имена, телефоны, суммы, категории, email) хранится буфер
+    фиксированного размера, из которого значения выдаются по кругу (кольцевой буфер) за O(1).
+    Колонки заполняются пакетами (см. BatchGenerator). Пока колонка не заполнена,
+    значения генерируются по одному тем же генератором.
+    """
+
+    def __init__(self, generators: dict[str, BatchGenerator], size: int = FAKE_POOL_SIZE):
+        """
+        :param generators: Функции пакетной генерации значений по именам колонок.
+        :param size: Количество значений в каждой колонке.
+        """
+        self.size = size
+        self.generators = generators
+        self._columns: dict[str, list[Any]] = {}
+        self._cursors: dict[str, int] = {}
+
+    def fill_column(self, name: str, values: list[Any]) -> None:
+        """
+        Подставляет заполненную колонку в пул.
+
+        :param name: Имя колонки.
+        :param values: Сгенерированные значения.
+        """
+        self._columns[name] = values
+        self._cursors[name] = 0
+
+    def fill(self, chunk: int | None = None, yield_control: Callable[[], None] | None = None) -> None:
+        """
+        Заполняет все колонки пула.
+
+        :param chunk: Размер шага заполнения; между шагами вызывается `yield_control`.
+        :param yield_control: Функция, отдающая управление (например, `gevent.sleep(0.001)` в фоновом гринлете).
+        """
+        chunk = chunk or self.size
+        for name, generator in self.generators.items():
+            values: list[Any] = []
+            while len(values) < self.size:
+                values.extend(generator(min(chunk, self.size - len(values))))
+                if yield_control is not None:
+                    yield_control()
+
+            self.fill_column(name, values)
+
+    def next(self, name: str, rng: random.Random | None = None) -> Any:
+        """
+        Возвращает очередное значение колонки: по кругу или, если передан генератор, случайное.
+
+        :param name: Имя колонки.
+        :param rng: Генератор виртуального пользователя: значение выбирается им, а не общим курсором колонки,
+                    поэтому последовательность значений пользователя не зависит от очерёдности гринлетов.
+        :return: Значение из буфера или свежесгенерированное, если колонка ещё не заполнена.
+        """
+        values = self._columns.get(name)
+        if values is None:
+            return self.generators[name](1)[0]
+        if rng is not None:
+            return values[rng.randrange(len(values))]
+
+        cursor = self._cursors[name]
+        self._cursors[name] = cursor + 1 if cursor + 1 < len(values) else 0
+        return values[cursor]
+
 
 class Fake:
     """Класс для генерации случайных тестовых данных с использованием библиотеки Faker"""
 
-    def __init__(self, faker: Faker):
-        """:param faker: Экземпляр класса Faker"""
+    def __init__(self, faker: Faker, seed: int | None = None):
+        """
+        :param faker: Экземпляр класса Faker
+        :param seed: Начальное значение генератора; без него данные каждый запуск разные
+        """
         self.faker = faker
+        self.random = random.Random()
+        self.pool: FakePool | None = None
+        self.seed_value: int | None = None
+        self._email_counter = count()
+
+        if seed is not None:
+            self.seed(seed)
+
+    def seed(self, seed: int) -> None:
+        """
+        Делает генерацию воспроизводимой: при одинаковом seed генерируются одинаковые последовательности данных.
+
+        Сидируются и Faker, и генератор пакетной выборки. Если пул уже включён, он перезаполняется заново.
+        Email остаются уникальными между запусками за счёт префикса времени, поэтому воспроизводится
+        только их часть после префикса.
+
+        :param seed: Начальное значение генератора (например, производное от общего seed и номера воркера).
+        """
+        self.seed_value = seed
+        self.faker.seed_instance(seed)
+        self.random.seed(seed)
+        self._email_counter = count()
+
+        if self.pool is not None:
+            size = self.pool.size
+            self.pool = None
+            self.enable_pool(size=size)
+
+    def batch(self, name: str, size: int) -> list[Any]:
+        """
+        Генерирует пакет значений одного вида.
+
+        Суммы и категории выбираются одним вызовом `random.choices` на пакет;
+        строковые данные (имена, телефоны, email) генерируются сидированным Faker.
+
+        :param name: Вид данных: email, last_name, first_name, phone_number, amount или category.
+        :param size: Количество значений.
+        :return: Список сгенерированных значений.
+        """
+        if name == "amount":
+            return [cents / 100 for cents in self.random.choices(AMOUNT_CENTS, k=size)]
+
+        if name == "category":
+            return self.random.choices(PURCHASE_CATEGORIES, k=size)
+
+        generator = getattr(self.faker, name)
+        return [generator() for _ in range(size)]
+
+    def enable_pool(self, size: int = FAKE_POOL_SIZE, background: bool = False) -> FakePool:
+        """
+        Включает режим пула: значения email, имён, телефонов, сумм и категорий берутся из заранее
+        сгенерированных буферов вместо вызова Faker на каждый запрос. Повторный вызов возвращает уже созданный пул.
+
+        :param size: Количество значений в каждой колонке пула.
+        :param background: Заполнять пул в фоновом гринлете gevent (до заполнения используется Faker напрямую).
+                           При заданном seed пул заполняется сразу в текущем гринлете, чтобы последовательность
+                           была воспроизводимой, но между шагами управление отдаётся циклу событий.
+        :return: Пул фейковых данных.
+        """
+        if self.pool is not None:
+            return self.pool
+
+        names = ("email", "last_name", "first_name", "phone_number", "amount", "category")
+        self.pool = FakePool(
+            generators={name: partial(self.batch, name) for name in names},
+            size=size
+        )
+
+        if not background:
+            self.pool.fill()
+            return self.pool
+
+        import gevent
+
+        # Между шагами спим по таймеру, а не sleep(0): иначе цикл событий не успевает обработать сетевой ввод-вывод
+        # (в том числе heartbeat воркера распределённого запуска)
+        if self.seed_value is None:
+            gevent.spawn(self.pool.fill, FAKE_POOL_FILL_CHUNK, lambda: gevent.sleep(0.001))
+        else:
+            self.pool.fill(FAKE_POOL_FILL_CHUNK, lambda: gevent.sleep(0.001))
+
+        return self.pool
+
+    @staticmethod
+    def bind_user_random(rng: random.Random) -> None:
+        """
+        Привязывает к текущему виртуальному пользователю (гринлету) его генератор фейковых данных.
+
+        Все фейковые данные (из пула и напрямую из Faker) пользователь получает из своего генератора,
+        поэтому при `--seed` каждый пользователь отправляет одни и те же данные от запуска к запуску
+        независимо от того, в каком порядке планируются гринлеты. Исключение — префикс времени в email.
+
+        :param rng: Генератор пользователя (см. tools.seeding.seed_user).
+        """
+        _user_random.set(rng)
+
+    def get_random(self) -> random.Random:
+        """
+        Возвращает генератор текущего виртуального пользователя, а вне пользователя — генератор воркера.
+        """
+        return _user_random.get() or self.random
+
+    def generate(self, name: str, **kwargs) -> Any:
+        """
+        Вызывает генератор Faker на генераторе текущего виртуального пользователя (см. get_random).
+
+        :param name: Имя генератора Faker, например: "last_name".
+        :param kwargs: Параметры генератора.
+        :return: Сгенерированное значение.
+        """
+        rng = _user_random.get()
+        if rng is None:
+            return getattr(self.faker, name)(**kwargs)
+
+        # Подмена генератора не переключает гринлеты, поэтому другие пользователи её не увидят
+        worker_random = self.faker.random
+        self.faker.random = rng
+        try:
+            return getattr(self.faker, name)(**kwargs)
+        finally:
+            self.faker.random = worker_random
+
+    def disable_pool(self) -> None:
+        """
+        Выключает режим пула: значения снова генерируются через Faker на каждый вызов.
+        """
+        self.pool = None
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -18,16 +257,21 @@ class Fake:
         :param value: Enum-класс для генерации значения
         :return: Случайное значение из Enum-класса
         """
-        return self.faker.enum(value)
+        return self.get_random().choice(list(value))
 
     def email(self) -> str:
         """
         Генерирует случайный email
 
+        В режиме пула email уникален за счёт префикса из времени и счётчика процесса.
+
         :return: Cлучайный email
         :rtype: str
         """
-        return f"{time.time()}.{self.faker.email()}"
+        if self.pool is not None:
+            return f"{time.time()}.{next(self._email_counter)}.{self.pool.next('email', _user_random.get())}"
+
+        return f"{time.time()}.{self.generate('email')}"
 
     def category(self) -> str:
         """
@@ -36,25 +280,10 @@ class Fake:
         :return: Случайная категория покупки
         :rtype: str
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        if self.pool is not None:
+            return self.pool.next("category", _user_random.get())
+
+        return self.get_random().choice(PURCHASE_CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -63,7 +292,10 @@ class Fake:
         :return: Случайная фамилия.
         :rtype: str
         """
-        return self.faker.last_name()
+        if self.pool is not None:
+            return self.pool.next("last_name", _user_random.get())
+
+        return self.generate("last_name")
 
     def first_name(self) -> str:
         """
@@ -72,7 +304,10 @@ class Fake:
         :return: Случайное имя.
         :rtype: str
         """
-        return self.faker.first_name()
+        if self.pool is not None:
+            return self.pool.next("first_name", _user_random.get())
+
+        return self.generate("first_name")
 
     def middle_name(self) -> str:
         """
@@ -81,7 +316,10 @@ class Fake:
         :return: Случайное отчество.
         :rtype: str
         """
-        return self.faker.first_name()
+        if self.pool is not None:
+            return self.pool.next("first_name", _user_random.get())
+
+        return self.generate("first_name")
 
     def phone_number(self) -> str:
         """
@@ -90,7 +328,10 @@ class Fake:
         :return: Случайный номер телефона
         :rtype: str
         """
-        return self.faker.phone_number()
+        if self.pool is not None:
+            return self.pool.next("phone_number", _user_random.get())
+
+        return self.generate("phone_number")
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -103,7 +344,7 @@ class Fake:
         :return: Случайное число с плавающей запятой в пределах start и end
         :rtype: float
         """
-        return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
+        return self.generate("pyfloat", min_value=start, max_value=end, right_digits=2)
 
     def amount(self) -> float:
         """
@@ -112,6 +353,9 @@ class Fake:
         :return: Сумма от 1 до 100
         :rtype: float
         """
+        if self.pool is not None:
+            return self.pool.next("amount", _user_random.get())
+
         return self.float(1, 100)
 
     def proto_enum(self, value: EnumTypeWrapper) -> int:
@@ -121,7 +365,7 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        return self.get_random().choice(value.values())
 
 
 fake = Fake(faker=Faker())
@@ -0,0 +1,316 @@
+import json
+import math
+from pathlib import Path
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from clients.metrics import MetricsBatch, request_batch
+from tools.load_shapes import iteration_lateness, iteration_started
+
+# Разрядность поддиапазона: 2^11 = 2048 значений на диапазон, то есть 3 значащие цифры (как в HdrHistogram)
+HISTOGRAM_SUB_BUCKET_BITS = 11
+
+# Перцентили, которые попадают в итоговый отчёт
+HISTOGRAM_PERCENTILES = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+# Ключ данных гистограмм в отчётах воркеров мастеру
+HISTOGRAMS_REPORT_KEY = "latency_histograms"
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в стиле HdrHistogram с логарифмически-линейными корзинами.
+
+    Значения (целые микросекунды) до 2^11 хранятся точно, дальше каждый диапазон [2^k, 2^(k+1)) делится
+    на 1024 равные корзины, поэтому относительная ошибка не превышает 0.1% на любом масштабе:
+    p99.9 и p99.99 считаются без округления, которое делает статистика Locust.
+
+    Счётчики хранятся разреженно (номер корзины -> количество), поэтому гистограммы дёшево
+    передавать с воркеров на мастер и складывать.
+    """
+    __slots__ = ("counts", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.min = math.inf
+        self.max = 0
+
+    @staticmethod
+    def get_index(value: int) -> int:
+        """
+        Возвращает номер корзины для значения.
+
+        :param value: Значение в микросекундах.
+        """
+        shift = max(value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS, 0)
+        return (shift << (HISTOGRAM_SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def get_highest_value(index: int) -> int:
+        """
+        Возвращает наибольшее значение, попадающее в корзину (так же, как HdrHistogram отдаёт перцентили).
+
+        :param index: Номер корзины.
+        """
+        shift = max((index >> (HISTOGRAM_SUB_BUCKET_BITS - 1)) - 1, 0)
+        sub_index = index - (shift << (HISTOGRAM_SUB_BUCKET_BITS - 1))
+        return ((sub_index + 1) << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение в гистограмму.
+
+        :param value: Значение в микросекундах.
+        :param count: Сколько раз значение встретилось.
+        """
+        index = self.get_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, data: dict) -> None:
+        """
+        Прибавляет к гистограмме данные другой гистограммы (см. `to_dict`).
+
+        :param data: Сериализованная гистограмма.
+        """
+        if not data["total"]:
+            return
+
+        for index, count in data["counts"]:
+            self.counts[index] = self.counts.get(index, 0) + count
+
+        self.total += data["total"]
+        self.min = min(self.min, data["min"])
+        self.max = max(self.max, data["max"])
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """
+        Возвращает значение перцентиля.
+
+        :param percentile: Перцентиль от 0 до 100, например: 99.99.
+        :return: Значение в микросекундах (0 для пустой гистограммы).
+        """
+        if not self.total:
+            return 0
+
+        rank = max(math.ceil(percentile / 100 * self.total), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.get_highest_value(index), self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        Сериализует гистограмму в виде, пригодном для msgpack (отчёты воркеров) и JSON.
+        """
+        return {
+            "counts": sorted(self.counts.items()),
+            "total": self.total,
+            "min": self.min if self.total else 0,
+            "max": self.max,
+        }
+
+    def get_summary(self) -> dict:
+        """
+        Возвращает итоговые показатели гистограммы в миллисекундах.
+        """
+        return {
+            "count": self.total,
+            "min": (self.min if self.total else 0) / 1000,
+            "max": self.max / 1000,
+            "percentiles": {
+                f"p{percentile:g}": self.get_value_at_percentile(percentile) / 1000
+                for percentile in HISTOGRAM_PERCENTILES
+            },
+        }
+
+
+class LatencyRecorder:
+    """
+    Набор гистограмм задержек по маршрутам HTTP и методам gRPC.
+
+    Для каждого имени запроса ведутся две гистограммы:
+    - raw — время ответа, как его измерили event hook httpx и gRPC-интерцептор;
+    - corrected — время ответа с поправкой на coordinated omission: к нему прибавляется опоздание итерации
+      относительно расписания открытой модели нагрузки (см. tools.load_shapes). Так в отчёт попадает время
+      от запланированного, а не от фактического начала, и задержки не прячутся за упавшим темпом.
+
+    Отдельно ведётся гистограмма опозданий начала итераций (`lateness`): её перцентили показывают,
+    насколько генератор не успевал за заданной интенсивностью, а количество — сколько итераций было запущено.
+    """
+
+    def __init__(self):
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self.lateness = LatencyHistogram()
+
+    def get_histograms(self, name: str) -> dict[str, LatencyHistogram]:
+        """
+        Возвращает пару гистограмм (raw, corrected) для имени запроса, создавая их при первом обращении.
+
+        :param name: Имя запроса, например: "HTTP GET /api/v1/accounts".
+        """
+        histograms = self.histograms.get(name)
+        if histograms is None:
+            histograms = self.histograms[name] = {"raw": LatencyHistogram(), "corrected": LatencyHistogram()}
+
+        return histograms
+
+    def record(self, name: str, response_time: float, lateness: float = 0.0) -> None:
+        """
+        Записывает время ответа запроса.
+
+        :param name: Имя запроса.
+        :param response_time: Время ответа в миллисекундах.
+        :param lateness: Опоздание итерации относительно расписания в миллисекундах.
+        """
+        histograms = self.get_histograms(name)
+        histograms["raw"].record(round(response_time * 1000))
+        histograms["corrected"].record(round((response_time + lateness) * 1000))
+
+    def record_lateness(self, lateness: float) -> None:
+        """
+        Записывает опоздание начала итерации.
+
+        :param lateness: Опоздание относительно расписания в миллисекундах.
+        """
+        self.lateness.record(round(lateness * 1000))
+
+    def merge(self, data: dict) -> None:
+        """
+        Прибавляет гистограммы, присланные воркером (см. `collect`).
+
+        :param data: Сериализованные гистограммы по именам запросов и гистограмма опозданий итераций.
+        """
+        for name, histograms in data.get("requests", {}).items():
+            for kind, histogram in self.get_histograms(name).items():
+                histogram.merge(histograms[kind])
+
+        if "lateness" in data:
+            self.lateness.merge(data["lateness"])
+
+    def collect(self) -> dict:
+        """
+        Сериализует накопленные гистограммы и начинает накопление заново.
+
+        Воркер отправляет мастеру только прирост с прошлого отчёта, мастер складывает приросты.
+        """
+        data = {
+            "requests": {
+                name: {kind: histogram.to_dict() for kind, histogram in histograms.items()}
+                for name, histograms in self.histograms.items()
+            },
+            "lateness": self.lateness.to_dict(),
+        }
+        self.reset()
+
+        return data
+
+    def reset(self) -> None:
+        """
+        Удаляет все накопленные гистограммы.
+        """
+        self.histograms.clear()
+        self.lateness = LatencyHistogram()
+
+    def get_summary(self) -> dict:
+        """
+        Возвращает итоговый отчёт: перцентили и сами гистограммы, чтобы отчёты разных запусков можно было сложить.
+        """
+        return {
+            "unit": "ms",
+            "histogram_unit": "us",
+            "sub_bucket_bits": HISTOGRAM_SUB_BUCKET_BITS,
+            "requests": {
+                name: {
+                    kind: {**histogram.get_summary(), "histogram": histogram.to_dict()}
+                    for kind, histogram in histograms.items()
+                }
+                for name, histograms in sorted(self.histograms.items())
+            },
+            "iteration_start_lateness": {**self.lateness.get_summary(), "histogram": self.lateness.to_dict()},
+        }
+
+
+# Гистограммы процесса Locust, общие для HTTP и gRPC клиентов
+latency_recorder = LatencyRecorder()
+
+
+def get_histograms_file(environment: Environment) -> Path | None:
+    """
+    Возвращает путь к файлу гистограмм рядом с HTML-отчётом сценария: report.html -> report.histograms.json.
+
+    :param environment: Объект окружения Locust.
+    :return: Путь к файлу или None, если HTML-отчёт не пишется.
+    """
+    html_file = getattr(environment.parsed_options, "html_file", None)
+    if not html_file:
+        return None
+
+    return Path(html_file).with_suffix(".histograms.json")
+
+
+@events.request.add_listener
+def record_latency(request_type: str, name: str, response_time: float, **kwargs) -> None:
+    """
+    Записывает время ответа запроса, о котором event hook httpx или gRPC-интерцептор сообщили событием request
+    (при выключенной пакетной записи метрик).
+    """
+    latency_recorder.record(f"{request_type} {name}", response_time, iteration_lateness.get() * 1000)
+
+
+@request_batch.add_listener
+def record_latency_batch(environment: Environment, batch: MetricsBatch) -> None:
+    """
+    Записывает время ответа запросов из пачки сэмплов, сброшенной буфером метрик (см. clients.metrics).
+    """
+    names = [f"{request_type} {name}" for request_type, name in batch.keys]
+    for index in range(batch.length):
+        latency_recorder.record(
+            names[batch.key_indexes[index]],
+            batch.response_times[index],
+            batch.latenesses[index] * 1000
+        )
+
+
+@iteration_started.add_listener
+def record_iteration_lateness(environment: Environment, lateness: float) -> None:
+    latency_recorder.record_lateness(lateness * 1000)
+
+
+@events.test_start.add_listener
+def reset_latency_histograms(environment: Environment, **kwargs) -> None:
+    latency_recorder.reset()
+
+
+@events.report_to_master.add_listener
+def report_latency_histograms(client_id: str, data: dict) -> None:
+    data[HISTOGRAMS_REPORT_KEY] = latency_recorder.collect()
+
+
+@events.worker_report.add_listener
+def merge_latency_histograms(client_id: str, data: dict) -> None:
+    latency_recorder.merge(data.get(HISTOGRAMS_REPORT_KEY, {}))
+
+
+@events.quitting.add_listener
+def save_latency_histograms(environment: Environment, **kwargs) -> None:
+    """
+    Сохраняет гистограммы рядом с HTML-отчётом (на мастере или в локальном запуске).
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    histograms_file = get_histograms_file(environment)
+    if histograms_file is None:
+        return
+
+    histograms_file.parent.mkdir(parents=True, exist_ok=True)
+    histograms_file.write_text(json.dumps(latency_recorder.get_summary(), indent=2, ensure_ascii=False))
@@ -0,0 +1,380 @@
+import logging
+import math
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from locust import LoadTestShape, SequentialTaskSet, events
+from locust.env import Environment
+from locust.event import EventHook
+from locust.exception import StopUser
+from locust.runners import MasterRunner, WorkerRunner
+from locust.util.timespan import parse_timespan
+
+
+# Функция ожидания Locust: принимает пользователя и возвращает паузу перед следующей итерацией в секундах
+WaitTime = Callable[..., float]
+
+# Событие начала итерации открытой модели нагрузки: слушатели получают `environment` и `lateness` — опоздание
+# начала итерации относительно расписания в секундах (см. tools.histograms). В статистику запросов Locust
+# опоздание не попадает: там только настоящие вызовы gateway
+iteration_started = EventHook()
+
+logger = logging.getLogger(__name__)
+
+# Опоздание текущей итерации виртуального пользователя в секундах (у каждого пользователя-гринлета своё значение)
+iteration_lateness: ContextVar[float] = ContextVar("iteration_lateness", default=0.0)
+
+# Расписания прибытия итераций, по одному на окружение Locust (строятся на старте теста)
+_schedules: WeakKeyDictionary[Environment, "ArrivalSchedule"] = WeakKeyDictionary()
+
+
+class LoadShapeMode(StrEnum):
+    """
+    Модель нагрузки сценария (опция `--load-shape`).
+    """
+    CLOSED = "closed"  # Закрытая модель: пауза между итерациями задаётся wait_time сценария
+    CONSTANT = "constant"  # Постоянная интенсивность `--arrival-rate` итераций в секунду
+    STEP = "step"  # Ступенчатая интенсивность по этапам `--arrival-stages`
+    RAMP = "ramp"  # Линейно меняющаяся интенсивность по этапам `--arrival-stages`
+
+
+@dataclass(slots=True, frozen=True)
+class ArrivalStage:
+    """
+    Этап профиля нагрузки: целевая интенсивность (итераций в секунду на весь тест) и длительность в секундах.
+    """
+    rate: float
+    duration: float
+
+
+def parse_arrival_stages(value: str) -> list[ArrivalStage]:
+    """
+    Разбирает этапы профиля нагрузки из строки вида "10:30s, 50:1m, 50:2m".
+
+    :param value: Этапы через запятую в формате `<итераций в секунду>:<длительность>`.
+    :return: Список этапов.
+    """
+    stages: list[ArrivalStage] = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+
+        rate, duration = item.split(":", 1)
+        stages.append(ArrivalStage(rate=float(rate), duration=float(parse_timespan(duration.strip()))))
+
+    return stages
+
+
+class ArrivalSchedule:
+    """
+    Расписание прибытия итераций на фиксированной временной шкале (открытая модель нагрузки).
+
+    Интенсивность задаётся по этапам: в режиме step она постоянна на каждом этапе, в режиме ramp меняется
+    линейно от интенсивности предыдущего этапа (для первого — от нуля) до интенсивности этапа.
+    Момент k-й итерации — время, к которому накопленное число прибытий (интеграл интенсивности) достигает k.
+    Он вычисляется аналитически, поэтому ошибка не накапливается от итерации к итерации.
+
+    Общее расписание делится между воркерами чередованием: воркеру с номером w из W
+    достаются прибытия w, w + W, w + 2W, ...
+    """
+
+    def __init__(self, stages: list[ArrivalStage], ramp: bool = False, worker_index: int = 0, workers: int = 1):
+        """
+        :param stages: Этапы профиля нагрузки.
+        :param ramp: Менять интенсивность линейно внутри этапов (иначе ступенчато).
+        :param worker_index: Номер воркера.
+        :param workers: Количество воркеров, между которыми делится расписание.
+        """
+        self.stages = stages
+        self.ramp = ramp
+        self.worker_index = worker_index
+        self.workers = max(workers, 1)
+        self.start_time = time.perf_counter()
+        self._arrival = 0
+        # Курсор текущего этапа: номер, смещение начала этапа и число прибытий до него
+        self._stage = 0
+        self._stage_start = 0.0
+        self._stage_arrivals = 0.0
+
+    def get_stage_rates(self, index: int) -> tuple[float, float]:
+        """
+        Возвращает интенсивность в начале и в конце этапа.
+
+        :param index: Номер этапа.
+        :return: Пара (начальная, конечная) интенсивность в итерациях в секунду.
+        """
+        rate = self.stages[index].rate
+        if not self.ramp:
+            return rate, rate
+
+        return (self.stages[index - 1].rate if index > 0 else 0.0), rate
+
+    def get_arrival_time(self, arrival: int) -> float | None:
+        """
+        Вычисляет момент прибытия итерации по общему расписанию всех воркеров.
+
+        Номера прибытий должны запрашиваться по возрастанию: курсор этапа двигается только вперёд.
+
+        :param arrival: Номер прибытия.
+        :return: Смещение от начала теста в секундах или None, если профиль нагрузки закончился.
+        """
+        while self._stage < len(self.stages):
+            start_rate, end_rate = self.get_stage_rates(self._stage)
+            duration = self.stages[self._stage].duration
+
+            stage_arrivals = (start_rate + end_rate) / 2 * duration
+            remaining = arrival - self._stage_arrivals
+            if remaining < stage_arrivals:
+                slope = (end_rate - start_rate) / duration
+                if slope == 0:
+                    return self._stage_start + remaining / start_rate
+
+                # Решаем start_rate * t + slope * t^2 / 2 = remaining относительно t
+                return self._stage_start + (math.sqrt(start_rate ** 2 + 2 * slope * remaining) - start_rate) / slope
+
+            self._stage += 1
+            self._stage_start += duration
+            self._stage_arrivals += stage_arrivals
+
+        return None
+
+    def next_slot(self) -> float | None:
+        """
+        Возвращает запланированное время начала следующей итерации воркера.
+
+        :return: Время по `time.perf_counter()` или None, если профиль нагрузки закончился.
+        """
+        offset = self.get_arrival_time(self._arrival * self.workers + self.worker_index)
+        self._arrival += 1
+
+        return None if offset is None else self.start_time + offset
+
+
+def get_load_shape_mode(environment: Environment) -> LoadShapeMode:
+    """
+    Возвращает модель нагрузки, заданную опцией `--load-shape`.
+
+    :param environment: Объект окружения Locust.
+    """
+    return LoadShapeMode(getattr(environment.parsed_options, "load_shape", None) or LoadShapeMode.CLOSED)
+
+
+def get_arrival_stages(environment: Environment) -> list[ArrivalStage]:
+    """
+    Собирает этапы профиля нагрузки из опций запуска.
+
+    В режиме constant профиль состоит из одного этапа `--arrival-rate` длительностью `--run-time`
+    (без ограничения по времени, если он не задан).
+
+    :param environment: Объект окружения Locust.
+    :return: Этапы профиля нагрузки (пустой список для закрытой модели).
+    """
+    options = environment.parsed_options
+    mode = get_load_shape_mode(environment)
+
+    if mode == LoadShapeMode.CONSTANT:
+        if options.arrival_rate <= 0:
+            raise ValueError("Для модели нагрузки constant нужно задать --arrival-rate больше нуля")
+
+        return [ArrivalStage(rate=options.arrival_rate, duration=float(options.run_time or math.inf))]
+
+    if mode in (LoadShapeMode.STEP, LoadShapeMode.RAMP):
+        stages = parse_arrival_stages(options.arrival_stages)
+        if not stages:
+            raise ValueError(f"Для модели нагрузки {mode} нужно задать этапы --arrival-stages")
+
+        return stages
+
+    return []
+
+
+def get_load_shape_duration(environment: Environment) -> float | None:
+    """
+    Возвращает длительность теста: `--run-time` для моделей closed и constant, сумму этапов для step и ramp.
+
+    :param environment: Объект окружения Locust.
+    :return: Длительность в секундах или None, если тест не ограничен по времени.
+    """
+    if get_load_shape_mode(environment) in (LoadShapeMode.STEP, LoadShapeMode.RAMP):
+        return sum(stage.duration for stage in get_arrival_stages(environment))
+
+    return environment.parsed_options.run_time or None
+
+
+def arrival_rate(closed_wait_time: WaitTime) -> WaitTime:
+    """
+    Возвращает функцию ожидания Locust, которая запускает итерации по расписанию открытой модели нагрузки.
+
+    Пауза перед итерацией — время до её запланированного начала, поэтому при замедлении сервиса темп
+    не падает: опоздавшие итерации запускаются сразу, а опоздание передаётся слушателям `iteration_started`
+    и сохраняется в `iteration_lateness` для запросов итерации.
+    Когда профиль нагрузки заканчивается, пользователь останавливается.
+    Каждый вызов занимает слот расписания, поэтому вызывать функцию нужно один раз на итерацию:
+    это делает `ArrivalRateTaskSetMixin` базовых TaskSet сценариев, в том числе перед первой итерацией.
+
+    В закрытой модели (`--load-shape closed`, по умолчанию) используется переданная функция ожидания сценария.
+
+    :param closed_wait_time: Функция ожидания для закрытой модели, например: between(1, 3).
+    :return: Функция ожидания для атрибута `wait_time` пользователя Locust.
+    """
+
+    def wait_time_func(self) -> float:
+        schedule = _schedules.get(self.environment)
+        if schedule is None:
+            return closed_wait_time(self)
+
+        slot = schedule.next_slot()
+        if slot is None:
+            raise StopUser()
+
+        wait = slot - time.perf_counter()
+        iteration_lateness.set(max(-wait, 0))
+        iteration_started.fire(environment=self.environment, lateness=iteration_lateness.get())
+
+        return max(wait, 0)
+
+    return wait_time_func
+
+
+class ArrivalRateTaskSetMixin:
+    """
+    Примесь базовых TaskSet сценариев для открытой модели нагрузки: слот расписания `arrival_rate`
+    занимает итерация сценария целиком, а не каждая задача.
+
+    Итерация SequentialTaskSet — проход по всем его задачам, итерация TaskSet — одна выбранная задача.
+    Перед первой итерацией пользователь тоже ждёт своего слота: иначе старт `users` пользователей
+    добавил бы всплеск итераций сверх заданной интенсивности.
+    В закрытой модели паузы идут между задачами, как в Locust.
+    """
+
+    # Количество задач, выполненных с начала первой итерации (None — задачи ещё не выполнялись)
+    _executed_tasks: int | None = None
+
+    def get_iteration_size(self) -> int:
+        """
+        Возвращает количество задач в одной итерации сценария.
+        """
+        return len(self.tasks) if isinstance(self, SequentialTaskSet) else 1
+
+    def execute_next_task(self) -> None:
+        if self._executed_tasks is None:
+            self._executed_tasks = 0
+            if self.user.environment in _schedules:
+                self.wait()
+
+        try:
+            super().execute_next_task()
+        finally:
+            self._executed_tasks += 1
+
+    def wait_time(self) -> float:
+        if self.user.environment not in _schedules:
+            return super().wait_time()
+
+        # Внутри итерации задачи идут без пауз, слот занимается только перед началом следующей итерации
+        if self._executed_tasks % self.get_iteration_size():
+            return 0
+
+        return self.user.wait_time()
+
+
+class ArrivalRateShape(LoadTestShape):
+    """
+    Форма нагрузки сценариев с моделью нагрузки, выбираемой в conf-файле (опция `--load-shape`).
+
+    Держит пул из `users` виртуальных пользователей (в открытой модели это запас исполнителей,
+    а не источник нагрузки) и завершает тест по окончании профиля: для closed и constant — по `run-time`,
+    для step и ramp — после последнего этапа `arrival-stages`. Темп итераций задаёт функция ожидания
+    `arrival_rate` на воркерах (см. ArrivalRateTaskSetMixin).
+
+    Класс абстрактный: чтобы Locust подхватил форму, в модуле сценария объявляется наследник.
+    """
+    abstract = True
+    use_common_options = True
+
+    def tick(self) -> tuple[int, float] | None:
+        environment = self.runner.environment
+
+        duration = get_load_shape_duration(environment)
+        if duration is not None and self.get_run_time() >= duration:
+            return None
+
+        return environment.parsed_options.num_users or 1, environment.parsed_options.spawn_rate or 1
+
+
+@events.init_command_line_parser.add_listener
+def add_load_shape_arguments(parser) -> None:
+    """
+    Добавляет опции модели нагрузки в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--load-shape",
+        type=str,
+        choices=[mode.value for mode in LoadShapeMode],
+        env_var="LOCUST_LOAD_SHAPE",
+        default=LoadShapeMode.CLOSED.value,
+        help="Модель нагрузки: closed (wait_time сценария), constant, step или ramp (открытая модель)"
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        env_var="LOCUST_ARRIVAL_RATE",
+        default=0,
+        help="Интенсивность итераций в секунду на весь тест для модели constant"
+    )
+    parser.add_argument(
+        "--arrival-stages",
+        type=str,
+        env_var="LOCUST_ARRIVAL_STAGES",
+        default="",
+        help="Этапы моделей step и ramp: '<итераций в секунду>:<длительность>' через запятую, например: 10:30s,50:1m"
+    )
+
+
+@events.test_start.add_listener
+def build_arrival_schedule(environment: Environment, **kwargs) -> None:
+    """
+    Строит расписание прибытия итераций процесса перед стартом пользователей.
+
+    Мастер итерации не запускает: он записывает в опции запуска список подключённых воркеров
+    (`arrival_workers`), который уходит воркерам вместе с остальными опциями в сообщении spawn.
+    Воркер делит расписание на число воркеров из этого списка, а свою долю выбирает по позиции в нём,
+    поэтому суммарная интенсивность не зависит от `--expect-workers` и номеров, выданных мастером.
+    """
+    _schedules.pop(environment, None)
+    if isinstance(environment.runner, MasterRunner):
+        clients = environment.runner.clients
+        environment.parsed_options.arrival_workers = sorted(
+            worker.id for worker in clients.ready + clients.spawning + clients.running
+        )
+        return
+
+    mode = get_load_shape_mode(environment)
+    if mode == LoadShapeMode.CLOSED:
+        return
+
+    stages = get_arrival_stages(environment)
+    worker_index, workers = 0, 1
+    if isinstance(environment.runner, WorkerRunner):
+        arrival_workers = getattr(environment.parsed_options, "arrival_workers", None) or []
+        if environment.runner.client_id not in arrival_workers:
+            # Воркер подключился после старта теста: доли расписания уже распределены между остальными,
+            # и его итерации превысили бы заданную интенсивность
+            logger.warning(
+                "Worker %s joined after the test start and will not run iterations of the %s load shape",
+                environment.runner.client_id, mode
+            )
+            stages = []
+        else:
+            worker_index, workers = arrival_workers.index(environment.runner.client_id), len(arrival_workers)
+
+    _schedules[environment] = ArrivalSchedule(
+        stages=stages,
+        ramp=mode == LoadShapeMode.RAMP,
+        worker_index=worker_index,
+        workers=workers
+    )
@@ -0,0 +1,263 @@
+import json
+import os
+import signal
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from clients.metrics import MetricsBatch, request_batch
+from tools.seeding import get_worker_index
+
+# Период сэмплирования по умолчанию в секундах процессорного времени (таймер ITIMER_PROF)
+PROFILE_INTERVAL = 0.005
+
+# Наши слои горячего пути генератора: имя слоя -> (окончание пути файла, префикс co_qualname).
+# Время слоя считается включительно: сэмпл относится к слою, если функция слоя есть где-то в стеке
+PROFILE_LAYERS = {
+    "HTTPClient.get/post": (
+        ("clients/http/client.py", "HTTPClient.get"),
+        ("clients/http/client.py", "HTTPClient.post"),
+    ),
+    "model_validate_json": (
+        ("pydantic/main.py", "BaseModel.model_validate_json"),
+    ),
+    "tools.fakers.Fake": (
+        ("tools/fakers.py", "Fake."),
+    ),
+    "locust_response_event_hook": (
+        ("clients/http/event_hooks/locust_event_hook.py", "locust_response_event_hook"),
+    ),
+    "LocustInterceptor": (
+        ("clients/grpc/interceptors/locust_interceptor.py", "LocustInterceptor."),
+    ),
+}
+
+
+class SamplingProfiler:
+    """
+    Сэмплирующий профайлер процесса Locust на сигнале SIGPROF.
+
+    Таймер ITIMER_PROF срабатывает по процессорному времени процесса, поэтому ожидание ответов сервиса
+    в сэмплы не попадает: профиль показывает, на что генератор тратит CPU. Обработчик сигнала только
+    запоминает стек текущего гринлета (кортеж объектов кода) в счётчике, имена функций формируются
+    один раз при записи результата.
+
+    Результат — стеки в свёрнутом формате (folded stacks: `frame;frame;frame count`), который принимают
+    flamegraph.pl, speedscope и inferno, и сводка по нашим слоям (см. PROFILE_LAYERS).
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        """
+        :param interval: Период сэмплирования в секундах процессорного времени.
+        """
+        self.interval = interval
+        self.requests = 0
+        self.stacks: Counter[tuple[CodeType, ...]] = Counter()
+        self._labels: dict[CodeType, str] = {}
+
+    def on_signal(self, signum: int, frame: FrameType | None) -> None:
+        """
+        Обработчик SIGPROF: запоминает стек прерванного кода.
+        """
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+
+        self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self) -> None:
+        """
+        Включает сэмплирование (только из главного потока: так работают сигналы в Python).
+        """
+        signal.signal(signal.SIGPROF, self.on_signal)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        """
+        Выключает сэмплирование.
+        """
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def get_label(self, code: CodeType) -> str:
+        """
+        Возвращает имя кадра для свёрнутого стека, например: "clients.http.client:HTTPClient.get".
+        """
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if "site-packages" in filename:
+                filename = filename.rsplit("site-packages", 1)[1].lstrip(os.sep)
+            elif filename.startswith(os.getcwd()):
+                filename = os.path.relpath(filename)
+
+            module = filename.removesuffix(".py").replace(os.sep, ".")
+            # В свёрнутом формате ";" разделяет кадры, а пробел отделяет количество
+            label = self._labels[code] = f"{module}:{code.co_qualname}".replace(";", ":").replace(" ", "_")
+
+        return label
+
+    @staticmethod
+    def get_layers(stack: tuple[CodeType, ...]) -> set[str]:
+        """
+        Возвращает слои PROFILE_LAYERS, функции которых есть в стеке.
+        """
+        layers = set()
+        for code in stack:
+            filename = code.co_filename.replace(os.sep, "/")
+            for layer, functions in PROFILE_LAYERS.items():
+                if any(
+                        filename.endswith(suffix) and code.co_qualname.startswith(qualname)
+                        for suffix, qualname in functions
+                ):
+                    layers.add(layer)
+
+        return layers
+
+    def write_folded(self, path: Path) -> None:
+        """
+        Записывает стеки в свёрнутом формате.
+
+        :param path: Путь к файлу (перезаписывается).
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as file:
+            for stack, samples in self.stacks.most_common():
+                file.write(f"{';'.join(self.get_label(code) for code in stack)} {samples}\n")
+
+    def get_summary(self, requests: int) -> dict:
+        """
+        Возвращает сводку по слоям: сколько процессорного времени (включительно) ушло на каждый слой
+        всего, в доле от профиля и в пересчёте на один запрос.
+
+        :param requests: Количество запросов процесса за время профилирования.
+        """
+        total = sum(self.stacks.values())
+        layers: Counter[str] = Counter()
+        for stack, samples in self.stacks.items():
+            for layer in self.get_layers(stack):
+                layers[layer] += samples
+
+        def get_layer_summary(samples: int) -> dict:
+            cpu_time = samples * self.interval * 1000
+            return {
+                "samples": samples,
+                "cpu_time": cpu_time,
+                "share": samples / total if total else 0.0,
+                "cpu_time_per_request": cpu_time / requests if requests else 0.0,
+            }
+
+        return {
+            "unit": "ms",
+            "interval": self.interval * 1000,
+            "requests": requests,
+            "total": get_layer_summary(total),
+            "layers": {layer: get_layer_summary(layers[layer]) for layer in PROFILE_LAYERS},
+        }
+
+
+# Профайлер процесса, если профилирование включено
+_profiler: SamplingProfiler | None = None
+
+
+def get_profile_file_path(environment: Environment) -> Path | None:
+    """
+    Возвращает путь к файлу профиля процесса: воркер дописывает к имени свой номер (profile.3.folded).
+
+    :param environment: Объект окружения Locust.
+    :return: Путь к файлу или None, если профилирование не включено.
+    """
+    profile_file = getattr(environment.parsed_options, "sampling_profile", None)
+    if not profile_file:
+        return None
+
+    path = Path(profile_file)
+    if isinstance(environment.runner, WorkerRunner):
+        path = path.with_suffix(f".{get_worker_index(environment)}{path.suffix}")
+
+    return path
+
+
+@events.init_command_line_parser.add_listener
+def add_profiling_arguments(parser) -> None:
+    """
+    Добавляет опции сэмплирующего профайлера в командную строку (и conf-файлы) Locust.
+
+    Опция `--profile` в Locust уже занята (имя профиля запуска в Locust Cloud), поэтому режим
+    профилирования включается через `--sampling-profile`.
+    """
+    parser.add_argument(
+        "--sampling-profile",
+        type=str,
+        env_var="LOCUST_SAMPLING_PROFILE",
+        default="",
+        help="Профилировать генератор нагрузки и записать стеки в свёрнутом формате для flamegraph "
+             "(например, ./reports/profile.folded; воркеры пишут каждый в свой файл)"
+    )
+    parser.add_argument(
+        "--sampling-profile-interval",
+        type=float,
+        env_var="LOCUST_SAMPLING_PROFILE_INTERVAL",
+        default=PROFILE_INTERVAL * 1000,
+        help="Период сэмплирования профайлера в миллисекундах процессорного времени"
+    )
+
+
+@events.test_start.add_listener
+def start_sampling_profiler(environment: Environment, **kwargs) -> None:
+    """
+    Включает профилирование процесса, генерирующего нагрузку (мастер запросов не выполняет).
+    """
+    global _profiler
+
+    if not getattr(environment.parsed_options, "sampling_profile", None):
+        return
+    if isinstance(environment.runner, MasterRunner) or _profiler is not None:
+        return
+    if not hasattr(signal, "setitimer"):
+        # Таймера ITIMER_PROF на Windows нет
+        return
+
+    _profiler = SamplingProfiler(interval=environment.parsed_options.sampling_profile_interval / 1000)
+    _profiler.start()
+
+
+@events.test_stop.add_listener
+def stop_sampling_profiler(environment: Environment, **kwargs) -> None:
+    """
+    Выключает профилирование и записывает стеки и сводку по слоям (profile.folded -> profile.layers.json).
+    """
+    global _profiler
+
+    if _profiler is None:
+        return
+
+    profiler, _profiler = _profiler, None
+    profiler.stop()
+
+    path = get_profile_file_path(environment)
+    profiler.write_folded(path)
+
+    summary = profiler.get_summary(requests=profiler.requests)
+    path.with_suffix(".layers.json").write_text(json.dumps(summary, indent=2, ensure_ascii=False))
+
+
+@request_batch.add_listener
+def count_profiled_request_batch(environment: Environment, batch: MetricsBatch) -> None:
+    if _profiler is not None:
+        _profiler.requests += batch.length
+
+
+@events.request.add_listener
+def count_profiled_request(**kwargs) -> None:
+    """
+    Считает запросы за время профилирования, чтобы пересчитать время слоёв на один запрос
+    (статистика воркера сбрасывается при каждом отчёте мастеру и для этого не подходит).
+    """
+    if _profiler is not None:
+        _profiler.requests += 1
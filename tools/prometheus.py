@@ -0,0 +1,309 @@
+import time
+from bisect import bisect_left
+from weakref import WeakKeyDictionary
+
+from gevent.pywsgi import WSGIServer
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner
+
+from clients.metrics import MetricsBatch, request_batch
+from tools.seeding import get_worker_index
+
+# Границы корзин гистограммы времени ответа в секундах (без +Inf, она добавляется при выводе)
+PROMETHEUS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Длина скользящего окна в секундах, по которому считаются текущие интенсивность и перцентили
+PROMETHEUS_WINDOW = 10
+
+# Перцентили, которые отдаются по скользящему окну
+PROMETHEUS_WINDOW_QUANTILES = (0.5, 0.95, 0.99)
+
+# Запущенные HTTP-серверы экспортёра, по одному на окружение Locust
+_servers: WeakKeyDictionary[Environment, WSGIServer] = WeakKeyDictionary()
+
+
+class RequestSeries:
+    """
+    Предагрегированные метрики одного имени запроса.
+
+    Кроме накопительных счётчиков и гистограммы за весь тест хранит кольцо посекундных срезов
+    за последние PROMETHEUS_WINDOW секунд: при запросе метрик текущие интенсивность и перцентили
+    считаются по ним, а не по сырым сэмплам.
+    """
+    __slots__ = ("requests", "failures", "bytes", "duration_sum", "buckets", "window_seconds", "window_buckets")
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.bytes = 0
+        self.duration_sum = 0.0
+        # Последняя корзина — +Inf
+        self.buckets = [0] * (len(PROMETHEUS_BUCKETS) + 1)
+        self.window_seconds = [0] * PROMETHEUS_WINDOW
+        self.window_buckets = [[0] * (len(PROMETHEUS_BUCKETS) + 1) for _ in range(PROMETHEUS_WINDOW)]
+
+    def record(self, timestamp: float, duration: float, length: int, failed: bool) -> None:
+        """
+        Учитывает запрос.
+
+        :param timestamp: Время завершения запроса (unix, секунды).
+        :param duration: Время ответа в секундах.
+        :param length: Размер ответа в байтах.
+        :param failed: Запрос завершился ошибкой.
+        """
+        bucket = bisect_left(PROMETHEUS_BUCKETS, duration)
+
+        self.requests += 1
+        self.failures += failed
+        self.bytes += length
+        self.duration_sum += duration
+        self.buckets[bucket] += 1
+
+        second = int(timestamp)
+        slot = second % PROMETHEUS_WINDOW
+        if self.window_seconds[slot] != second:
+            # Срез устарел: начинаем в нём новую секунду
+            self.window_seconds[slot] = second
+            self.window_buckets[slot] = [0] * (len(PROMETHEUS_BUCKETS) + 1)
+        self.window_buckets[slot][bucket] += 1
+
+    def get_window_buckets(self, now: float) -> list[int]:
+        """
+        Складывает посекундные срезы, попадающие в скользящее окно.
+
+        :param now: Текущее время (unix, секунды).
+        :return: Количество запросов по корзинам за окно.
+        """
+        oldest = int(now) - PROMETHEUS_WINDOW
+        buckets = [0] * (len(PROMETHEUS_BUCKETS) + 1)
+        for second, window_buckets in zip(self.window_seconds, self.window_buckets):
+            if second > oldest:
+                buckets = [total + count for total, count in zip(buckets, window_buckets)]
+
+        return buckets
+
+
+def get_bucket_quantile(buckets: list[int], quantile: float) -> float:
+    """
+    Оценивает перцентиль по корзинам гистограммы (верхней границей корзины, как histogram_quantile
+    без интерполяции).
+
+    :param buckets: Количество значений по корзинам.
+    :param quantile: Квантиль от 0 до 1.
+    :return: Оценка в секундах (NaN, если значений нет; +Inf, если перцентиль за последней границей).
+    """
+    total = sum(buckets)
+    if not total:
+        return float("nan")
+
+    seen = 0
+    for bound, count in zip((*PROMETHEUS_BUCKETS, float("inf")), buckets):
+        seen += count
+        if seen >= quantile * total:
+            return bound
+
+    return float("inf")
+
+
+def escape_label_value(value: str) -> str:
+    """
+    Экранирует значение метки Prometheus (обратный слэш, кавычки и переводы строк).
+    """
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(**labels: str) -> str:
+    """
+    Форматирует метки метрики Prometheus, например: {type="HTTP",name="GET /api/v1/accounts",worker="0"}.
+    """
+    return "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+class PrometheusExporter:
+    """
+    Экспортёр метрик нагрузочного теста в текстовом формате Prometheus.
+
+    Метрики агрегируются при записи запроса (счётчики, гистограмма, посекундные срезы окна),
+    поэтому запрос метрик не перебирает сэмплы и не влияет на генерацию нагрузки.
+    Каждый процесс Locust (локальный или воркер) отдаёт свои метрики с меткой `worker`.
+    """
+
+    def __init__(self, environment: Environment):
+        """
+        :param environment: Объект окружения Locust.
+        """
+        self.environment = environment
+        self.series: dict[tuple[str, str], RequestSeries] = {}
+
+    def record(self, request_type: str, name: str, timestamp: float, response_time: float, length: int,
+               failed: bool) -> None:
+        """
+        Учитывает запрос.
+
+        :param request_type: Тип запроса, например: "HTTP", "gRPC".
+        :param name: Имя запроса (маршрут или метод).
+        :param timestamp: Время завершения запроса (unix, секунды).
+        :param response_time: Время ответа в миллисекундах.
+        :param length: Размер ответа в байтах.
+        :param failed: Запрос завершился ошибкой.
+        """
+        key = (request_type, name)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = RequestSeries()
+
+        series.record(timestamp, response_time / 1000, length, failed)
+
+    def render(self) -> str:
+        """
+        Формирует ответ на запрос метрик в текстовом формате Prometheus.
+        """
+        now = time.time()
+        worker = str(get_worker_index(self.environment))
+        runner = self.environment.runner
+
+        lines = [
+            "# HELP locust_users Number of running virtual users.",
+            "# TYPE locust_users gauge",
+            f"locust_users{format_labels(worker=worker)} {runner.user_count if runner else 0}",
+        ]
+        counters = (
+            ("locust_requests_total", "Completed requests.", "counter", lambda series: series.requests),
+            ("locust_request_failures_total", "Failed requests.", "counter", lambda series: series.failures),
+            ("locust_response_bytes_total", "Received response bytes.", "counter", lambda series: series.bytes),
+        )
+        for metric, description, metric_type, get_value in counters:
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {metric_type}"]
+            for (request_type, name), series in self.series.items():
+                labels = format_labels(type=request_type, name=name, worker=worker)
+                lines.append(f"{metric}{labels} {get_value(series)}")
+
+        lines += [
+            "# HELP locust_request_duration_seconds Response time.",
+            "# TYPE locust_request_duration_seconds histogram",
+        ]
+        for (request_type, name), series in self.series.items():
+            cumulative = 0
+            for bound, count in zip((*PROMETHEUS_BUCKETS, "+Inf"), series.buckets):
+                cumulative += count
+                labels = format_labels(type=request_type, name=name, worker=worker, le=str(bound))
+                lines.append(f"locust_request_duration_seconds_bucket{labels} {cumulative}")
+
+            labels = format_labels(type=request_type, name=name, worker=worker)
+            lines.append(f"locust_request_duration_seconds_sum{labels} {series.duration_sum}")
+            lines.append(f"locust_request_duration_seconds_count{labels} {series.requests}")
+
+        lines += [
+            f"# HELP locust_window_requests_per_second Request rate over the last {PROMETHEUS_WINDOW} seconds.",
+            "# TYPE locust_window_requests_per_second gauge",
+        ]
+        windows = {key: series.get_window_buckets(now) for key, series in self.series.items()}
+        for (request_type, name), buckets in windows.items():
+            labels = format_labels(type=request_type, name=name, worker=worker)
+            lines.append(f"locust_window_requests_per_second{labels} {sum(buckets) / PROMETHEUS_WINDOW}")
+
+        lines += [
+            f"# HELP locust_window_duration_seconds Response time quantiles over the last {PROMETHEUS_WINDOW} seconds.",
+            "# TYPE locust_window_duration_seconds gauge",
+        ]
+        for (request_type, name), buckets in windows.items():
+            for quantile in PROMETHEUS_WINDOW_QUANTILES:
+                labels = format_labels(type=request_type, name=name, worker=worker, quantile=str(quantile))
+                lines.append(f"locust_window_duration_seconds{labels} {get_bucket_quantile(buckets, quantile)}")
+
+        return "\n".join(lines) + "\n"
+
+    def wsgi_app(self, environ, start_response):
+        """
+        WSGI-приложение: отдаёт метрики по пути /metrics.
+        """
+        if environ.get("PATH_INFO") != "/metrics":
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not Found\n"]
+
+        body = self.render().encode()
+        start_response("200 OK", [
+            ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ])
+        return [body]
+
+
+# Экспортёры процесса, по одному на окружение Locust
+_exporters: WeakKeyDictionary[Environment, PrometheusExporter] = WeakKeyDictionary()
+
+
+@events.init_command_line_parser.add_listener
+def add_prometheus_arguments(parser) -> None:
+    """
+    Добавляет опции экспортёра Prometheus в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        env_var="LOCUST_METRICS_PORT",
+        default=0,
+        help="Порт эндпоинта /metrics в формате Prometheus (0 — выключен); воркер слушает порт + свой номер"
+    )
+    parser.add_argument(
+        "--metrics-host",
+        type=str,
+        env_var="LOCUST_METRICS_HOST",
+        default="127.0.0.1",
+        help="Адрес, на котором слушает эндпоинт /metrics"
+    )
+
+
+@events.test_start.add_listener
+def start_prometheus_exporter(environment: Environment, **kwargs) -> None:
+    """
+    Запускает эндпоинт /metrics процесса, генерирующего нагрузку (мастер запросов не выполняет).
+    """
+    port = getattr(environment.parsed_options, "metrics_port", 0)
+    if not port or isinstance(environment.runner, MasterRunner) or environment in _servers:
+        return
+
+    exporter = _exporters[environment] = PrometheusExporter(environment)
+    server = _servers[environment] = WSGIServer(
+        (environment.parsed_options.metrics_host, port + get_worker_index(environment)),
+        exporter.wsgi_app,
+        log=None
+    )
+    server.start()
+
+
+@events.quitting.add_listener
+def stop_prometheus_exporter(environment: Environment, **kwargs) -> None:
+    server = _servers.pop(environment, None)
+    if server is not None:
+        server.stop(timeout=1)
+
+
+@request_batch.add_listener
+def export_request_batch(environment: Environment, batch: MetricsBatch) -> None:
+    exporter = _exporters.get(environment)
+    if exporter is None:
+        return
+
+    failed = {index for index, _ in batch.errors}
+    for index in range(batch.length):
+        request_type, name = batch.keys[batch.key_indexes[index]]
+        exporter.record(
+            request_type,
+            name,
+            batch.timestamps[index],
+            batch.response_times[index],
+            batch.response_lengths[index],
+            index in failed
+        )
+
+
+@events.request.add_listener
+def export_request(request_type: str, name: str, response_time: float, response_length: int,
+                   exception: Exception | None = None, **kwargs) -> None:
+    """
+    Учитывает запросы, о которых сообщили событием request (без пакетной записи метрик, а также опоздание итераций).
+    """
+    for exporter in _exporters.values():
+        exporter.record(request_type, name, time.time(), response_time, response_length, exception is not None)
@@ -0,0 +1,126 @@
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Порт, на котором мастер Locust принимает подключения воркеров
+RUNNER_MASTER_PORT = 5557
+
+# Сколько секунд мастер ждёт подключения всех воркеров
+RUNNER_EXPECT_WORKERS_MAX_WAIT = 60
+
+# Опции conf-файла, которые нужны воркерам (остальные — пользователи, отчёт, длительность — нужны только мастеру)
+WORKER_CONF_OPTIONS = ("locustfile", "seeds-file", "seeds-ids-file", "seed")
+
+
+def read_conf(path: Path | str) -> dict[str, str]:
+    """
+    Читает conf-файл сценария Locust (строки вида `key = value` или `key=value`).
+
+    :param path: Путь к conf-файлу, например: ./scenarios/http/gateway/get_documents/v1.0.conf.
+    :return: Словарь опций conf-файла.
+    """
+    options: dict[str, str] = {}
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";", "[")) or "=" not in line:
+            continue
+
+        key, value = line.split("=", 1)
+        options[key.strip()] = value.strip()
+
+    return options
+
+
+def build_master_command(conf: Path | str, workers: int, port: int, seed: int | None) -> list[str]:
+    """
+    Собирает команду запуска мастера Locust.
+
+    Мастер читает conf-файл целиком: число пользователей, длительность и путь к HTML-отчёту.
+    Статистика воркеров агрегируется на мастере, поэтому общий отчёт пишется в `html` из conf-файла.
+    """
+    command = [
+        sys.executable, "-m", "locust",
+        "--config", str(conf),
+        "--master",
+        "--master-bind-port", str(port),
+        "--expect-workers", str(workers),
+        "--expect-workers-max-wait", str(RUNNER_EXPECT_WORKERS_MAX_WAIT),
+    ]
+    if seed is not None:
+        command += ["--seed", str(seed)]
+
+    return command
+
+
+def build_worker_command(options: dict[str, str], port: int, seed: int | None) -> list[str]:
+    """
+    Собирает команду запуска воркера Locust.
+
+    Воркеру передаются только опции сценария и данных: seed воркера и смещение в хранилище идентификаторов
+    выводятся из общего seed и номера воркера, который назначает мастер (см. tools.seeding и seeds.locust).
+    """
+    command = [sys.executable, "-m", "locust", "--worker", "--master-host", "127.0.0.1", "--master-port", str(port)]
+    for key in WORKER_CONF_OPTIONS:
+        if key in options:
+            command += [f"--{key}", options[key]]
+
+    if seed is not None:
+        command += ["--seed", str(seed)]
+
+    return command
+
+
+def run(conf: Path | str, workers: int, port: int = RUNNER_MASTER_PORT, seed: int | None = None) -> int:
+    """
+    Запускает сценарий в распределённом режиме на одной машине: мастер и `workers` процессов-воркеров.
+
+    :param conf: Путь к conf-файлу сценария.
+    :param workers: Количество воркеров (по умолчанию — по одному на ядро).
+    :param port: Порт мастера.
+    :param seed: Общий seed запуска для воспроизводимой генерации данных.
+    :return: Код завершения мастера.
+    """
+    options = read_conf(conf)
+    if seed is None and "seed" in options:
+        seed = int(options["seed"])
+
+    master = subprocess.Popen(build_master_command(conf, workers, port, seed))
+    worker_processes = [
+        subprocess.Popen(build_worker_command(options, port, seed))
+        for _ in range(workers)
+    ]
+
+    try:
+        return master.wait()
+    except KeyboardInterrupt:
+        master.terminate()
+        return master.wait()
+    finally:
+        for process in worker_processes:
+            if process.poll() is None:
+                process.terminate()
+
+        for process in worker_processes:
+            process.wait()
+
+
+def main() -> None:
+    """
+    Запуск сценария на всех ядрах машины:
+
+        python -m tools.runner ./scenarios/http/gateway/get_documents/v1.0.conf --workers 8 --seed 42
+    """
+    parser = argparse.ArgumentParser(description="Распределённый запуск сценария Locust по conf-файлу")
+    parser.add_argument("conf", type=str, help="Путь к conf-файлу сценария")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Количество воркеров")
+    parser.add_argument("--port", type=int, default=RUNNER_MASTER_PORT, help="Порт мастера Locust")
+    parser.add_argument("--seed", type=int, default=None, help="Общий seed запуска")
+    args = parser.parse_args()
+
+    sys.exit(run(args.conf, workers=args.workers, port=args.port, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
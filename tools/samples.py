@@ -0,0 +1,299 @@
+import argparse
+import csv
+import json
+import struct
+import sys
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+# Заголовок файла: сигнатура формата и номер воркера, записавшего сэмплы
+SAMPLES_MAGIC = b"SAMPLES1"
+SAMPLES_HEADER = struct.Struct("<8sH")
+
+# Заголовок группы строк: количество строк и размер сжатого блока метаданных (имена запросов и ошибки)
+SAMPLES_ROW_GROUP_HEADER = struct.Struct("<II")
+
+# Размер сжатой колонки внутри группы строк
+SAMPLES_COLUMN_HEADER = struct.Struct("<I")
+
+# Сколько строк копится в памяти перед записью группы строк на диск
+SAMPLES_ROW_GROUP_SIZE = 65_536
+
+# Уровень сжатия zlib: быстрый, колонки чисел одного вида сжимаются хорошо и так
+SAMPLES_COMPRESSION_LEVEL = 1
+
+# Колонки файла и их типы array: время (unix, сек), номер имени запроса в группе строк, время ответа (мс),
+# размер ответа (байт), статус (HTTP-код или код gRPC), опоздание итерации (сек) и номер виртуального пользователя
+SAMPLES_COLUMNS = (
+    ("timestamp", "d"),
+    ("key", "I"),
+    ("response_time", "d"),
+    ("response_length", "q"),
+    ("status", "i"),
+    ("lateness", "d"),
+    ("user", "I"),
+)
+
+
+def pack_column(values: array) -> bytes:
+    """
+    Сжимает колонку (в файле значения хранятся в порядке байт little-endian).
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return zlib.compress(values.tobytes(), SAMPLES_COMPRESSION_LEVEL)
+
+
+def unpack_column(typecode: str, data: bytes) -> array:
+    """
+    Распаковывает колонку, сжатую `pack_column`.
+    """
+    values = array(typecode, zlib.decompress(data))
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+
+class SamplesWriter:
+    """
+    Потоковая запись сырых сэмплов запросов в колоночный файл.
+
+    Сэмплы копятся в колонках `array` до `row_group_size` строк, затем группа строк сжимается поколоночно
+    (zlib) и дописывается в файл, так что память ограничена размером одной группы при любой длине теста.
+    Имена запросов внутри группы хранятся словарём, в колонке `key` — только номер имени.
+    Файл читается группа за группой (см. `read_row_groups`), без загрузки целиком.
+    """
+
+    def __init__(self, path: Path | str, worker_index: int = 0, row_group_size: int = SAMPLES_ROW_GROUP_SIZE):
+        """
+        :param path: Путь к файлу сэмплов (перезаписывается).
+        :param worker_index: Номер воркера, записывающего сэмплы.
+        :param row_group_size: Количество строк в группе.
+        """
+        self.path = Path(path)
+        self.worker_index = worker_index
+        self.row_group_size = row_group_size
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self.path, "wb")
+        self._file.write(SAMPLES_HEADER.pack(SAMPLES_MAGIC, worker_index))
+
+        self.columns = {name: array(typecode) for name, typecode in SAMPLES_COLUMNS}
+        self.keys: list[tuple[str, str]] = []
+        self.key_ids: dict[tuple[str, str], int] = {}
+        self.errors: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def get_key_id(self, request_type: str, name: str) -> int:
+        """
+        Возвращает номер имени запроса в словаре текущей группы строк.
+        """
+        key = (request_type, name)
+        key_id = self.key_ids.get(key)
+        if key_id is None:
+            key_id = self.key_ids[key] = len(self.keys)
+            self.keys.append(key)
+
+        return key_id
+
+    def write(self, keys: list[tuple[str, str]], columns: dict[str, array], errors: dict[int, str]) -> None:
+        """
+        Дописывает пачку сэмплов.
+
+        :param keys: Имена запросов (request_type, name), на которые ссылается колонка `key` пачки.
+        :param columns: Колонки пачки одинаковой длины (имена и типы — как в SAMPLES_COLUMNS).
+        :param errors: Текст ошибок по номерам строк пачки.
+        """
+        remap = array("I", (self.get_key_id(*key) for key in keys))
+        offset = len(self)
+
+        for name, values in columns.items():
+            if name == "key":
+                self.columns[name].extend(remap[key_id] for key_id in values)
+            else:
+                self.columns[name].extend(values)
+
+        for index, error in errors.items():
+            self.errors[offset + index] = error
+
+        if len(self) >= self.row_group_size:
+            self.flush()
+
+    def append(self,
+               request_type: str,
+               name: str,
+               timestamp: float,
+               response_time: float,
+               response_length: int,
+               status: int,
+               lateness: float,
+               user: int,
+               error: str = "") -> None:
+        """
+        Дописывает один сэмпл (когда метрики пишутся без буфера, по событию на каждый запрос).
+
+        :param request_type: Тип запроса, например: "HTTP", "gRPC".
+        :param name: Имя запроса (маршрут или метод).
+        :param error: Текст ошибки запроса, если она произошла.
+        """
+        index = len(self)
+        columns = self.columns
+        columns["timestamp"].append(timestamp)
+        columns["key"].append(self.get_key_id(request_type, name))
+        columns["response_time"].append(response_time)
+        columns["response_length"].append(response_length)
+        columns["status"].append(status)
+        columns["lateness"].append(lateness)
+        columns["user"].append(user)
+        if error:
+            self.errors[index] = error
+
+        if len(self) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Сжимает накопленные строки и записывает их группой строк.
+        """
+        rows = len(self)
+        if not rows:
+            return
+
+        metadata = zlib.compress(json.dumps({"keys": self.keys, "errors": self.errors}).encode())
+        chunks = [SAMPLES_ROW_GROUP_HEADER.pack(rows, len(metadata)), metadata]
+        for name, _ in SAMPLES_COLUMNS:
+            column = pack_column(self.columns[name])
+            chunks += [SAMPLES_COLUMN_HEADER.pack(len(column)), column]
+
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+
+        self.columns = {name: array(typecode) for name, typecode in SAMPLES_COLUMNS}
+        self.keys = []
+        self.key_ids = {}
+        self.errors = {}
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся строки и закрывает файл.
+        """
+        self.flush()
+        self._file.close()
+
+
+def read_row_groups(path: Path | str) -> Iterator[dict]:
+    """
+    Читает файл сэмплов по группам строк.
+
+    Недописанная последняя группа (например, после аварийного завершения воркера) пропускается.
+
+    :param path: Путь к файлу сэмплов.
+    :return: Итератор групп: {"worker": ..., "keys": [...], "errors": {...}, "columns": {имя: array}}.
+    :raises ValueError: Если файл не является файлом сэмплов.
+    """
+    with open(path, "rb") as file:
+        magic, worker_index = SAMPLES_HEADER.unpack(file.read(SAMPLES_HEADER.size))
+        if magic != SAMPLES_MAGIC:
+            raise ValueError(f"{path} is not a samples file")
+
+        while header := file.read(SAMPLES_ROW_GROUP_HEADER.size):
+            if len(header) < SAMPLES_ROW_GROUP_HEADER.size:
+                return
+
+            rows, metadata_size = SAMPLES_ROW_GROUP_HEADER.unpack(header)
+            metadata = file.read(metadata_size)
+            if len(metadata) < metadata_size:
+                return
+
+            columns: dict[str, array] = {}
+            for name, typecode in SAMPLES_COLUMNS:
+                column_header = file.read(SAMPLES_COLUMN_HEADER.size)
+                if len(column_header) < SAMPLES_COLUMN_HEADER.size:
+                    return
+
+                (size,) = SAMPLES_COLUMN_HEADER.unpack(column_header)
+                data = file.read(size)
+                if len(data) < size:
+                    return
+
+                columns[name] = unpack_column(typecode, data)
+
+            metadata = json.loads(zlib.decompress(metadata))
+            yield {
+                "worker": worker_index,
+                "rows": rows,
+                "keys": [tuple(key) for key in metadata["keys"]],
+                "errors": {int(index): error for index, error in metadata["errors"].items()},
+                "columns": columns,
+            }
+
+
+def iter_samples(path: Path | str) -> Iterator[dict]:
+    """
+    Построчно читает файл сэмплов (для выгрузок и разовых проверок; для анализа быстрее работать с колонками).
+
+    :param path: Путь к файлу сэмплов.
+    :return: Итератор сэмплов-словарей.
+    """
+    for group in read_row_groups(path):
+        columns = group["columns"]
+        for index in range(group["rows"]):
+            request_type, name = group["keys"][columns["key"][index]]
+            yield {
+                "timestamp": columns["timestamp"][index],
+                "request_type": request_type,
+                "name": name,
+                "response_time": columns["response_time"][index],
+                "response_length": columns["response_length"][index],
+                "status": columns["status"][index],
+                "lateness": columns["lateness"][index],
+                "worker": group["worker"],
+                "user": columns["user"][index],
+                "error": group["errors"].get(index, ""),
+            }
+
+
+def main() -> None:
+    """
+    Сводка по файлам сэмплов или их выгрузка в CSV:
+
+        python -m tools.samples ./reports/samples.0.bin ./reports/samples.1.bin --csv ./reports/samples.csv
+    """
+    parser = argparse.ArgumentParser(description="Чтение колоночных файлов сырых сэмплов запросов")
+    parser.add_argument("files", nargs="+", type=str, help="Файлы сэмплов (например, по одному на воркер)")
+    parser.add_argument("--csv", type=str, default=None, help="Выгрузить все сэмплы в CSV-файл")
+    args = parser.parse_args()
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer = None
+            for path in args.files:
+                for sample in iter_samples(path):
+                    if writer is None:
+                        writer = csv.DictWriter(file, fieldnames=list(sample))
+                        writer.writeheader()
+                    writer.writerow(sample)
+        return
+
+    requests: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+    for path in args.files:
+        for group in read_row_groups(path):
+            names = [f"{request_type} {name}" for request_type, name in group["keys"]]
+            requests.update(names[key_id] for key_id in group["columns"]["key"])
+            errors.update(names[group["columns"]["key"][index]] for index in group["errors"])
+
+    for name, total in requests.most_common():
+        print(f"{name}: {total} samples, {errors[name]} errors")
+
+
+if __name__ == "__main__":
+    main()
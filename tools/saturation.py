@@ -0,0 +1,327 @@
+import gc
+import json
+import logging
+import time
+import weakref
+from pathlib import Path
+
+import gevent
+import psutil
+from locust import events
+from locust.env import Environment
+from locust.runners import CPU_WARNING_THRESHOLD, MasterRunner, WorkerRunner
+
+from tools.seeding import get_worker_index
+
+# Период пробы цикла событий gevent в секундах: насколько позже запланированного проснулся гринлет-проба
+SATURATION_PROBE_INTERVAL = 0.1
+
+# Сколько проб складывается в один сэмпл телеметрии (сэмпл раз в секунду)
+SATURATION_PROBES_PER_SAMPLE = 10
+
+# Задержка цикла событий (мс), начиная с которой генератор считается перегруженным: гринлеты пользователей
+# ждут своей очереди дольше, чем сервис отвечает на типичный запрос, и это попадает во время ответа
+SATURATION_LOOP_LAG_THRESHOLD = 20.0
+
+# Доля перегруженных сэмплов, при которой результаты воркера помечаются как недостоверные
+SATURATION_UNRELIABLE_SHARE = 0.1
+
+# Ключ телеметрии в отчётах воркеров мастеру
+SATURATION_REPORT_KEY = "saturation_samples"
+
+logger = logging.getLogger(__name__)
+
+
+class SaturationMonitor:
+    """
+    Телеметрия самого генератора нагрузки: помогает понять, упёрлась ли пропускная способность в сервис
+    или в воркер Locust.
+
+    Раз в секунду в сэмпл попадают:
+    - cpu — загрузка CPU процесса воркера, %;
+    - loop_lag — средняя и максимальная задержка цикла событий gevent, мс;
+    - in_flight — пиковое количество запросов "в полёте" по типу клиента (HTTP, gRPC);
+    - pool_wait — время ожидания соединения из пула httpx (от request event hook до первого события
+      транспорта), мс;
+    - gc — суммарная и максимальная пауза сборщика мусора, мс.
+
+    Сэмпл считается перегруженным, если CPU выше порога Locust (CPU_WARNING_THRESHOLD) или задержка цикла
+    событий выше SATURATION_LOOP_LAG_THRESHOLD. Если таких сэмплов больше SATURATION_UNRELIABLE_SHARE,
+    результаты помечаются как недостоверные.
+    """
+
+    def __init__(self):
+        self.in_flight: dict[str, int] = {}
+        self.in_flight_peaks: dict[str, int] = {}
+        self.pool_wait_total = 0.0
+        self.pool_wait_count = 0
+        self.pool_wait_max = 0.0
+        self.gc_pause_total = 0.0
+        self.gc_pause_max = 0.0
+        self.gc_started: float | None = None
+        self.worker_index = 0
+
+        # Сэмплы, ещё не отправленные мастеру (на воркере) или все сэмплы процесса (в локальном запуске)
+        self.samples: list[dict] = []
+        # Сэмплы по номерам воркеров (на мастере и в локальном запуске)
+        self.worker_samples: dict[int, list[dict]] = {}
+
+        self._greenlet: gevent.Greenlet | None = None
+
+    def request_started(self, request_type: str) -> None:
+        """
+        Учитывает начало запроса клиента.
+
+        :param request_type: Тип клиента, например: "HTTP", "gRPC".
+        """
+        in_flight = self.in_flight.get(request_type, 0) + 1
+        self.in_flight[request_type] = in_flight
+        if in_flight > self.in_flight_peaks.get(request_type, 0):
+            self.in_flight_peaks[request_type] = in_flight
+
+    def track_request(self, request: object, request_type: str) -> weakref.finalize:
+        """
+        Учитывает начало запроса, завершение которого может не дойти до метрик (например, ошибка соединения
+        в httpx обрывает запрос до response event hook).
+
+        :param request: Объект запроса: когда он будет удалён, запрос точно завершён.
+        :param request_type: Тип клиента, например: "HTTP".
+        :return: Функция завершения запроса: срабатывает один раз — при явном вызове или при удалении запроса.
+        """
+        self.request_started(request_type)
+        return weakref.finalize(request, self.request_finished, request_type)
+
+    def request_finished(self, request_type: str) -> None:
+        """
+        Учитывает завершение запроса клиента.
+
+        :param request_type: Тип клиента, например: "HTTP", "gRPC".
+        """
+        self.in_flight[request_type] = max(self.in_flight.get(request_type, 0) - 1, 0)
+
+    def record_pool_wait(self, pool_wait: float) -> None:
+        """
+        Учитывает ожидание соединения из пула.
+
+        :param pool_wait: Время ожидания в миллисекундах.
+        """
+        self.pool_wait_total += pool_wait
+        self.pool_wait_count += 1
+        self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+
+    def on_gc(self, phase: str, info: dict) -> None:
+        """
+        Callback для `gc.callbacks`: измеряет паузы сборщика мусора.
+        """
+        if phase == "start":
+            self.gc_started = time.perf_counter()
+        elif self.gc_started is not None:
+            pause = (time.perf_counter() - self.gc_started) * 1000
+            self.gc_pause_total += pause
+            self.gc_pause_max = max(self.gc_pause_max, pause)
+            self.gc_started = None
+
+    def start(self, environment: Environment) -> None:
+        """
+        Запускает сбор телеметрии, если он ещё не запущен.
+
+        :param environment: Объект окружения Locust.
+        """
+        if self._greenlet is not None:
+            return
+
+        self.worker_index = get_worker_index(environment)
+        gc.callbacks.append(self.on_gc)
+        self._greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        """
+        Останавливает сбор телеметрии.
+        """
+        if self._greenlet is None:
+            return
+
+        self._greenlet.kill(block=False)
+        self._greenlet = None
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+
+    def reset(self) -> None:
+        """
+        Удаляет накопленные сэмплы (перед новым тестом).
+        """
+        self.samples.clear()
+        self.worker_samples.clear()
+
+    def run(self) -> None:
+        """
+        Пробует цикл событий и раз в секунду записывает сэмпл (тело фонового гринлета).
+        """
+        process = psutil.Process()
+        process.cpu_percent()
+
+        while True:
+            lags = []
+            for _ in range(SATURATION_PROBES_PER_SAMPLE):
+                started = time.perf_counter()
+                gevent.sleep(SATURATION_PROBE_INTERVAL)
+                lags.append(max(time.perf_counter() - started - SATURATION_PROBE_INTERVAL, 0.0) * 1000)
+
+            self.samples.append(self.take_sample(process.cpu_percent(), lags))
+
+    def take_sample(self, cpu: float, lags: list[float]) -> dict:
+        """
+        Формирует сэмпл телеметрии и начинает накопление счётчиков заново.
+
+        :param cpu: Загрузка CPU процесса за период сэмпла, %.
+        :param lags: Задержки цикла событий по пробам, мс.
+        """
+        sample = {
+            "timestamp": time.time(),
+            "cpu": cpu,
+            "loop_lag_mean": sum(lags) / len(lags),
+            "loop_lag_max": max(lags),
+            "in_flight": dict(self.in_flight_peaks),
+            "pool_wait_mean": self.pool_wait_total / self.pool_wait_count if self.pool_wait_count else 0.0,
+            "pool_wait_max": self.pool_wait_max,
+            "gc_pause_total": self.gc_pause_total,
+            "gc_pause_max": self.gc_pause_max,
+        }
+        sample["saturated"] = cpu >= CPU_WARNING_THRESHOLD or sample["loop_lag_mean"] >= SATURATION_LOOP_LAG_THRESHOLD
+
+        # Пики начинаются заново с текущего количества запросов в полёте
+        self.in_flight_peaks = dict(self.in_flight)
+        self.pool_wait_total = 0.0
+        self.pool_wait_count = 0
+        self.pool_wait_max = 0.0
+        self.gc_pause_total = 0.0
+        self.gc_pause_max = 0.0
+
+        return sample
+
+    def collect(self) -> list[dict]:
+        """
+        Возвращает сэмплы, накопленные с прошлого отчёта мастеру, и начинает накопление заново.
+        """
+        samples, self.samples = self.samples, []
+        return samples
+
+    def merge(self, worker_index: int, samples: list[dict]) -> None:
+        """
+        Прибавляет сэмплы, присланные воркером (см. `collect`).
+
+        :param worker_index: Номер воркера.
+        :param samples: Сэмплы телеметрии воркера.
+        """
+        self.worker_samples.setdefault(worker_index, []).extend(samples)
+
+    def get_summary(self) -> dict:
+        """
+        Возвращает итоговый отчёт: сводку по каждому воркеру и общий признак недостоверности результатов.
+        """
+        workers = {}
+        for worker_index, samples in sorted(self.worker_samples.items()):
+            if not samples:
+                continue
+
+            saturated = sum(sample["saturated"] for sample in samples)
+            in_flight: dict[str, int] = {}
+            for sample in samples:
+                for request_type, peak in sample["in_flight"].items():
+                    in_flight[request_type] = max(in_flight.get(request_type, 0), peak)
+
+            summary = {
+                "samples": len(samples),
+                "saturated_share": saturated / len(samples),
+                "cpu_mean": sum(sample["cpu"] for sample in samples) / len(samples),
+                "cpu_max": max(sample["cpu"] for sample in samples),
+                "loop_lag_mean": sum(sample["loop_lag_mean"] for sample in samples) / len(samples),
+                "loop_lag_max": max(sample["loop_lag_max"] for sample in samples),
+                "in_flight_max": in_flight,
+                "pool_wait_max": max(sample["pool_wait_max"] for sample in samples),
+                "gc_pause_total": sum(sample["gc_pause_total"] for sample in samples),
+                "gc_pause_max": max(sample["gc_pause_max"] for sample in samples),
+            }
+            summary["unreliable"] = summary["saturated_share"] > SATURATION_UNRELIABLE_SHARE
+            workers[str(worker_index)] = summary
+
+        return {
+            "unit": "ms",
+            "cpu_threshold": CPU_WARNING_THRESHOLD,
+            "loop_lag_threshold": SATURATION_LOOP_LAG_THRESHOLD,
+            "unreliable_share": SATURATION_UNRELIABLE_SHARE,
+            "unreliable": any(summary["unreliable"] for summary in workers.values()),
+            "workers": workers,
+            "samples": {str(worker_index): samples for worker_index, samples in sorted(self.worker_samples.items())},
+        }
+
+
+# Телеметрия процесса Locust, общая для HTTP и gRPC клиентов
+saturation_monitor = SaturationMonitor()
+
+
+def get_saturation_file(environment: Environment) -> Path | None:
+    """
+    Возвращает путь к файлу телеметрии рядом с HTML-отчётом сценария: report.html -> report.saturation.json.
+
+    :param environment: Объект окружения Locust.
+    :return: Путь к файлу или None, если HTML-отчёт не пишется.
+    """
+    html_file = getattr(environment.parsed_options, "html_file", None)
+    if not html_file:
+        return None
+
+    return Path(html_file).with_suffix(".saturation.json")
+
+
+@events.test_start.add_listener
+def reset_saturation_monitor(environment: Environment, **kwargs) -> None:
+    saturation_monitor.reset()
+
+
+@events.test_stop.add_listener
+def stop_saturation_monitor(environment: Environment, **kwargs) -> None:
+    """
+    Останавливает сбор телеметрии; в локальном запуске переносит сэмплы процесса в итоговый отчёт.
+    """
+    saturation_monitor.stop()
+    if not isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        saturation_monitor.merge(saturation_monitor.worker_index, saturation_monitor.collect())
+
+
+@events.report_to_master.add_listener
+def report_saturation_samples(client_id: str, data: dict) -> None:
+    data[SATURATION_REPORT_KEY] = {"worker": saturation_monitor.worker_index, "samples": saturation_monitor.collect()}
+
+
+@events.worker_report.add_listener
+def merge_saturation_samples(client_id: str, data: dict) -> None:
+    report = data.get(SATURATION_REPORT_KEY)
+    if report and report["samples"]:
+        saturation_monitor.merge(report["worker"], report["samples"])
+
+
+@events.quitting.add_listener
+def save_saturation_report(environment: Environment, **kwargs) -> None:
+    """
+    Сохраняет телеметрию генератора рядом с HTML-отчётом (на мастере или в локальном запуске)
+    и предупреждает в логе, если результаты недостоверны.
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    summary = saturation_monitor.get_summary()
+    if summary["unreliable"]:
+        workers = ", ".join(worker for worker, worker_summary in summary["workers"].items()
+                            if worker_summary["unreliable"])
+        logger.warning(
+            f"Load generator was saturated (workers: {workers}): CPU or gevent loop lag exceeded thresholds "
+            f"in more than {SATURATION_UNRELIABLE_SHARE:.0%} of samples, results are unreliable"
+        )
+
+    saturation_file = get_saturation_file(environment)
+    if saturation_file is None:
+        return
+
+    saturation_file.parent.mkdir(parents=True, exist_ok=True)
+    saturation_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False))
@@ -0,0 +1,126 @@
+import hashlib
+import random
+from itertools import count
+from weakref import WeakKeyDictionary
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner
+
+from tools.fakers import fake
+
+# Счётчики виртуальных пользователей воркера: порядковый номер пользователя входит в его seed
+_user_counters: WeakKeyDictionary[Environment, count] = WeakKeyDictionary()
+
+
+def derive_seed(base: int, *parts: int | str) -> int:
+    """
+    Выводит независимый детерминированный seed из общего seed и уточняющих частей.
+
+    В отличие от `hash()`, результат не зависит от PYTHONHASHSEED и одинаков во всех процессах.
+
+    :param base: Общий seed запуска.
+    :param parts: Уточнения, например: номер воркера, номер виртуального пользователя.
+    :return: 64-битный seed.
+    """
+    digest = hashlib.blake2b(":".join(map(str, (base, *parts))).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def get_run_seed(environment: Environment) -> int | None:
+    """
+    Возвращает seed запуска, заданный опцией `--seed` (или переменной окружения LOCUST_SEED).
+
+    :param environment: Объект окружения Locust.
+    :return: Seed или None, если запуск не сидирован.
+    """
+    return getattr(environment.parsed_options, "seed", None)
+
+
+def get_worker_index(environment: Environment) -> int:
+    """
+    Возвращает номер воркера (0 для локального запуска и до подключения воркера к мастеру).
+
+    :param environment: Объект окружения Locust.
+    """
+    return max(getattr(environment.runner, "worker_index", 0), 0)
+
+
+def build_user_random(environment: Environment) -> random.Random:
+    """
+    Создаёт генератор случайных чисел для очередного виртуального пользователя.
+
+    При сидированном запуске генератор детерминирован: seed выводится из seed запуска, номера воркера
+    и порядкового номера пользователя на воркере. Без `--seed` генератор инициализируется случайно.
+
+    :param environment: Объект окружения Locust.
+    :return: Собственный генератор виртуального пользователя.
+    """
+    seed = get_run_seed(environment)
+    if seed is None:
+        return random.Random()
+
+    counter = _user_counters.setdefault(environment, count())
+    return random.Random(derive_seed(seed, get_worker_index(environment), next(counter)))
+
+
+def seed_user(environment: Environment) -> random.Random:
+    """
+    Сидирует очередного виртуального пользователя: создаёт его генератор выбора задач и привязывает
+    к гринлету пользователя отдельный генератор фейковых данных, выведенный из первого
+    (так добавление поля с фейковыми данными в запрос не меняет последовательность задач).
+
+    Вызывается первым делом в on_start: пользователи стартуют в порядке запуска, поэтому порядковый номер
+    пользователя, входящий в seed, не зависит от планирования гринлетов.
+
+    :param environment: Объект окружения Locust.
+    :return: Генератор выбора задач виртуального пользователя.
+    """
+    task_random = build_user_random(environment)
+    fake.bind_user_random(random.Random(task_random.getrandbits(64)))
+    return task_random
+
+
+@events.init_command_line_parser.add_listener
+def add_seed_argument(parser) -> None:
+    """
+    Добавляет опции `--seed` и `--fake-pool` в командную строку (и conf-файлы) Locust.
+    """
+    parser.add_argument(
+        "--seed",
+        type=int,
+        env_var="LOCUST_SEED",
+        default=None,
+        help="Seed для воспроизводимой генерации данных и выбора задач (на каждом воркере выводится свой)"
+    )
+    parser.add_argument(
+        "--fake-pool",
+        action="store_true",
+        env_var="LOCUST_FAKE_POOL",
+        default=False,
+        help="Брать фейковые данные из заранее сгенерированного пула (значения повторяются) вместо Faker на запрос"
+    )
+
+
+@events.test_start.add_listener
+def seed_worker(environment: Environment, **kwargs) -> None:
+    """
+    Готовит генерацию фейковых данных воркера перед стартом теста: сидирует её и включает пул `--fake-pool`.
+
+    Seed воркера выводится из seed запуска и номера воркера, поэтому воркеры генерируют разные,
+    но воспроизводимые от запуска к запуску данные. Глобальный `random` не сидируется: им пользуется
+    сам Locust, а у сценариев есть собственные генераторы пользователей (см. seed_user).
+    """
+    if isinstance(environment.runner, MasterRunner):
+        return
+
+    fake.disable_pool()
+
+    seed = get_run_seed(environment)
+    if seed is not None:
+        fake.seed(derive_seed(seed, get_worker_index(environment)))
+        _user_counters[environment] = count()
+
+    if getattr(environment.parsed_options, "fake_pool", False):
+        # Пул заполняется до старта пользователей, не блокируя цикл событий воркера
+        fake.enable_pool(background=True)